@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class FilesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "archivos"
+
+    def ready(self):
+        # Encola las miniaturas al guardar fotos de personas y usuarios
+        from archivos import signals  # noqa: F401
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from archivos.miniaturas import ejecutor, generar_miniaturas
+from personas.models import Persona
+from usuarios.models import Usuario
+
+
+class Command(BaseCommand):
+    help = "Genera las miniaturas que falten de las fotos de personas y usuarios (idempotente)."
+
+    def handle(self, *args, **options):
+        rutas = set(Persona.objects.exclude(per_foto__isnull=True).exclude(per_foto='').values_list('per_foto', flat=True))
+        rutas.update(Usuario.objects.exclude(usu_ruta_foto='').values_list('usu_ruta_foto', flat=True))
+        generadas = errores = 0
+        for ruta, futuro in [(ruta, ejecutor().submit(generar_miniaturas, ruta)) for ruta in sorted(rutas)]:
+            try:
+                if futuro.result():
+                    generadas += 1
+            except Exception as error:
+                errores += 1
+                self.stderr.write(f"{ruta}: {error}")
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(rutas)} fotos: {generadas} con miniaturas, {errores} con error, "
+            f"{len(rutas) - generadas - errores} sin archivo"
+        ))
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-18 03:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("archivos", "0001_initial"),
+        ("maestros", "0004_grupojerarquia"),
+        ("usuarios", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="archivo",
+            index=models.Index(
+                condition=models.Q(("arc_vigente", True)),
+                fields=["tar_id"],
+                name="archivo_vigente_idx",
+            ),
+        ),
+    ]
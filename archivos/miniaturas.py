@@ -0,0 +1,165 @@
+"""
+Miniaturas de las fotos de personas (per_foto) y usuarios (usu_ruta_foto).
+
+Al guardar una foto se encola, tras el commit, la generación de derivados de
+tamaño fijo en un pool de hilos. Cada derivado se escribe junto al original,
+con el nombre completo del original y la huella del contenido
+(foto.png.3f2a9c1b04de.64.jpg): su URL no cambia mientras no cambie la foto
+y se puede servir con caché de un año. Las rutas son relativas a MEDIA_ROOT (o absolutas dentro de él).
+"""
+import glob
+import hashlib
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+from django.urls import reverse
+
+logger = logging.getLogger(__name__)
+
+# Lados (px) de las miniaturas cuadradas: 64 para nóminas, 256 para credenciales
+TAMANOS_MINIATURA = (64, 256)
+
+CALIDAD_JPEG = 85
+LARGO_HUELLA = 12
+
+_ejecutor = None
+_candado = threading.Lock()
+
+
+def raiz_media():
+    return Path(settings.MEDIA_ROOT).resolve()
+
+
+def ruta_absoluta(ruta):
+    """Ruta de la foto en disco; None si queda fuera de MEDIA_ROOT."""
+    raiz = raiz_media()
+    absoluta = (raiz / ruta).resolve()
+    return absoluta if absoluta.is_relative_to(raiz) else None
+
+
+def huella_archivo(absoluta):
+    sha = hashlib.sha256()
+    with open(absoluta, 'rb') as archivo:
+        for bloque in iter(lambda: archivo.read(1 << 16), b''):
+            sha.update(bloque)
+    return sha.hexdigest()[:LARGO_HUELLA]
+
+
+def nombre_miniatura(nombre_original, huella, tamano):
+    """'foto.png', 'ab12..', 64 -> 'foto.png.ab12...64.jpg'"""
+    # Con la extensión: foto.png y foto.jpg no comparten derivados
+    return f"{nombre_original}.{huella}.{tamano}.jpg"
+
+
+def es_miniatura(nombre):
+    # <original>.<huella>.<tamaño>.jpg
+    partes = nombre.rsplit('.', 3)
+    return (
+        len(partes) == 4 and partes[3] == 'jpg' and partes[2].isdigit()
+        and len(partes[1]) == LARGO_HUELLA and all(c in '0123456789abcdef' for c in partes[1])
+    )
+
+
+def _derivados(absoluta, tamano):
+    patron = f"{glob.escape(absoluta.name)}.*.{tamano}.jpg"
+    # El patrón también calza con derivados de otra foto cuyo nombre empieza igual (foto.png.x.png)
+    return [
+        ruta for ruta in absoluta.parent.glob(patron)
+        if es_miniatura(ruta.name) and ruta.name.rsplit('.', 3)[0] == absoluta.name
+    ]
+
+
+def generar_miniaturas(ruta, tamanos=TAMANOS_MINIATURA):
+    """
+    Genera (si faltan) las miniaturas de una foto y elimina las de versiones
+    anteriores. Devuelve {tamaño: ruta relativa a MEDIA_ROOT}.
+    """
+    try:
+        from PIL import Image, ImageOps
+    except ImportError as exc:
+        raise ImportError("Generar miniaturas requiere el paquete Pillow") from exc
+
+    absoluta = ruta_absoluta(ruta)
+    if absoluta is None or not absoluta.is_file():
+        return {}
+    huella = huella_archivo(absoluta)
+    raiz = raiz_media()
+    generadas = {}
+    imagen = None
+    try:
+        for tamano in tamanos:
+            destino = absoluta.with_name(nombre_miniatura(absoluta.name, huella, tamano))
+            if not destino.exists():
+                if imagen is None:
+                    imagen = Image.open(absoluta)
+                    imagen = ImageOps.exif_transpose(imagen).convert('RGB')
+                miniatura = ImageOps.fit(imagen, (tamano, tamano), Image.LANCZOS)
+                # Se escribe aparte y se renombra: nunca se sirve un archivo a medio escribir
+                temporal = destino.with_name(f".{destino.name}.tmp")
+                miniatura.save(temporal, 'JPEG', quality=CALIDAD_JPEG, optimize=True)
+                os.replace(temporal, destino)
+            for anterior in _derivados(absoluta, tamano):
+                if anterior != destino:
+                    anterior.unlink(missing_ok=True)
+            generadas[tamano] = destino.relative_to(raiz).as_posix()
+    finally:
+        if imagen is not None:
+            imagen.close()
+    return generadas
+
+
+def _trabajo(ruta):
+    try:
+        generar_miniaturas(ruta)
+    except Exception:
+        logger.exception("No se pudieron generar las miniaturas de %s", ruta)
+
+
+def ejecutor():
+    global _ejecutor
+    with _candado:
+        if _ejecutor is None:
+            trabajadores = getattr(settings, 'MINIATURAS_TRABAJADORES', 2)
+            _ejecutor = ThreadPoolExecutor(max_workers=trabajadores, thread_name_prefix='miniaturas')
+    return _ejecutor
+
+
+def encolar_miniaturas(ruta):
+    """Genera las miniaturas en segundo plano una vez confirmada la transacción."""
+    if ruta:
+        transaction.on_commit(lambda: ejecutor().submit(_trabajo, ruta))
+
+
+def miniatura(ruta, tamano):
+    """Ruta relativa de la miniatura vigente de una foto, o None si aún no existe."""
+    absoluta = ruta_absoluta(ruta) if ruta else None
+    if absoluta is None:
+        return None
+    derivados = _derivados(absoluta, tamano)
+    if not derivados:
+        return None
+    # Si conviven dos versiones (generación en curso) se entrega la más reciente
+    try:
+        reciente = max(derivados, key=lambda d: d.stat().st_mtime)
+    except FileNotFoundError:
+        return None
+    return reciente.relative_to(raiz_media()).as_posix()
+
+
+def url_miniatura(ruta, tamano=TAMANOS_MINIATURA[0]):
+    """
+    URL inmutable de la miniatura de una foto. Mientras la miniatura no exista
+    se entrega la del original (sin caché de larga duración).
+    """
+    absoluta = ruta_absoluta(ruta) if ruta else None
+    if absoluta is None:
+        return None
+    relativa = miniatura(ruta, tamano)
+    if relativa is None:
+        return settings.MEDIA_URL + absoluta.relative_to(raiz_media()).as_posix()
+    return reverse('archivos:miniatura', args=[relativa])
@@ -1,4 +1,5 @@
 from django.db import models
+from maestros.managers import VigenteManager
 from usuarios.models import Usuario
 from cursos.models import CursoSeccion
 from maestros.models import TipoArchivo
@@ -23,10 +24,17 @@ class Archivo(models.Model):
     # arc_vigente: Indica si el archivo está activo (True) o inactivo (False)
     arc_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'archivo'
         verbose_name = 'Archivo'
         verbose_name_plural = 'Archivos'
+        indexes = [
+            # Índice parcial: archivos vigentes por tipo
+            models.Index(fields=['tar_id'], name='archivo_vigente_idx', condition=models.Q(arc_vigente=True)),
+        ]
 
     def __str__(self):
         return f"{self.arc_descripcion} ({self.tar_id})"
@@ -0,0 +1,25 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from archivos.miniaturas import encolar_miniaturas
+from personas.models import Persona
+from usuarios.models import Usuario
+
+
+def _foto_guardada(instancia, campo, update_fields):
+    # Sin la foto cargada (diferida) o fuera de update_fields, la foto no cambió
+    if update_fields is not None and campo not in update_fields:
+        return None
+    if campo in instancia.get_deferred_fields():
+        return None
+    return getattr(instancia, campo)
+
+
+@receiver(post_save, sender=Persona)
+def miniaturas_persona(sender, instance, update_fields=None, **kwargs):
+    encolar_miniaturas(_foto_guardada(instance, 'per_foto', update_fields))
+
+
+@receiver(post_save, sender=Usuario)
+def miniaturas_usuario(sender, instance, update_fields=None, **kwargs):
+    encolar_miniaturas(_foto_guardada(instance, 'usu_ruta_foto', update_fields))
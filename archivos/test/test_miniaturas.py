@@ -0,0 +1,26 @@
+import archivos.miniaturas as miniaturas
+from archivos.miniaturas import es_miniatura, miniatura, nombre_miniatura
+
+
+def test_nombre_miniatura_lleva_huella_y_tamano():
+    assert nombre_miniatura("juan.perez.png", "3f2a9c1b04de", 64) == "juan.perez.png.3f2a9c1b04de.64.jpg"
+
+
+def test_es_miniatura_solo_reconoce_derivados():
+    assert es_miniatura("foto.png.3f2a9c1b04de.256.jpg")
+    assert not es_miniatura("foto.jpg")
+    assert not es_miniatura("foto.original.64.jpg")
+    assert not es_miniatura("foto.3f2a9c1b04de.64.png")
+
+
+def test_miniatura_no_toma_derivados_de_otra_foto(tmp_path, monkeypatch):
+    monkeypatch.setattr(miniaturas, 'raiz_media', lambda: tmp_path)
+    fotos = tmp_path / 'fotos'
+    fotos.mkdir()
+    for nombre in ('juan.png', 'juan.jpg', 'juan.perez.png'):
+        (fotos / nombre).write_bytes(b'')
+    (fotos / nombre_miniatura('juan.perez.png', 'a' * 12, 64)).write_bytes(b'')
+    (fotos / nombre_miniatura('juan.jpg', 'b' * 12, 64)).write_bytes(b'')
+    assert miniatura('fotos/juan.png', 64) is None
+    assert miniatura('fotos/juan.jpg', 64) == f"fotos/juan.jpg.{'b' * 12}.64.jpg"
+    assert miniatura('fotos/juan.perez.png', 64) == f"fotos/juan.perez.png.{'a' * 12}.64.jpg"
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from archivos import views
+
+app_name = 'archivos'
+
+urlpatterns = [
+    path('miniaturas/<path:ruta>', views.miniatura, name='miniatura'),
+]
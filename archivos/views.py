@@ -1,3 +1,18 @@
-from django.shortcuts import render
+from django.http import FileResponse, Http404
+from django.views.decorators.http import require_safe
 
-# Create your views here.
+from archivos.miniaturas import es_miniatura, ruta_absoluta
+
+# Las miniaturas llevan la huella del contenido en el nombre: nunca cambian
+CACHE_MINIATURA = 'public, max-age=31536000, immutable'
+
+
+@require_safe
+def miniatura(request, ruta):
+    """Entrega una miniatura generada; las fotos originales no se sirven por aquí."""
+    absoluta = ruta_absoluta(ruta)
+    if absoluta is None or not es_miniatura(absoluta.name) or not absoluta.is_file():
+        raise Http404("Miniatura no encontrada")
+    respuesta = FileResponse(open(absoluta, 'rb'), content_type='image/jpeg')
+    respuesta['Cache-Control'] = CACHE_MINIATURA
+    return respuesta
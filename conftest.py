@@ -0,0 +1,37 @@
+"""
+Configuración de pytest: inicia Django y crea la BD de pruebas (con todas
+las migraciones) para los tests basados en django.test.TestCase. La BD de
+pruebas es un archivo temporal y no en memoria: en memoria las conexiones de
+los tests con hilos comparten caché y fallan con "table is locked" en lugar
+de esperar el bloqueo. La BD del proyecto (db.sqlite3) no se toca.
+"""
+import os
+import tempfile
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "scout_project.settings")
+django.setup()
+
+_entorno = {}
+
+
+def pytest_sessionstart(session):
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    _entorno['nombre'] = connection.settings_dict['NAME']
+    _entorno['directorio'] = tempfile.TemporaryDirectory()
+    connection.settings_dict['TEST']['NAME'] = os.path.join(_entorno['directorio'].name, 'test.sqlite3')
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    from django.db import connection
+    from django.test.utils import teardown_test_environment
+
+    if 'nombre' in _entorno:
+        connection.creation.destroy_test_db(_entorno['nombre'], verbosity=0)
+        _entorno['directorio'].cleanup()
+        teardown_test_environment()
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CoursesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "cursos"
+
+    def ready(self):
+        # Alimenta el historial de formadores desde CursoFormador y las acreditaciones
+        from cursos import signals  # noqa: F401
@@ -0,0 +1,54 @@
+"""
+Códigos de curso (curso.cur_codigo) correlativos por año: 2026-0001, 2026-0002...
+
+El número sale del contador 'curso:<año>' de maestros.secuencias, reservado
+en una transacción corta: dos cursos guardados a la vez nunca reciben el
+mismo código y no se busca el máximo en la tabla. Si el guardado del curso
+falla después de reservar, el número se pierde (los códigos de curso pueden
+tener saltos). El índice único de cur_codigo respalda la asignación.
+"""
+import re
+
+from django.utils import timezone
+
+from maestros.secuencias import ajustar_minimo, ambito, reservar
+
+_CODIGO = re.compile(r'^(\d{4})-(\d{4,5})$')
+
+# Último número que cabe en cur_codigo (max_length 10: 2026-99999)
+MAXIMO_NUMERO = 99999
+
+
+def ambito_curso(anio):
+    return ambito('curso', anio)
+
+
+def formatear_codigo(anio, numero):
+    return f'{anio}-{numero:04d}'
+
+
+def anio_curso(curso):
+    fecha = curso.cur_fecha_solicitud or timezone.now()
+    return timezone.localtime(fecha).year if timezone.is_aware(fecha) else fecha.year
+
+
+def asignar_codigos(cursos):
+    """
+    Asigna código a los cursos que no lo tienen (ej. antes de bulk_create),
+    reservando un bloque por año. Los que ya traen un código con el formato
+    adelantan el contador de su año para que no se vuelva a entregar.
+    """
+    sin_codigo = {}
+    for curso in cursos:
+        if curso.cur_codigo:
+            coincidencia = _CODIGO.match(curso.cur_codigo)
+            if coincidencia:
+                ajustar_minimo(ambito_curso(int(coincidencia[1])), int(coincidencia[2]))
+        else:
+            sin_codigo.setdefault(anio_curso(curso), []).append(curso)
+    for anio, grupo in sorted(sin_codigo.items()):
+        numeros = reservar(ambito_curso(anio), len(grupo))
+        if numeros[-1] > MAXIMO_NUMERO:
+            raise ValueError(f"Se agotaron los códigos de curso de {anio} (máximo {MAXIMO_NUMERO})")
+        for curso, numero in zip(grupo, numeros):
+            curso.cur_codigo = formatear_codigo(anio, numero)
@@ -0,0 +1,83 @@
+"""
+Cuota que corresponde pagar por una inscripción.
+
+El programa de tramos de cada curso (cursos.tramos) se arma una vez por
+proceso y se reutiliza mientras no cambien las versiones de curso_cuota y
+curso en catalogo_version, que los signals incrementan. Valorizar un lote de
+inscripciones cuesta a lo más cuatro consultas (inscripciones, fechas de
+inscripción y, para los cursos sin programa guardado, cuotas y cuotas base)
+más una búsqueda binaria por inscripción.
+"""
+import threading
+
+from django.db.models import Min
+from django.utils import timezone
+
+from cursos.models import Curso, CursoCuota, PersonaCurso, PersonaEstadoCurso
+from cursos.tramos import CON_ALMUERZO, SIN_ALMUERZO, armar_programa, valor_en
+from maestros.catalogo import version_catalogo
+
+# Tablas cuya versión invalida los programas guardados
+MODELOS_CUOTAS = (CursoCuota, Curso)
+
+_lock = threading.RLock()
+_programas = {}
+_versiones = None
+
+
+def programas(cur_ids):
+    """{cur_id: Programa} de los cursos pedidos, leyendo de la BD solo los que no están guardados."""
+    global _versiones
+    cur_ids = set(cur_ids)
+    versiones_actuales = tuple(version_catalogo(m) for m in MODELOS_CUOTAS)
+    with _lock:
+        if _versiones != versiones_actuales:
+            _programas.clear()
+            _versiones = versiones_actuales
+        faltantes = cur_ids - _programas.keys()
+        if faltantes:
+            cuotas = {}
+            for cur_id, tipo, fecha, valor in (
+                CursoCuota.objects.filter(cur_id__in=faltantes).order_by('cuu_id')
+                .values_list('cur_id', 'cuu_tipo', 'cuu_fecha', 'cuu_valor')
+            ):
+                cuotas.setdefault(cur_id, []).append((tipo, fecha, valor))
+            for cur_id, con_almuerzo, sin_almuerzo in (
+                Curso.objects.filter(pk__in=faltantes)
+                .values_list('cur_id', 'cur_cuota_con_almuerzo', 'cur_cuota_sin_almuerzo')
+            ):
+                base = {CON_ALMUERZO: con_almuerzo, SIN_ALMUERZO: sin_almuerzo}
+                _programas[cur_id] = armar_programa(cuotas.get(cur_id, ()), base)
+        return {cur_id: _programas[cur_id] for cur_id in cur_ids if cur_id in _programas}
+
+
+def cuota(cur_id, tipo, instante=None):
+    """Valor para el curso y tipo de cuota (ali_tipo) en el instante (ahora por defecto)."""
+    programa = programas([cur_id]).get(cur_id)
+    if programa is None:
+        return None
+    return valor_en(programa, tipo, instante or timezone.now())
+
+
+def cuotas_inscripciones(pec_ids, instante=None):
+    """
+    {pec_id: valor} de las inscripciones (ids o subconsulta). Sin instante,
+    cada una se valoriza a la fecha de su primer estado (cuando se inscribió).
+    """
+    filas = list(PersonaCurso.objects.filter(pk__in=pec_ids).values_list('pec_id', 'cus_id__cur_id', 'ali_id__ali_tipo'))
+    if instante is None:
+        fechas = dict(
+            PersonaEstadoCurso.objects.filter(pec_id__in=[f[0] for f in filas])
+            .order_by().values('pec_id').annotate(inicio=Min('peu_fecha_hora')).values_list('pec_id', 'inicio')
+        )
+        ahora = timezone.now()
+    por_curso = programas({f[1] for f in filas})
+    valores = {}
+    for pec_id, cur_id, tipo in filas:
+        momento = instante if instante is not None else fechas.get(pec_id) or ahora
+        valores[pec_id] = valor_en(por_curso[cur_id], tipo, momento)
+    return valores
+
+
+def cuota_inscripcion(inscripcion, instante=None):
+    return cuotas_inscripciones([inscripcion.pk], instante).get(inscripcion.pk)
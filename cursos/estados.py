@@ -0,0 +1,29 @@
+"""
+Estados de una inscripción (persona_estado_curso.peu_estado).
+"""
+PREINSCRIPCION = 1
+AVISADO = 2
+LISTA_ESPERA = 3
+INSCRITO = 4
+VIGENTE = 5
+ANULADO = 6
+SOBRECUPO = 10
+
+# Código -> clave usada en reportes y respuestas JSON
+NOMBRES_ESTADO = {
+    PREINSCRIPCION: 'preinscripcion',
+    AVISADO: 'avisado',
+    LISTA_ESPERA: 'lista_espera',
+    INSCRITO: 'inscrito',
+    VIGENTE: 'vigente',
+    ANULADO: 'anulado',
+    SOBRECUPO: 'sobrecupo',
+}
+
+# Estados que ocupan un cupo de la sección (lista de espera y anulado no)
+ESTADOS_CON_CUPO = frozenset({PREINSCRIPCION, AVISADO, INSCRITO, VIGENTE, SOBRECUPO})
+
+# curso.cur_estado de los cursos en curso
+CURSO_VIGENTE = 1
+# curso.cur_estado de los cursos anulados
+CURSO_ANULADO = 2
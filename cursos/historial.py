@@ -0,0 +1,105 @@
+"""
+Historial estructurado de formadores (tabla historial_formador).
+
+Reemplaza el texto libre persona_formador.pef_historial: cada participación
+como formador (CursoFormador) y cada acreditación (PersonaCurso.pec_acreditado)
+agrega una fila con persona, curso, rol, rama y fecha. Es de solo inserción:
+dar de baja al formador o la acreditación no borra la historia. hif_fecha
+sigue a las fechas del curso: los signals de CursoFecha la recalculan. Las
+consultas recorren los índices (per_id, hif_fecha) y (ram_id, hif_fecha, per_id).
+"""
+import datetime
+import re
+
+from django.db.models import Count, Min
+from django.utils import timezone
+
+from cursos.models import CursoFecha, CursoSeccion, HistorialFormador
+
+ORIGEN_FORMADOR = 1
+ORIGEN_ACREDITACION = 2
+ORIGEN_HISTORIAL = 3
+
+# Fechas en el texto libre: 15/05/2019, 15-05-2019, 15.05.2019 o 2019-05-15
+_FECHA = re.compile(r'\b(?:(\d{1,2})[/.-](\d{1,2})[/.-](\d{4})|(\d{4})-(\d{1,2})-(\d{1,2}))\b')
+_TOKEN = re.compile(r'[\w-]+')
+
+
+def fecha_en_texto(texto):
+    """Primera fecha válida del texto como datetime aware, o None."""
+    for coincidencia in _FECHA.finditer(texto):
+        dia, mes, anio, anio_iso, mes_iso, dia_iso = coincidencia.groups()
+        try:
+            if anio:
+                fecha = datetime.date(int(anio), int(mes), int(dia))
+            else:
+                fecha = datetime.date(int(anio_iso), int(mes_iso), int(dia_iso))
+        except ValueError:
+            continue
+        return timezone.make_aware(datetime.datetime.combine(fecha, datetime.time()))
+    return None
+
+
+def parsear_historial(texto, cursos_por_codigo):
+    """
+    Separa un pef_historial en entradas (una por línea no vacía). Cada entrada
+    es (cur_id o None, fecha o None, línea); el curso se reconoce si alguna
+    palabra de la línea es un cur_codigo de cursos_por_codigo (en mayúsculas).
+    """
+    entradas = []
+    for linea in (texto or '').splitlines():
+        linea = ' '.join(linea.split())
+        if not linea:
+            continue
+        cur_id = next(
+            (cursos_por_codigo[t] for t in _TOKEN.findall(linea.upper()) if t in cursos_por_codigo),
+            None,
+        )
+        entradas.append((cur_id, fecha_en_texto(linea), linea[:255]))
+    return entradas
+
+
+def fecha_curso(cur_id):
+    """Inicio de la primera fecha del curso; None si el curso no tiene fechas."""
+    return CursoFecha.objects.filter(cur_id=cur_id).aggregate(inicio=Min('cuf_fecha_inicio'))['inicio']
+
+
+def registrar(per_id, cus_id, rol_id, origen):
+    """Agrega al historial la participación de per_id en la sección cus_id (idempotente)."""
+    cur_id, ram_id = CursoSeccion.objects.filter(pk=cus_id).values_list('cur_id', 'ram_id').get()
+    HistorialFormador.objects.bulk_create([
+        HistorialFormador(
+            per_id_id=per_id, cur_id_id=cur_id, rol_id_id=rol_id, ram_id_id=ram_id,
+            hif_fecha=fecha_curso(cur_id), hif_origen=origen,
+        )
+    ], ignore_conflicts=True)
+
+
+def actualizar_fecha_curso(cur_id):
+    """Recalcula hif_fecha de las entradas del curso cuando se agregan, cambian o borran sus fechas."""
+    fecha = fecha_curso(cur_id)
+    entradas = HistorialFormador.objects.filter(cur_id=cur_id)
+    entradas.exclude(hif_origen=ORIGEN_HISTORIAL).update(hif_fecha=fecha)
+    # Las migradas conservan la fecha anotada en el texto; solo se completan las que no tenían
+    if fecha is not None:
+        entradas.filter(hif_origen=ORIGEN_HISTORIAL, hif_fecha__isnull=True).update(hif_fecha=fecha)
+
+
+def historial_de(per_id):
+    """Historial de una persona, del más antiguo al más reciente."""
+    return HistorialFormador.objects.filter(per_id=per_id).order_by('hif_fecha', 'hif_id')
+
+
+def formadores_con_cursos(ram_id, desde, minimo=1, origen=ORIGEN_FORMADOR):
+    """
+    {per_id: cantidad de cursos distintos} de quienes participaron en al
+    menos `minimo` cursos de la rama desde la fecha indicada.
+    """
+    return dict(
+        HistorialFormador.objects
+        .filter(ram_id=ram_id, hif_fecha__gte=desde, hif_origen=origen, cur_id__isnull=False)
+        .order_by()
+        .values_list('per_id')
+        .annotate(cursos=Count('cur_id', distinct=True))
+        .filter(cursos__gte=minimo)
+    )
@@ -0,0 +1,178 @@
+"""
+Inscripciones: estado actual, cupos y lista de espera.
+
+persona_estado_curso es el historial (solo se agregan filas); persona_curso
+guarda además una proyección del estado actual (pec_estado, pec_estado_fecha,
+usu_id_estado) igual al último registro vigente del historial, para filtrar
+por estado con el índice (cus_id, pec_estado) sin subconsultas correlacionadas.
+
+Los cupos se controlan con contadores (curso_seccion.cus_ocupados y
+curso.cur_ocupados) de inscripciones en estados que ocupan cupo. Reservar es
+un UPDATE condicional (cus_ocupados < cus_cant_participante) que bloquea solo
+la fila de la sección y la del curso, siempre en ese orden; si no afecta
+filas, no hay cupo. Los cambios de estado que tomen o liberen cupo deben
+pasar por cambiar_estado o inscribir.
+"""
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from cursos.estados import ANULADO, AVISADO, ESTADOS_CON_CUPO, LISTA_ESPERA, PREINSCRIPCION, SOBRECUPO
+from cursos.models import Curso, CursoSeccion, PersonaCurso, PersonaEstadoCurso
+
+
+class SinCupo(Exception):
+    """La sección o el curso no tienen cupo para el estado pedido."""
+
+
+class InscripcionModificada(Exception):
+    """Otro proceso cambió el estado de la inscripción entre la lectura y la actualización."""
+
+
+def _ultimo(campo):
+    return Subquery(
+        PersonaEstadoCurso.objects.vigentes()
+        .filter(pec_id=OuterRef('pk'))
+        .order_by('-peu_fecha_hora', '-peu_id')
+        .values(campo)[:1]
+    )
+
+
+def actualizar_estado_actual(pec_ids=None):
+    """
+    Recalcula la proyección desde el historial, en un solo UPDATE: para las
+    inscripciones indicadas (ids o subconsulta) o para todas si pec_ids es None.
+    """
+    inscripciones = PersonaCurso.objects.all() if pec_ids is None else PersonaCurso.objects.filter(pk__in=pec_ids)
+    return inscripciones.update(
+        pec_estado=_ultimo('peu_estado'),
+        pec_estado_fecha=_ultimo('peu_fecha_hora'),
+        usu_id_estado=_ultimo('usu_id'),
+    )
+
+
+def reservar_cupo(cus_id, forzar=False):
+    """
+    Toma un cupo de la sección y de su curso (límite de TipoCurso, si tiene).
+    Con forzar se toma aunque no quede (sobrecupo). Devuelve False si no hay cupo.
+    """
+    secciones = CursoSeccion.objects.filter(pk=cus_id)
+    if not forzar:
+        secciones = secciones.filter(cus_ocupados__lt=F('cus_cant_participante'))
+    if not secciones.update(cus_ocupados=F('cus_ocupados') + 1):
+        return False
+    cur_id, limite = CursoSeccion.objects.filter(pk=cus_id).values_list('cur_id', 'cur_id__tcu_id__tcu_cant_participante').get()
+    cursos = Curso.objects.filter(pk=cur_id)
+    if limite is not None and not forzar:
+        cursos = cursos.filter(cur_ocupados__lt=limite)
+    if not cursos.update(cur_ocupados=F('cur_ocupados') + 1):
+        CursoSeccion.objects.filter(pk=cus_id).update(cus_ocupados=F('cus_ocupados') - 1)
+        return False
+    return True
+
+
+def liberar_cupo(cus_id):
+    CursoSeccion.objects.filter(pk=cus_id).update(cus_ocupados=F('cus_ocupados') - 1)
+    Curso.objects.filter(cursoseccion=cus_id).update(cur_ocupados=F('cur_ocupados') - 1)
+
+
+@transaction.atomic
+def cambiar_estado(inscripcion, estado, usuario, fecha=None):
+    """
+    Agrega un estado al historial de la inscripción y actualiza su estado
+    actual y los cupos en la misma transacción. Pasar a un estado que ocupa
+    cupo sin cupo disponible lanza SinCupo (salvo SOBRECUPO, que lo fuerza);
+    liberar un cupo promueve a la lista de espera de la sección. Una fecha
+    anterior a la del estado actual lanza ValueError.
+    Devuelve el PersonaEstadoCurso creado.
+    """
+    if fecha is not None and inscripcion.pec_estado_fecha is not None and fecha < inscripcion.pec_estado_fecha:
+        # Quedaría antes del estado actual: la proyección no cambiaría pero los cupos sí
+        raise ValueError("La fecha del nuevo estado es anterior a la del estado actual")
+    anterior = inscripcion.pec_estado
+    # Toma la fila solo si nadie cambió el estado desde que se leyó
+    if not PersonaCurso.objects.filter(pk=inscripcion.pk, pec_estado=anterior).update(pec_estado=estado):
+        raise InscripcionModificada(f"La inscripción {inscripcion.pk} cambió de estado")
+    ocupaba, ocupa = anterior in ESTADOS_CON_CUPO, estado in ESTADOS_CON_CUPO
+    if ocupa and not ocupaba and not reservar_cupo(inscripcion.cus_id_id, forzar=estado == SOBRECUPO):
+        raise SinCupo(f"Sin cupo en la sección {inscripcion.cus_id_id}")
+    if ocupaba and not ocupa:
+        liberar_cupo(inscripcion.cus_id_id)
+
+    registro = PersonaEstadoCurso.objects.create(
+        usu_id=usuario, pec_id=inscripcion, peu_fecha_hora=fecha or timezone.now(),
+        peu_estado=estado, peu_vigente=True,
+    )
+    # El signal post_save del historial ya actualizó la proyección en la BD
+    inscripcion.refresh_from_db(fields=['pec_estado', 'pec_estado_fecha', 'usu_id_estado'])
+    if inscripcion.pec_estado != estado:
+        # El historial tiene un estado posterior (fecha leída desactualizada): se revierte todo
+        raise InscripcionModificada(f"La inscripción {inscripcion.pk} tiene un estado posterior a {fecha}")
+    if ocupaba and not ocupa:
+        promover_lista_espera(inscripcion.cus_id_id, usuario)
+    return registro
+
+
+@transaction.atomic
+def inscribir(persona, seccion, rol, alimentacion, usuario, estado=PREINSCRIPCION, sobrecupo=False):
+    """
+    Inscribe a la persona en la sección con el estado pedido si hay cupo; si
+    no, la deja en lista de espera (o en sobrecupo, si se indica). Devuelve
+    la PersonaCurso.
+    """
+    inscripcion, _ = PersonaCurso.objects.get_or_create(
+        per_id=persona, cus_id=seccion,
+        defaults={'rol_id': rol, 'ali_id': alimentacion, 'pec_registro': False, 'pec_acreditado': False},
+    )
+    if inscripcion.pec_estado in ESTADOS_CON_CUPO:
+        return inscripcion
+    try:
+        with transaction.atomic():
+            cambiar_estado(inscripcion, estado, usuario)
+    except SinCupo:
+        cambiar_estado(inscripcion, SOBRECUPO if sobrecupo else LISTA_ESPERA, usuario)
+    return inscripcion
+
+
+def promover_lista_espera(cus_id, usuario):
+    """
+    Pasa a AVISADO, en orden de llegada a la lista de espera, a tantas
+    personas como cupos haya en la sección. Devuelve las promovidas.
+    """
+    promovidas = []
+    # Una candidata que falla se omite: si su historial tiene un estado con fecha futura
+    # volvería a fallar en cada vuelta
+    intentadas = set()
+    while True:
+        candidata = (
+            PersonaCurso.objects.filter(cus_id=cus_id, pec_estado=LISTA_ESPERA).exclude(pk__in=intentadas)
+            .order_by('pec_estado_fecha', 'pec_id').first()
+        )
+        if candidata is None:
+            break
+        intentadas.add(candidata.pk)
+        try:
+            with transaction.atomic():
+                cambiar_estado(candidata, AVISADO, usuario)
+        except SinCupo:
+            break
+        except InscripcionModificada:
+            continue
+        promovidas.append(candidata)
+    return promovidas
+
+
+def anular(inscripcion, usuario):
+    """Anula la inscripción; su cupo pasa a la primera persona en lista de espera."""
+    return cambiar_estado(inscripcion, ANULADO, usuario)
+
+
+@transaction.atomic
+def recalcular_cupos():
+    """Rehace cus_ocupados y cur_ocupados desde pec_estado (reparación)."""
+    ocupadas = PersonaCurso.objects.filter(pec_estado__in=ESTADOS_CON_CUPO)
+    por_seccion = ocupadas.filter(cus_id=OuterRef('pk')).order_by().values('cus_id').annotate(n=Count('pk')).values('n')
+    por_curso = ocupadas.filter(cus_id__cur_id=OuterRef('pk')).order_by().values('cus_id__cur_id').annotate(n=Count('pk')).values('n')
+    CursoSeccion.objects.update(cus_ocupados=Coalesce(Subquery(por_seccion), 0))
+    Curso.objects.update(cur_ocupados=Coalesce(Subquery(por_curso), 0))
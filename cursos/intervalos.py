@@ -0,0 +1,70 @@
+"""
+Solapamiento de periodos (inicio, término), sin acceso a la BD.
+
+Los periodos son semiabiertos: uno que termina justo cuando otro empieza no
+se solapa con él. solapamientos recorre todos los periodos ordenados por
+inicio una sola vez (barrido) manteniendo solo los que siguen abiertos, así
+que el costo es O(n log n) más la cantidad de solapamientos encontrados, no
+O(n²). IndiceIntervalos ordena los periodos una vez y responde qué periodos
+se cruzan con uno nuevo con una búsqueda binaria.
+"""
+import heapq
+from bisect import bisect_left
+from collections import namedtuple
+from itertools import accumulate
+
+# Periodo semiabierto [inicio, termino) de un dueño (ej. una persona); dato identifica su origen
+Periodo = namedtuple('Periodo', 'dueno inicio termino dato')
+
+
+def solapamientos(periodos):
+    """
+    Pares (a, b) de periodos del mismo dueño que se cruzan, con a.inicio <= b.inicio.
+    Los periodos con término <= inicio se ignoran.
+    """
+    orden = sorted(
+        (p for p in periodos if p.termino > p.inicio),
+        key=lambda p: (p.dueno, p.inicio, p.termino),
+    )
+    pares = []
+    abiertos = []
+    dueno = None
+    for i, periodo in enumerate(orden):
+        if periodo.dueno != dueno:
+            dueno, abiertos = periodo.dueno, []
+        # Cierra los periodos que terminaron antes de que empiece este
+        while abiertos and abiertos[0][0] <= periodo.inicio:
+            heapq.heappop(abiertos)
+        pares.extend((orden[j], periodo) for _, j in abiertos)
+        heapq.heappush(abiertos, (periodo.termino, i))
+    return pares
+
+
+class IndiceIntervalos:
+    """
+    Periodos ordenados por inicio con el máximo término acumulado, para
+    consultar los que se cruzan con [inicio, termino) sin revisar todos.
+    """
+
+    def __init__(self, periodos):
+        self.periodos = sorted((p for p in periodos if p.termino > p.inicio), key=lambda p: (p.inicio, p.termino))
+        self.inicios = [p.inicio for p in self.periodos]
+        self.maximos = list(accumulate((p.termino for p in self.periodos), max))
+
+    def __len__(self):
+        return len(self.periodos)
+
+    def cruces(self, inicio, termino):
+        """Periodos que se cruzan con [inicio, termino), por inicio."""
+        cruces = []
+        if termino <= inicio:
+            return cruces
+        # Solo pueden cruzarse los que empiezan antes del término
+        i = bisect_left(self.inicios, termino) - 1
+        # Hacia atrás, hasta que ningún periodo anterior llegue más allá del inicio
+        while i >= 0 and self.maximos[i] > inicio:
+            if self.periodos[i].termino > inicio:
+                cruces.append(self.periodos[i])
+            i -= 1
+        cruces.reverse()
+        return cruces
@@ -0,0 +1,47 @@
+import csv
+import datetime
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from cursos.topes import topes
+
+
+def _fecha(texto):
+    try:
+        return timezone.make_aware(datetime.datetime.combine(datetime.date.fromisoformat(texto), datetime.time()))
+    except ValueError as exc:
+        raise CommandError(f"Fecha inválida: {texto} (use AAAA-MM-DD)") from exc
+
+
+class Command(BaseCommand):
+    help = (
+        "Lista las personas asignadas (como formador, coordinador o participante) a cursos "
+        "cuyas fechas se cruzan. Por defecto revisa el año en curso. Escribe un CSV."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--desde', help="Inicio de la temporada (AAAA-MM-DD, por defecto el 1 de enero)")
+        parser.add_argument('--hasta', help="Fin de la temporada, exclusivo (AAAA-MM-DD, por defecto el 1 de enero siguiente)")
+        parser.add_argument('--salida', help="Archivo CSV de salida (por defecto, stdout)")
+
+    def handle(self, *args, **options):
+        anio = timezone.localdate().year
+        desde = _fecha(options['desde'] or f'{anio}-01-01')
+        hasta = _fecha(options['hasta'] or f'{anio + 1}-01-01')
+        pares = topes(desde, hasta)
+        salida = open(options['salida'], 'w', newline='', encoding='utf-8') if options['salida'] else sys.stdout
+        try:
+            escritor = csv.writer(salida)
+            escritor.writerow(['per_id', 'cur_id_a', 'tipo_a', 'inicio_a', 'termino_a', 'cur_id_b', 'tipo_b', 'inicio_b', 'termino_b'])
+            for a, b in pares:
+                escritor.writerow([
+                    a.dueno,
+                    a.dato.cur_id, a.dato.tipo, a.inicio.isoformat(), a.termino.isoformat(),
+                    b.dato.cur_id, b.dato.tipo, b.inicio.isoformat(), b.termino.isoformat(),
+                ])
+        finally:
+            if salida is not sys.stdout:
+                salida.close()
+        self.stderr.write(self.style.SUCCESS(f"{len(pares)} topes de horario"))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from cursos.inscripciones import recalcular_cupos
+
+
+class Command(BaseCommand):
+    help = "Recalcula los cupos ocupados de cursos y secciones (cur_ocupados, cus_ocupados) desde persona_curso."
+
+    def handle(self, *args, **options):
+        recalcular_cupos()
+        self.stdout.write(self.style.SUCCESS("Cupos recalculados"))
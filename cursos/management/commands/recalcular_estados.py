@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from cursos.inscripciones import actualizar_estado_actual
+
+
+class Command(BaseCommand):
+    help = "Recalcula el estado actual de todas las inscripciones (persona_curso.pec_estado) desde persona_estado_curso."
+
+    def handle(self, *args, **options):
+        actualizadas = actualizar_estado_actual()
+        self.stdout.write(self.style.SUCCESS(f"{actualizadas} inscripciones actualizadas"))
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-18 03:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cursos", "0001_initial"),
+        ("usuarios", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="personaestadocurso",
+            index=models.Index(
+                condition=models.Q(("peu_vigente", True)),
+                fields=["pec_id", "peu_fecha_hora"],
+                name="persona_estado_curso_vig_idx",
+            ),
+        ),
+    ]
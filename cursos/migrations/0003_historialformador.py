@@ -0,0 +1,195 @@
+# Generated by Django 5.2.7 on 2026-10-18 03:43
+
+import datetime
+import re
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Min
+from django.utils import timezone
+
+# Valores y reglas de cursos.historial al crear la migración
+ORIGEN_FORMADOR = 1
+ORIGEN_ACREDITACION = 2
+ORIGEN_HISTORIAL = 3
+
+FECHA = re.compile(
+    r"\b(?:(\d{1,2})[/.-](\d{1,2})[/.-](\d{4})|(\d{4})-(\d{1,2})-(\d{1,2}))\b"
+)
+TOKEN = re.compile(r"[\w-]+")
+
+
+def fecha_en_texto(texto):
+    for coincidencia in FECHA.finditer(texto):
+        dia, mes, anio, anio_iso, mes_iso, dia_iso = coincidencia.groups()
+        try:
+            if anio:
+                fecha = datetime.date(int(anio), int(mes), int(dia))
+            else:
+                fecha = datetime.date(int(anio_iso), int(mes_iso), int(dia_iso))
+        except ValueError:
+            continue
+        return timezone.make_aware(datetime.datetime.combine(fecha, datetime.time()))
+    return None
+
+
+def parsear_historial(texto, cursos_por_codigo):
+    entradas = []
+    for linea in (texto or "").splitlines():
+        linea = " ".join(linea.split())
+        if not linea:
+            continue
+        cur_id = next(
+            (
+                cursos_por_codigo[t]
+                for t in TOKEN.findall(linea.upper())
+                if t in cursos_por_codigo
+            ),
+            None,
+        )
+        entradas.append((cur_id, fecha_en_texto(linea), linea[:255]))
+    return entradas
+
+
+def poblar_historial(apps, schema_editor):
+    Curso = apps.get_model("cursos", "Curso")
+    CursoFecha = apps.get_model("cursos", "CursoFecha")
+    CursoFormador = apps.get_model("cursos", "CursoFormador")
+    PersonaCurso = apps.get_model("cursos", "PersonaCurso")
+    HistorialFormador = apps.get_model("cursos", "HistorialFormador")
+    PersonaFormador = apps.get_model("personas", "PersonaFormador")
+
+    fechas = dict(
+        CursoFecha.objects.order_by()
+        .values_list("cur_id")
+        .annotate(inicio=Min("cuf_fecha_inicio"))
+    )
+    filas = []
+    # Participaciones ya registradas como formador o acreditación
+    for modelo, origen, extra in (
+        (CursoFormador, ORIGEN_FORMADOR, {}),
+        (PersonaCurso, ORIGEN_ACREDITACION, {"pec_acreditado": True}),
+    ):
+        for per_id, cur_id, rol_id, ram_id in (
+            modelo.objects.filter(**extra)
+            .values_list("per_id", "cus_id__cur_id", "rol_id", "cus_id__ram_id")
+            .iterator()
+        ):
+            filas.append(
+                HistorialFormador(
+                    per_id_id=per_id,
+                    cur_id_id=cur_id,
+                    rol_id_id=rol_id,
+                    ram_id_id=ram_id,
+                    hif_fecha=fechas.get(cur_id),
+                    hif_origen=origen,
+                )
+            )
+    # Texto libre de persona_formador: una entrada por línea
+    cursos_por_codigo = {
+        codigo.strip().upper(): cur_id
+        for cur_id, codigo in Curso.objects.values_list("cur_id", "cur_codigo")
+    }
+    for per_id, texto in (
+        PersonaFormador.objects.exclude(pef_historial__isnull=True)
+        .exclude(pef_historial="")
+        .values_list("per_id", "pef_historial")
+        .iterator()
+    ):
+        for cur_id, fecha, linea in parsear_historial(texto, cursos_por_codigo):
+            filas.append(
+                HistorialFormador(
+                    per_id_id=per_id,
+                    cur_id_id=cur_id,
+                    hif_fecha=fecha or fechas.get(cur_id),
+                    hif_origen=ORIGEN_HISTORIAL,
+                    hif_descripcion=linea,
+                )
+            )
+    HistorialFormador.objects.bulk_create(filas, batch_size=500, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cursos", "0002_personaestadocurso_persona_estado_curso_vig_idx"),
+        ("maestros", "0004_grupojerarquia"),
+        ("personas", "0007_personanivelmaximo"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="HistorialFormador",
+            fields=[
+                ("hif_id", models.AutoField(primary_key=True, serialize=False)),
+                ("hif_fecha", models.DateTimeField(blank=True, null=True)),
+                ("hif_origen", models.IntegerField()),
+                (
+                    "hif_descripcion",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                (
+                    "cur_id",
+                    models.ForeignKey(
+                        blank=True,
+                        db_column="cur_id",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to="cursos.curso",
+                    ),
+                ),
+                (
+                    "per_id",
+                    models.ForeignKey(
+                        db_column="per_id",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="historial_formacion",
+                        to="personas.persona",
+                    ),
+                ),
+                (
+                    "ram_id",
+                    models.ForeignKey(
+                        blank=True,
+                        db_column="ram_id",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to="maestros.rama",
+                    ),
+                ),
+                (
+                    "rol_id",
+                    models.ForeignKey(
+                        blank=True,
+                        db_column="rol_id",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to="maestros.rol",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Historial de Formador",
+                "verbose_name_plural": "Historiales de Formadores",
+                "db_table": "historial_formador",
+                "indexes": [
+                    models.Index(
+                        fields=["per_id", "hif_fecha"],
+                        name="historial_formador_per_idx",
+                    ),
+                    models.Index(
+                        fields=["ram_id", "hif_fecha", "per_id"],
+                        name="historial_formador_ram_idx",
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("cur_id__isnull", False)),
+                        fields=("per_id", "cur_id", "hif_origen"),
+                        name="historial_formador_unico",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(poblar_historial, migrations.RunPython.noop),
+    ]
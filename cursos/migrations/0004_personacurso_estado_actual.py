@@ -0,0 +1,65 @@
+# Generated by Django 5.2.7 on 2026-10-18 03:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def proyectar_estados(apps, schema_editor):
+    PersonaCurso = apps.get_model("cursos", "PersonaCurso")
+    PersonaEstadoCurso = apps.get_model("cursos", "PersonaEstadoCurso")
+
+    def ultimo(campo):
+        return Subquery(
+            PersonaEstadoCurso.objects.filter(pec_id=OuterRef("pk"), peu_vigente=True)
+            .order_by("-peu_fecha_hora", "-peu_id")
+            .values(campo)[:1]
+        )
+
+    PersonaCurso.objects.update(
+        pec_estado=ultimo("peu_estado"),
+        pec_estado_fecha=ultimo("peu_fecha_hora"),
+        usu_id_estado=ultimo("usu_id"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cursos", "0003_historialformador"),
+        ("maestros", "0004_grupojerarquia"),
+        ("personas", "0007_personanivelmaximo"),
+        ("usuarios", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="personacurso",
+            name="pec_estado",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="personacurso",
+            name="pec_estado_fecha",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="personacurso",
+            name="usu_id_estado",
+            field=models.ForeignKey(
+                blank=True,
+                db_column="usu_id_estado",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="usuarios.usuario",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="personacurso",
+            index=models.Index(
+                fields=["cus_id", "pec_estado"], name="persona_curso_estado_idx"
+            ),
+        ),
+        migrations.RunPython(proyectar_estados, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.7 on 2026-10-18 03:55
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+# Estados que ocupan cupo (cursos.estados.ESTADOS_CON_CUPO al crear la migración)
+ESTADOS_CON_CUPO = (1, 2, 4, 5, 10)
+
+
+def contar_cupos(apps, schema_editor):
+    Curso = apps.get_model("cursos", "Curso")
+    CursoSeccion = apps.get_model("cursos", "CursoSeccion")
+    PersonaCurso = apps.get_model("cursos", "PersonaCurso")
+    ocupadas = PersonaCurso.objects.filter(pec_estado__in=ESTADOS_CON_CUPO).order_by()
+    por_seccion = (
+        ocupadas.filter(cus_id=OuterRef("pk"))
+        .values("cus_id")
+        .annotate(n=Count("pk"))
+        .values("n")
+    )
+    por_curso = (
+        ocupadas.filter(cus_id__cur_id=OuterRef("pk"))
+        .values("cus_id__cur_id")
+        .annotate(n=Count("pk"))
+        .values("n")
+    )
+    CursoSeccion.objects.update(cus_ocupados=Coalesce(Subquery(por_seccion), 0))
+    Curso.objects.update(cur_ocupados=Coalesce(Subquery(por_curso), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cursos", "0004_personacurso_estado_actual"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="curso",
+            name="cur_ocupados",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="cursoseccion",
+            name="cus_ocupados",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(contar_cupos, migrations.RunPython.noop),
+    ]
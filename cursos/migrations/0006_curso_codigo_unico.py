@@ -0,0 +1,57 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:03
+
+import re
+
+from django.db import migrations, models
+from django.db.models import Count
+
+# Formato de cursos.codigos al crear la migración
+CODIGO = re.compile(r"^(\d{4})-(\d{4,5})$")
+
+
+def verificar_codigos(apps, schema_editor):
+    Curso = apps.get_model("cursos", "Curso")
+    repetidos = list(
+        Curso.objects.values_list("cur_codigo", flat=True)
+        .annotate(n=Count("pk"))
+        .filter(n__gt=1)
+        .order_by()
+    )
+    if repetidos:
+        raise RuntimeError(
+            "Hay códigos de curso repetidos; corríjalos antes de migrar: "
+            + ", ".join(repetidos[:20])
+        )
+
+
+def iniciar_secuencias(apps, schema_editor):
+    Curso = apps.get_model("cursos", "Curso")
+    Secuencia = apps.get_model("maestros", "Secuencia")
+    maximos = {}
+    for codigo in Curso.objects.values_list("cur_codigo", flat=True).iterator():
+        coincidencia = CODIGO.match(codigo)
+        if coincidencia:
+            anio, numero = int(coincidencia[1]), int(coincidencia[2])
+            maximos[anio] = max(maximos.get(anio, 0), numero)
+    for anio, numero in maximos.items():
+        Secuencia.objects.update_or_create(
+            sec_ambito=f"curso:{anio}", defaults={"sec_valor": numero}
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cursos", "0005_cupos_ocupados"),
+        ("maestros", "0005_secuencia"),
+    ]
+
+    operations = [
+        migrations.RunPython(verificar_codigos, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="curso",
+            name="cur_codigo",
+            field=models.CharField(blank=True, max_length=10, unique=True),
+        ),
+        migrations.RunPython(iniciar_secuencias, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,6 @@
 
 from django.db import models
+from maestros.managers import VigenteManager
 from usuarios.models import Usuario
 from personas.models import Persona
 from maestros.models import Comuna, TipoCurso, Alimentacion,  Rama, Rol, Nivel, Cargo # Importar modelos maestros
@@ -21,8 +22,8 @@ class Curso(models.Model):
     cur_fecha_hora = models.DateTimeField()
     # cur_fecha_solicitud: Fecha de solicitud del curso
     cur_fecha_solicitud = models.DateTimeField()
-    # cur_codigo: Código único del curso
-    cur_codigo = models.CharField(max_length=10)
+    # cur_codigo: Código único del curso (si se deja vacío, cursos.codigos asigna el siguiente del año: 2026-0001)
+    cur_codigo = models.CharField(max_length=10, unique=True, blank=True)
     # cur_descripcion: Descripción breve del curso
     cur_descripcion = models.CharField(max_length=50, null=True, blank=True)
     # cur_observacion: Observaciones generales del curso
@@ -41,6 +42,8 @@ class Curso(models.Model):
     cur_lugar = models.CharField(max_length=100, null=True, blank=True)
     # cur_estado: Estado del curso (0: Pendiente, 1: Vigente, 2: Anulado, 3: Finalizado)
     cur_estado = models.IntegerField()
+    # cur_ocupados: Inscripciones del curso en estados que ocupan cupo (mantenido por cursos.inscripciones)
+    cur_ocupados = models.IntegerField(default=0)
 
     class Meta:
         db_table = 'curso'
@@ -62,6 +65,8 @@ class CursoSeccion(models.Model):
     cus_seccion = models.IntegerField()
     # cus_cant_participante: Cantidad de participantes en la sección
     cus_cant_participante = models.IntegerField()
+    # cus_ocupados: Inscripciones de la sección en estados que ocupan cupo (mantenido por cursos.inscripciones)
+    cus_ocupados = models.IntegerField(default=0)
 
     class Meta:
         db_table = 'curso_seccion'
@@ -133,6 +138,9 @@ class CursoAlimentacion(models.Model):
     # cua_vigente: Indica si la relación está activa (True) o inactiva (False)
     cua_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'curso_alimentacion'
         verbose_name = 'Alimentación de Curso'
@@ -207,12 +215,22 @@ class PersonaCurso(models.Model):
     pec_registro = models.BooleanField()
     # pec_acreditado: Indica si la persona está acreditada (booleano)
     pec_acreditado = models.BooleanField()
+    # pec_estado: Estado actual (peu_estado del último persona_estado_curso vigente; mantenido por cursos.inscripciones)
+    pec_estado = models.IntegerField(null=True, blank=True)
+    # pec_estado_fecha: Fecha y hora del estado actual (peu_fecha_hora)
+    pec_estado_fecha = models.DateTimeField(null=True, blank=True)
+    # usu_id_estado: Clave foránea a Usuario (quien registró el estado actual)
+    usu_id_estado = models.ForeignKey(Usuario, on_delete=models.SET_NULL, db_column='usu_id_estado', null=True, blank=True, related_name='+')
 
     class Meta:
         db_table = 'persona_curso'
         verbose_name = 'Inscripción de Persona en Curso'
         verbose_name_plural = 'Inscripciones de Personas en Cursos'
         unique_together = ('per_id', 'cus_id') # Una persona solo puede inscribirse una vez por sección de curso
+        indexes = [
+            # Inscripciones de una sección por estado actual
+            models.Index(fields=['cus_id', 'pec_estado'], name='persona_curso_estado_idx'),
+        ]
 
     def __str__(self):
         return f"{self.per_id} en {self.cus_id}"
@@ -232,10 +250,54 @@ class PersonaEstadoCurso(models.Model):
     # peu_vigente: Indica si el registro de estado está activo (True) o inactivo (False)
     peu_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'persona_estado_curso'
         verbose_name = 'Estado de Inscripción de Persona'
         verbose_name_plural = 'Estados de Inscripción de Personas'
+        indexes = [
+            # Índice parcial: estados vigentes de una inscripción, del más antiguo al más reciente
+            models.Index(fields=['pec_id', 'peu_fecha_hora'], name='persona_estado_curso_vig_idx', condition=models.Q(peu_vigente=True)),
+        ]
 
     def __str__(self):
         return f"Estado {self.peu_estado} para {self.pec_id} por {self.usu_id}"
+
+# Tabla: historial_formador
+class HistorialFormador(models.Model):
+    # hif_id: Identificador único del registro de historial (clave primaria)
+    hif_id = models.AutoField(primary_key=True)
+    # per_id: Clave foránea a Persona (el formador)
+    per_id = models.ForeignKey(Persona, on_delete=models.CASCADE, db_column='per_id', related_name='historial_formacion')
+    # cur_id: Clave foránea a Curso (opcional: entradas migradas sin curso identificable)
+    cur_id = models.ForeignKey(Curso, on_delete=models.SET_NULL, db_column='cur_id', null=True, blank=True)
+    # rol_id: Clave foránea a Rol (rol en el curso, opcional)
+    rol_id = models.ForeignKey(Rol, on_delete=models.SET_NULL, db_column='rol_id', null=True, blank=True)
+    # ram_id: Clave foránea a Rama (rama de la sección, opcional)
+    ram_id = models.ForeignKey(Rama, on_delete=models.SET_NULL, db_column='ram_id', null=True, blank=True)
+    # hif_fecha: Fecha del curso (inicio de la primera fecha del curso), o la anotada en el historial migrado
+    hif_fecha = models.DateTimeField(null=True, blank=True)
+    # hif_origen: Origen del registro (1: Formador de curso, 2: Acreditación, 3: Historial migrado de persona_formador)
+    hif_origen = models.IntegerField()
+    # hif_descripcion: Texto original de la línea migrada desde pef_historial (opcional)
+    hif_descripcion = models.CharField(max_length=255, null=True, blank=True)
+
+    class Meta:
+        db_table = 'historial_formador'
+        verbose_name = 'Historial de Formador'
+        verbose_name_plural = 'Historiales de Formadores'
+        indexes = [
+            # Historial de una persona en orden cronológico
+            models.Index(fields=['per_id', 'hif_fecha'], name='historial_formador_per_idx'),
+            # Formadores por rama desde una fecha
+            models.Index(fields=['ram_id', 'hif_fecha', 'per_id'], name='historial_formador_ram_idx'),
+        ]
+        constraints = [
+            # Una entrada por persona, curso y origen: los signals pueden repetirse sin duplicar
+            models.UniqueConstraint(fields=['per_id', 'cur_id', 'hif_origen'], name='historial_formador_unico', condition=models.Q(cur_id__isnull=False)),
+        ]
+
+    def __str__(self):
+        return f"Historial {self.per_id}: {self.cur_id} ({self.hif_fecha})"
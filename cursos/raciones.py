@@ -0,0 +1,120 @@
+"""
+Plan de raciones para la cocina: por curso, día y tiempo de comida, las
+raciones de cada dieta (alimentacion).
+
+Cada servicio vigente de curso_alimentacion aporta, para su dieta, las
+inscripciones del curso con esa alimentación que ocupan cupo más
+cua_cantidad_adicional. Todo sale de dos consultas agregadas (servicios e
+inscritos por curso y dieta); el cruce y la tabla curso/día/tiempo x dieta
+se arman con arreglos de NumPy, sin recorrer filas en Python. La separación
+internado/externado es la modalidad del curso (curso.cur_modalidad): la
+inscripción no guarda una modalidad propia.
+"""
+from collections import namedtuple
+
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+from cursos.estados import CURSO_ANULADO, ESTADOS_CON_CUPO
+from cursos.models import CursoAlimentacion, PersonaCurso
+
+# curso_alimentacion.cua_tiempo
+TIEMPOS = {1: 'Desayuno', 2: 'Almuerzo', 3: 'Once', 4: 'Cena', 5: 'Once/Cena'}
+
+# curso.cur_modalidad
+MODALIDADES = {1: 'Internado', 2: 'Externado', 3: 'Internado/Externado'}
+
+# Una fila por curso, día y tiempo (arreglos del mismo largo): cur_id, fecha
+# (datetime64[D]), tiempo y modalidad; dietas son los ali_id de las columnas de
+# matriz (filas x dietas, raciones)
+PlanRaciones = namedtuple('PlanRaciones', 'cur_id fecha tiempo modalidad dietas matriz')
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError("El plan de raciones requiere el paquete numpy") from exc
+    return numpy
+
+
+def plan_raciones(desde=None, hasta=None, cur_ids=None):
+    """Plan de los servicios con cua_fecha en [desde, hasta) de los cursos indicados (o de todos los no anulados)."""
+    np = _numpy()
+    servicios = CursoAlimentacion.objects.vigentes().exclude(cur_id__cur_estado=CURSO_ANULADO)
+    if desde is not None:
+        servicios = servicios.filter(cua_fecha__gte=desde)
+    if hasta is not None:
+        servicios = servicios.filter(cua_fecha__lt=hasta)
+    if cur_ids is not None:
+        servicios = servicios.filter(cur_id__in=cur_ids)
+    filas = list(servicios.order_by().values_list(
+        'cur_id', TruncDate('cua_fecha'), 'cua_tiempo', 'ali_id', 'cua_cantidad_adicional', 'cur_id__cur_modalidad',
+    ))
+    if not filas:
+        vacio = np.zeros(0, dtype=np.int64)
+        return PlanRaciones(vacio, np.zeros(0, dtype='datetime64[D]'), vacio, vacio, vacio, np.zeros((0, 0), dtype=np.int64))
+    inscritos = list(
+        PersonaCurso.objects.filter(pec_estado__in=ESTADOS_CON_CUPO, cus_id__cur_id__in=servicios.values('cur_id'))
+        .order_by().values_list('cus_id__cur_id', 'ali_id').annotate(cantidad=Count('pk'))
+    )
+
+    columnas = list(zip(*filas))
+    cur = np.array(columnas[0], dtype=np.int64)
+    fecha = np.array(columnas[1], dtype='datetime64[D]')
+    tiempo, ali, adicional, modalidad = (np.array(c, dtype=np.int64) for c in columnas[2:])
+
+    # Inscritos de cada servicio: búsqueda binaria de (curso, dieta) en los conteos ordenados
+    conteo = np.zeros(len(cur), dtype=np.int64)
+    if inscritos:
+        i_cur, i_ali, i_cantidad = (np.array(c, dtype=np.int64) for c in zip(*inscritos))
+        # La base debe superar toda dieta, también las de inscripciones sin servicio, o dos claves coinciden
+        base = int(max(ali.max(), i_ali.max())) + 1
+        i_clave = i_cur * base + i_ali
+        orden = np.argsort(i_clave)
+        i_clave, i_cantidad = i_clave[orden], i_cantidad[orden]
+        clave = cur * base + ali
+        posicion = np.minimum(np.searchsorted(i_clave, clave), len(i_clave) - 1)
+        conteo = np.where(i_clave[posicion] == clave, i_cantidad[posicion], 0)
+
+    # Tabla (curso, día, tiempo) x dieta
+    claves = np.stack([cur, fecha.astype(np.int64), tiempo], axis=1)
+    unicas, fila = np.unique(claves, axis=0, return_inverse=True)
+    dietas, columna = np.unique(ali, return_inverse=True)
+    matriz = np.zeros((len(unicas), len(dietas)), dtype=np.int64)
+    np.add.at(matriz, (fila.reshape(-1), columna.reshape(-1)), conteo + adicional)
+    modalidad_fila = np.zeros(len(unicas), dtype=np.int64)
+    modalidad_fila[fila.reshape(-1)] = modalidad
+    return PlanRaciones(unicas[:, 0], unicas[:, 1].astype('datetime64[D]'), unicas[:, 2], modalidad_fila, dietas, matriz)
+
+
+def totales_por_modalidad(plan):
+    """
+    Suma los cursos: ([(fecha, tiempo, modalidad)], matriz por dieta), para
+    las compras del día sin importar el curso.
+    """
+    np = _numpy()
+    claves = np.stack([plan.fecha.astype(np.int64), plan.tiempo, plan.modalidad], axis=1)
+    unicas, fila = np.unique(claves, axis=0, return_inverse=True)
+    matriz = np.zeros((len(unicas), len(plan.dietas)), dtype=np.int64)
+    np.add.at(matriz, fila.reshape(-1), plan.matriz)
+    grupos = [(np.datetime64(int(f), 'D').item(), int(t), int(m)) for f, t, m in unicas]
+    return grupos, matriz
+
+
+def encabezado_plan(plan, nombres_dietas):
+    return ('Curso', 'Fecha', 'Tiempo', 'Modalidad', *(nombres_dietas.get(int(a), a) for a in plan.dietas), 'Total')
+
+
+def filas_plan(plan, codigos_cursos):
+    """Filas para exportar: curso, día, tiempo y modalidad, raciones por dieta y total."""
+    totales = plan.matriz.sum(axis=1)
+    for i in range(len(plan.cur_id)):
+        yield (
+            codigos_cursos.get(int(plan.cur_id[i]), plan.cur_id[i]),
+            plan.fecha[i].item(),
+            TIEMPOS.get(int(plan.tiempo[i]), plan.tiempo[i]),
+            MODALIDADES.get(int(plan.modalidad[i]), plan.modalidad[i]),
+            *plan.matriz[i].tolist(),
+            int(totales[i]),
+        )
@@ -0,0 +1,94 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from cursos.codigos import asignar_codigos
+from cursos.cuotas import MODELOS_CUOTAS
+from cursos.estados import ESTADOS_CON_CUPO
+from cursos.historial import ORIGEN_ACREDITACION, ORIGEN_FORMADOR, actualizar_fecha_curso, registrar
+from cursos.inscripciones import actualizar_estado_actual, liberar_cupo, reservar_cupo
+from cursos.models import Curso, CursoFecha, CursoFormador, PersonaCurso, PersonaEstadoCurso
+from cursos.tablero import MODELOS_TABLERO, curso_de, invalidar_tablero
+from maestros.catalogo import invalidar_catalogo
+from personas.duplicados import filas_fusionadas
+
+
+@receiver(post_save, sender=CursoFormador)
+def historial_formador(sender, instance, raw=False, **kwargs):
+    if not raw:
+        registrar(instance.per_id_id, instance.cus_id_id, instance.rol_id_id, ORIGEN_FORMADOR)
+
+
+@receiver(post_save, sender=PersonaCurso)
+def historial_acreditacion(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or not instance.pec_acreditado:
+        return
+    if update_fields is not None and 'pec_acreditado' not in update_fields:
+        return
+    registrar(instance.per_id_id, instance.cus_id_id, instance.rol_id_id, ORIGEN_ACREDITACION)
+
+
+@receiver(post_save, sender=CursoFecha)
+@receiver(post_delete, sender=CursoFecha)
+def fecha_historial(sender, instance, raw=False, **kwargs):
+    # hif_fecha es el inicio de la primera fecha del curso: puede llegar después del formador
+    if not raw:
+        actualizar_fecha_curso(instance.cur_id_id)
+
+
+@receiver(post_save, sender=PersonaEstadoCurso)
+@receiver(post_delete, sender=PersonaEstadoCurso)
+def proyectar_estado(sender, instance, raw=False, **kwargs):
+    # Se recalcula desde el historial: cubre estados con fecha anterior y registros que dejan de ser vigentes
+    if not raw:
+        actualizar_estado_actual([instance.pec_id_id])
+
+
+@receiver(pre_save, sender=Curso)
+def asignar_codigo(sender, instance, raw=False, **kwargs):
+    # Los cursos nuevos sin código reciben el siguiente de su año
+    if not raw and instance._state.adding:
+        asignar_codigos([instance])
+
+
+@receiver(post_delete, sender=PersonaCurso)
+def devolver_cupo(sender, instance, **kwargs):
+    # Borrar una inscripción que ocupaba cupo lo devuelve (sin promover: suele ser una limpieza)
+    if instance.pec_estado in ESTADOS_CON_CUPO:
+        liberar_cupo(instance.cus_id_id)
+
+
+@receiver(filas_fusionadas, sender=PersonaCurso)
+def juntar_inscripciones(sender, conservadas, **kwargs):
+    # La inscripción que queda recibió el historial de la duplicada: se reproyecta y se corrige su cupo
+    antes = dict(PersonaCurso.objects.filter(pk__in=conservadas).values_list('pk', 'pec_estado'))
+    actualizar_estado_actual(conservadas)
+    for pk, cus_id, estado in PersonaCurso.objects.filter(pk__in=conservadas).values_list('pk', 'cus_id', 'pec_estado'):
+        ocupaba, ocupa = antes[pk] in ESTADOS_CON_CUPO, estado in ESTADOS_CON_CUPO
+        if ocupa and not ocupaba:
+            reservar_cupo(cus_id, forzar=True)
+        elif ocupaba and not ocupa:
+            liberar_cupo(cus_id)
+
+
+# Un cambio en un curso, sus secciones, inscripciones o estados invalida solo el tablero de ese curso
+def inscripciones_modificadas(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    cur_id = curso_de(instance)
+    if cur_id is not None:
+        invalidar_tablero(cur_id)
+
+
+# Un cambio en cursos o cuotas invalida los programas de cuotas (tablas de pocas escrituras)
+def cuotas_modificadas(sender, raw=False, **kwargs):
+    if not raw:
+        invalidar_catalogo(sender)
+
+
+for modelo in MODELOS_TABLERO:
+    post_save.connect(inscripciones_modificadas, sender=modelo, dispatch_uid=f'tablero_save_{modelo._meta.db_table}')
+    post_delete.connect(inscripciones_modificadas, sender=modelo, dispatch_uid=f'tablero_delete_{modelo._meta.db_table}')
+
+for modelo in MODELOS_CUOTAS:
+    post_save.connect(cuotas_modificadas, sender=modelo, dispatch_uid=f'version_save_{modelo._meta.db_table}')
+    post_delete.connect(cuotas_modificadas, sender=modelo, dispatch_uid=f'version_delete_{modelo._meta.db_table}')
@@ -0,0 +1,105 @@
+"""
+Tablero de inscripciones: cuántas personas hay en cada estado por sección.
+
+La matriz sección x estado de uno o varios cursos sale de una sola consulta
+agregada sobre el estado actual de cada inscripción (persona_curso.pec_estado)
+y se guarda en la caché de Django. Cada curso tiene su propia versión en
+catalogo_version (clave tablero:<cur_id>), que los signals incrementan cuando
+cambia el curso, una de sus secciones, inscripciones o estados: escribir en un
+curso no bloquea ni invalida los tableros de los demás.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, F
+
+from cursos.estados import CURSO_VIGENTE, ESTADOS_CON_CUPO, NOMBRES_ESTADO
+from cursos.models import Curso, CursoSeccion, PersonaCurso, PersonaEstadoCurso
+from maestros.catalogo import invalidar_version, version, versiones
+
+# Tablas cuyos cambios invalidan el tablero de su curso
+MODELOS_TABLERO = (Curso, CursoSeccion, PersonaCurso, PersonaEstadoCurso)
+
+PREFIJO_VERSION = 'tablero:'
+
+TABLERO_TTL = getattr(settings, 'TABLERO_TTL', 600)
+
+
+def _seccion_vacia(cus_id, numero, cupo):
+    return {
+        'cus_id': cus_id,
+        'seccion': numero,
+        'cupo': cupo,
+        'estados': {nombre: 0 for nombre in NOMBRES_ESTADO.values()},
+        'sin_estado': 0,
+        'ocupados': 0,
+    }
+
+
+def calcular_tableros(secciones):
+    """{cur_id: [fila por sección]} para un queryset de CursoSeccion, en una consulta."""
+    filas = (
+        secciones.values('cur_id', 'cus_id', 'cus_seccion', 'cus_cant_participante', estado=F('personacurso__pec_estado'))
+        .annotate(cantidad=Count('personacurso__pec_id'))
+        .order_by()
+    )
+    por_seccion = {}
+    for fila in filas:
+        seccion = por_seccion.get(fila['cus_id'])
+        if seccion is None:
+            seccion = por_seccion[fila['cus_id']] = (
+                fila['cur_id'], _seccion_vacia(fila['cus_id'], fila['cus_seccion'], fila['cus_cant_participante'])
+            )
+        datos = seccion[1]
+        estado, cantidad = fila['estado'], fila['cantidad']
+        if not cantidad:
+            continue
+        if estado in NOMBRES_ESTADO:
+            datos['estados'][NOMBRES_ESTADO[estado]] += cantidad
+        else:
+            datos['sin_estado'] += cantidad
+        if estado in ESTADOS_CON_CUPO:
+            datos['ocupados'] += cantidad
+
+    tableros = {}
+    for cur_id, datos in sorted(por_seccion.values(), key=lambda s: (s[0], s[1]['seccion'])):
+        datos['disponibles'] = max(datos['cupo'] - datos['ocupados'], 0)
+        tableros.setdefault(cur_id, []).append(datos)
+    return tableros
+
+
+def curso_de(instancia):
+    """cur_id del curso al que pertenece una fila de MODELOS_TABLERO (None si ya no existe)."""
+    if isinstance(instancia, Curso):
+        return instancia.pk
+    if isinstance(instancia, CursoSeccion):
+        return instancia.cur_id_id
+    if isinstance(instancia, PersonaCurso):
+        return CursoSeccion.objects.filter(pk=instancia.cus_id_id).values_list('cur_id', flat=True).first()
+    return PersonaCurso.objects.filter(pk=instancia.pec_id_id).values_list('cus_id__cur_id', flat=True).first()
+
+
+def invalidar_tablero(cur_id):
+    """Las operaciones masivas sobre inscripciones no disparan señales y deben llamar a esta función."""
+    invalidar_version(f'{PREFIJO_VERSION}{cur_id}')
+
+
+def tablero_curso(cur_id):
+    """Secciones del curso con la cantidad de inscripciones por estado y el cupo disponible."""
+    clave = f'cursos:tablero:{cur_id}:{version(f"{PREFIJO_VERSION}{cur_id}")}'
+    tablero = cache.get(clave)
+    if tablero is None:
+        tablero = calcular_tableros(CursoSeccion.objects.filter(cur_id=cur_id)).get(cur_id, [])
+        cache.set(clave, tablero, TABLERO_TTL)
+    return tablero
+
+
+def tableros_vigentes():
+    """{cur_id: secciones} de todos los cursos vigentes, con la misma consulta única."""
+    # Las versiones solo crecen: su suma cambia con cualquier curso sin leer cuáles están vigentes
+    suma = sum(v for clave, v in versiones().items() if clave.startswith(PREFIJO_VERSION))
+    clave = f'cursos:tablero:vigentes:{suma}'
+    tableros = cache.get(clave)
+    if tableros is None:
+        tableros = calcular_tableros(CursoSeccion.objects.filter(cur_id__cur_estado=CURSO_VIGENTE))
+        cache.set(clave, tableros, TABLERO_TTL)
+    return tableros
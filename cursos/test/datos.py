@@ -0,0 +1,69 @@
+from django.utils import timezone
+
+from cursos.estados import INSCRITO
+from cursos.inscripciones import inscribir
+from cursos.models import Curso, CursoSeccion
+from maestros.models import (
+    Alimentacion, Cargo, Comuna, Distrito, EstadoCivil, Grupo, Provincia, Rama, Region, Rol, TipoCurso, Zona,
+)
+from personas.models import Persona
+from usuarios.models import Perfil, Usuario
+
+
+class DatosCurso:
+    """
+    Datos mínimos de los tests con BD: maestros, un usuario, un grupo, un
+    curso con una sección de cupo 2 y cuatro personas sin inscribir.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.crear_maestros()
+        cls.seccion = cls.curso_con_seccion()
+        cls.personas = [cls.persona(2000000 + i) for i in range(4)]
+
+    @classmethod
+    def crear_maestros(cls):
+        region = Region.objects.create(reg_descripcion='Metropolitana', reg_vigente=True)
+        provincia = Provincia.objects.create(reg_id=region, pro_descripcion='Santiago', pro_vigente=True)
+        cls.comuna = Comuna.objects.create(pro_id=provincia, com_descripcion='Ñuñoa', com_vigente=True)
+        zona = Zona.objects.create(zon_descripcion='Zona Centro', zon_unilateral=False, zon_vigente=True)
+        distrito = Distrito.objects.create(zon_id=zona, dis_descripcion='Distrito Ñuñoa', dis_vigente=True)
+        cls.grupo = Grupo.objects.create(dis_id=distrito, gru_descripcion='Grupo Alfa', gru_vigente=True)
+        cls.estado_civil = EstadoCivil.objects.create(esc_descripcion='Soltero', esc_vigente=True)
+        perfil = Perfil.objects.create(pel_descripcion='Admin', pel_vigente=True)
+        cls.usuario = Usuario.objects.create(pel_id=perfil, usu_username='admin', usu_password='x', usu_ruta_foto='', usu_vigente=True)
+        cls.rol = Rol.objects.create(rol_descripcion='Participante', rol_tipo=2, rol_vigente=True)
+        # Id fijo: los tests de raciones arman claves con los ali_id
+        cls.alimentacion = Alimentacion.objects.create(ali_id=1, ali_descripcion='Normal', ali_tipo=1, ali_vigente=True)
+        cls.tipo = TipoCurso.objects.create(tcu_descripcion='Inicial', tcu_tipo=1, tcu_vigente=True)
+        cls.cargo = Cargo.objects.create(car_descripcion='Director', car_vigente=True)
+        cls.rama = Rama.objects.create(ram_descripcion='Scouts', ram_vigente=True)
+        cls.responsable = cls.persona(1000000)
+
+    @classmethod
+    def curso(cls, **kwargs):
+        datos = dict(
+            usu_id=cls.usuario, tcu_id=cls.tipo, per_id_responsable=cls.responsable, car_id_responsable=cls.cargo,
+            cur_fecha_hora=timezone.now(), cur_fecha_solicitud=timezone.now(), cur_administra=1,
+            cur_cuota_con_almuerzo=10000, cur_cuota_sin_almuerzo=8000, cur_modalidad=1, cur_tipo_curso=1, cur_estado=1,
+        )
+        datos.update(kwargs)
+        return Curso.objects.create(**datos)
+
+    @classmethod
+    def curso_con_seccion(cls, cupo=2, **kwargs):
+        return CursoSeccion.objects.create(cur_id=cls.curso(**kwargs), ram_id=cls.rama, cus_seccion=1, cus_cant_participante=cupo)
+
+    @classmethod
+    def persona(cls, run, **kwargs):
+        datos = dict(
+            esc_id=cls.estado_civil, com_id=cls.comuna, usu_id=cls.usuario, per_fecha_hora=timezone.now(), per_run=run,
+            per_dv='0', per_apelpat='Pérez', per_nombres='Juan', per_email='jp@mail.cl', per_fecha_nac=timezone.now(),
+            per_direccion='Calle 1', per_tipo_fono=2, per_fono='912345678', per_apodo='', per_vigente=True,
+        )
+        datos.update(kwargs)
+        return Persona.objects.create(**datos)
+
+    def inscribir(self, i, **kwargs):
+        return inscribir(self.personas[i], self.seccion, self.rol, self.alimentacion, self.usuario, estado=INSCRITO, **kwargs)
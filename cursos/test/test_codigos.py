@@ -0,0 +1,25 @@
+from django.test import TestCase
+from django.utils import timezone
+
+from cursos.codigos import formatear_codigo
+from cursos.test.datos import DatosCurso
+
+
+class CodigoCursoTests(DatosCurso, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.crear_maestros()
+
+    def crear(self, codigo=''):
+        return self.curso(cur_codigo=codigo)
+
+    def test_codigo_en_blanco_se_asigna(self):
+        anio = timezone.localdate().year
+        self.assertEqual([self.crear().cur_codigo for _ in range(2)], [formatear_codigo(anio, 1), formatear_codigo(anio, 2)])
+
+    def test_codigo_manual_adelanta_el_contador(self):
+        anio = timezone.localdate().year
+        self.crear(formatear_codigo(anio, 40))
+        self.crear('ESPECIAL')
+        self.assertEqual(self.crear().cur_codigo, formatear_codigo(anio, 41))
@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+from django.http import Http404, StreamingHttpResponse
+from django.test import RequestFactory, TestCase
+
+from cursos.models import PersonaCurso
+from cursos.test.datos import DatosCurso
+from cursos.views import ENCABEZADO_INSCRITOS, exportar_inscritos
+from personas.test.test_exportacion import leer_csv, leer_xlsx
+
+
+class ExportarInscritosTests(DatosCurso, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.otro_curso = cls.curso_con_seccion()
+
+    def setUp(self):
+        acreditada = self.inscribir(0)
+        self.inscribir(1)
+        PersonaCurso.objects.filter(pk=acreditada.pk).update(pec_acreditado=True)
+
+    def exportar(self, cur_id, formato):
+        request = RequestFactory().get(f'/api/cursos/{cur_id}/inscritos.{formato}')
+        request.user = SimpleNamespace(is_active=True, is_staff=True)
+        return exportar_inscritos(request, cur_id, formato)
+
+    def test_csv_solo_con_el_curso_pedido(self):
+        respuesta = self.exportar(self.seccion.cur_id_id, 'csv')
+        self.assertIsInstance(respuesta, StreamingHttpResponse)
+        self.assertIn(f'inscritos_curso_{self.seccion.cur_id_id}.csv', respuesta['Content-Disposition'])
+        filas = leer_csv(respuesta)
+        self.assertEqual(filas[0], list(ENCABEZADO_INSCRITOS))
+        self.assertEqual(sorted((fila[1], fila[8], fila[9], fila[10]) for fila in filas[1:]), [
+            ('2.000.000-0', 'Participante', 'Normal', 'Sí'),
+            ('2.000.001-0', 'Participante', 'Normal', 'No'),
+        ])
+        self.assertEqual(leer_csv(self.exportar(self.otro_curso.cur_id_id, 'csv')), [list(ENCABEZADO_INSCRITOS)])
+
+    def test_xlsx_se_abre_con_las_mismas_filas(self):
+        filas = leer_xlsx(self.exportar(self.seccion.cur_id_id, 'xlsx'))
+        self.assertEqual(filas[0], list(ENCABEZADO_INSCRITOS))
+        self.assertEqual(len(filas), 3)
+        self.assertEqual({fila[0] for fila in filas[1:]}, {1})
+
+    def test_formato_no_soportado(self):
+        with self.assertRaises(Http404):
+            self.exportar(self.seccion.cur_id_id, 'pdf')
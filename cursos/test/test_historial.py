@@ -0,0 +1,32 @@
+import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+
+from cursos.historial import historial_de
+from cursos.models import CursoFecha, CursoFormador
+from cursos.test.datos import DatosCurso
+
+
+class FechaHistorialTests(DatosCurso, TestCase):
+
+    def agregar_fecha(self, dias):
+        inicio = timezone.now() + datetime.timedelta(days=dias)
+        return CursoFecha.objects.create(
+            cur_id_id=self.seccion.cur_id_id, cuf_fecha_inicio=inicio, cuf_fecha_termino=inicio, cuf_tipo=1,
+        )
+
+    def fecha(self):
+        return historial_de(self.personas[0].pk).get().hif_fecha
+
+    def test_fechas_agregadas_despues_del_formador(self):
+        CursoFormador.objects.create(
+            cur_id_id=self.seccion.cur_id_id, per_id=self.personas[0], rol_id=self.rol, cus_id=self.seccion, cuo_director=False,
+        )
+        self.assertIsNone(self.fecha())
+        segunda = self.agregar_fecha(10)
+        self.assertEqual(self.fecha(), segunda.cuf_fecha_inicio)
+        primera = self.agregar_fecha(3)
+        self.assertEqual(self.fecha(), primera.cuf_fecha_inicio)
+        primera.delete()
+        self.assertEqual(self.fecha(), segunda.cuf_fecha_inicio)
@@ -0,0 +1,146 @@
+import datetime
+import threading
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from cursos.estados import ANULADO, AVISADO, ESTADOS_CON_CUPO, INSCRITO, LISTA_ESPERA, SOBRECUPO
+from cursos.inscripciones import anular, cambiar_estado, recalcular_cupos
+from cursos.models import CursoSeccion, PersonaCurso, PersonaEstadoCurso
+from cursos.tablero import PREFIJO_VERSION, tablero_curso
+from cursos.test.datos import DatosCurso
+from maestros.catalogo import expirar_versiones, version
+
+
+class CuposTests(DatosCurso, TestCase):
+
+    def ocupados(self):
+        self.seccion.refresh_from_db()
+        return self.seccion.cus_ocupados
+
+    def test_seccion_llena_pasa_a_lista_de_espera(self):
+        estados = [self.inscribir(i).pec_estado for i in range(3)]
+        self.assertEqual(estados, [INSCRITO, INSCRITO, LISTA_ESPERA])
+        self.assertEqual(self.ocupados(), 2)
+
+    def test_anular_promueve_a_la_primera_en_espera(self):
+        primera = self.inscribir(0)
+        self.inscribir(1)
+        en_espera = [self.inscribir(2), self.inscribir(3)]
+        anular(primera, self.usuario)
+        estados = [PersonaCurso.objects.get(pk=i.pk).pec_estado for i in en_espera]
+        self.assertEqual(estados, [AVISADO, LISTA_ESPERA])
+        self.assertEqual(self.ocupados(), 2)
+
+    def test_candidata_con_estado_futuro_no_traba_la_promocion(self):
+        primera = self.inscribir(0)
+        self.inscribir(1)
+        en_espera = self.inscribir(2)
+        # Un estado importado con fecha futura hace fallar siempre su promoción
+        PersonaEstadoCurso.objects.create(
+            usu_id=self.usuario, pec_id=en_espera, peu_fecha_hora=timezone.now() + datetime.timedelta(days=1),
+            peu_estado=LISTA_ESPERA, peu_vigente=True,
+        )
+        anular(primera, self.usuario)
+        en_espera.refresh_from_db()
+        self.assertEqual(en_espera.pec_estado, LISTA_ESPERA)
+        self.assertEqual(self.ocupados(), 1)
+
+    def test_sobrecupo_fuerza_el_cupo(self):
+        self.inscribir(0)
+        self.inscribir(1)
+        self.assertEqual(self.inscribir(2, sobrecupo=True).pec_estado, SOBRECUPO)
+        self.assertEqual(self.ocupados(), 3)
+
+    def test_borrar_inscripcion_devuelve_el_cupo(self):
+        self.inscribir(0).delete()
+        self.assertEqual(self.ocupados(), 0)
+        self.inscribir(1)
+        recalcular_cupos()
+        self.assertEqual(self.ocupados(), 1)
+
+    def test_fecha_anterior_al_estado_actual_se_rechaza(self):
+        inscripcion = self.inscribir(0)
+        with self.assertRaises(ValueError):
+            cambiar_estado(inscripcion, ANULADO, self.usuario, fecha=inscripcion.pec_estado_fecha - datetime.timedelta(days=1))
+        inscripcion.refresh_from_db()
+        self.assertEqual(inscripcion.pec_estado, INSCRITO)
+        self.assertEqual(self.ocupados(), 1)
+
+
+class TableroTests(DatosCurso, TestCase):
+
+    def version(self, seccion):
+        expirar_versiones()
+        return version(f'{PREFIJO_VERSION}{seccion.cur_id_id}')
+
+    def test_inscribir_invalida_solo_el_tablero_de_su_curso(self):
+        otra = self.curso_con_seccion()
+        antes = self.version(self.seccion), self.version(otra)
+        self.assertEqual(tablero_curso(self.seccion.cur_id_id)[0]['ocupados'], 0)
+        self.inscribir(0)
+        self.assertGreater(self.version(self.seccion), antes[0])
+        self.assertEqual(self.version(otra), antes[1])
+        self.assertEqual(tablero_curso(self.seccion.cur_id_id)[0]['ocupados'], 1)
+
+
+class CuposConcurrentesTests(DatosCurso, TransactionTestCase):
+    """Varios hilos (cada uno con su conexión) inscriben y anulan en la misma sección."""
+
+    HILOS = 4
+    POR_HILO = 5
+    CUPO = 6
+
+    def setUp(self):
+        self.crear_maestros()
+        self.seccion = self.curso_con_seccion(cupo=self.CUPO)
+        self.personas = [self.persona(2000000 + i) for i in range(self.HILOS * self.POR_HILO)]
+
+    def en_hilos(self, tareas):
+        errores = []
+
+        def trabajar(lote):
+            try:
+                for tarea in lote:
+                    tarea()
+            except Exception as error:
+                errores.append(error)
+            finally:
+                connection.close()
+
+        hilos = [threading.Thread(target=trabajar, args=(tareas[i::self.HILOS],)) for i in range(self.HILOS)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        self.assertEqual(errores, [])
+
+    def verificar_cupos(self):
+        seccion = CursoSeccion.objects.get(pk=self.seccion.pk)
+        ocupadas = PersonaCurso.objects.filter(cus_id=seccion, pec_estado__in=ESTADOS_CON_CUPO).count()
+        self.assertEqual(seccion.cus_ocupados, ocupadas)
+        self.assertLessEqual(seccion.cus_ocupados, seccion.cus_cant_participante)
+        self.assertEqual(seccion.cur_id.cur_ocupados, ocupadas)
+        return seccion
+
+    def test_inscripciones_y_anulaciones_concurrentes(self):
+        self.en_hilos([lambda i=i: self.inscribir(i) for i in range(len(self.personas))])
+        self.assertEqual(self.verificar_cupos().cus_ocupados, self.CUPO)
+        estados = list(PersonaCurso.objects.values_list('pec_estado', flat=True))
+        self.assertEqual(estados.count(INSCRITO), self.CUPO)
+        self.assertEqual(estados.count(LISTA_ESPERA), len(self.personas) - self.CUPO)
+
+        # Cada anulación promueve a alguien de la lista de espera
+        inscritas = list(PersonaCurso.objects.filter(pec_estado=INSCRITO))[:self.HILOS]
+        self.en_hilos([lambda p=p: anular(p, self.usuario) for p in inscritas])
+        self.assertEqual(self.verificar_cupos().cus_ocupados, self.CUPO)
+        self.assertEqual(PersonaCurso.objects.filter(pec_estado=AVISADO).count(), self.HILOS)
+
+    def test_sobrecupo_concurrente(self):
+        self.en_hilos([lambda i=i: self.inscribir(i, sobrecupo=True) for i in range(len(self.personas))])
+        seccion = CursoSeccion.objects.get(pk=self.seccion.pk)
+        estados = list(PersonaCurso.objects.values_list('pec_estado', flat=True))
+        self.assertEqual(estados.count(INSCRITO), self.CUPO)
+        self.assertEqual(estados.count(SOBRECUPO), len(self.personas) - self.CUPO)
+        self.assertEqual(seccion.cus_ocupados, len(self.personas))
@@ -0,0 +1,28 @@
+from cursos.intervalos import IndiceIntervalos, Periodo, solapamientos
+
+
+def test_solapamientos_por_dueno():
+    periodos = [
+        Periodo(1, 0, 10, 'a'),
+        Periodo(1, 5, 15, 'b'),
+        Periodo(1, 10, 20, 'c'),  # empieza cuando termina 'a': no se cruzan
+        Periodo(1, 30, 40, 'd'),
+        Periodo(2, 0, 100, 'e'),
+        Periodo(2, 50, 60, 'f'),
+        Periodo(3, 8, 8, 'g'),  # vacío
+    ]
+    pares = {(a.dato, b.dato) for a, b in solapamientos(periodos)}
+    assert pares == {('a', 'b'), ('b', 'c'), ('e', 'f')}
+
+
+def test_indice_intervalos_cruces():
+    indice = IndiceIntervalos([
+        Periodo(1, 0, 100, 'largo'),
+        Periodo(1, 10, 20, 'a'),
+        Periodo(1, 30, 40, 'b'),
+        Periodo(1, 120, 130, 'c'),
+    ])
+    assert [p.dato for p in indice.cruces(15, 35)] == ['largo', 'a', 'b']
+    assert [p.dato for p in indice.cruces(100, 120)] == []
+    assert [p.dato for p in indice.cruces(125, 200)] == ['c']
+    assert indice.cruces(50, 50) == []
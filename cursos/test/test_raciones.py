@@ -0,0 +1,56 @@
+import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+
+from cursos.estados import ANULADO, INSCRITO
+from cursos.models import CursoAlimentacion, CursoSeccion, PersonaCurso
+from cursos.raciones import plan_raciones, totales_por_modalidad
+from cursos.test.datos import DatosCurso
+from maestros.models import Alimentacion
+
+
+class PlanRacionesTests(DatosCurso, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.crear_maestros()
+        # Ids elegidos para que curso * (mayor dieta con servicio + 1) + dieta choque entre cursos:
+        # 10 * 2 + 3 == 11 * 2 + 1
+        cls.normal = cls.alimentacion
+        cls.vegana = Alimentacion.objects.create(ali_id=3, ali_descripcion='Vegana', ali_tipo=1, ali_vigente=True)
+        cls.dia = timezone.make_aware(datetime.datetime(2026, 1, 10, 12))
+        cls.cursos = {}
+        for cur_id, modalidad in ((10, 1), (11, 2)):
+            cls.cursos[cur_id] = cls.curso(
+                cur_id=cur_id, cur_fecha_hora=cls.dia, cur_fecha_solicitud=cls.dia, cur_modalidad=modalidad,
+            )
+        seccion = CursoSeccion.objects.create(cur_id=cls.cursos[10], ram_id=cls.rama, cus_seccion=1, cus_cant_participante=30)
+        # Curso 10: 4 inscritos normales (uno anulado) y 5 veganos sin servicio vegano
+        for i, (dieta, estado) in enumerate([(cls.normal, INSCRITO)] * 3 + [(cls.normal, ANULADO)] + [(cls.vegana, INSCRITO)] * 5):
+            PersonaCurso.objects.create(
+                per_id=cls.persona(2000000 + i), cus_id=seccion, rol_id=cls.rol, ali_id=dieta,
+                pec_registro=False, pec_acreditado=False, pec_estado=estado,
+            )
+        for cur_id, tiempo, adicional in ((10, 2, 1), (11, 2, 2), (11, 4, 0)):
+            CursoAlimentacion.objects.create(
+                cur_id=cls.cursos[cur_id], ali_id=cls.normal, cua_fecha=cls.dia, cua_tiempo=tiempo,
+                cua_descripcion='Servicio', cua_cantidad_adicional=adicional, cua_vigente=True,
+            )
+
+    def test_plan_por_curso_dia_y_tiempo(self):
+        plan = plan_raciones()
+        filas = {
+            (int(c), int(t)): fila.tolist()
+            for c, t, fila in zip(plan.cur_id, plan.tiempo, plan.matriz)
+        }
+        self.assertEqual(plan.dietas.tolist(), [1])
+        # Los veganos del curso 10 no se cuentan en el servicio normal del curso 11
+        self.assertEqual(filas, {(10, 2): [4], (11, 2): [2], (11, 4): [0]})
+        self.assertEqual({str(f) for f in plan.fecha}, {'2026-01-10'})
+
+    def test_totales_por_modalidad(self):
+        grupos, matriz = totales_por_modalidad(plan_raciones())
+        totales = dict(zip(grupos, matriz[:, 0].tolist()))
+        dia = datetime.date(2026, 1, 10)
+        self.assertEqual(totales, {(dia, 2, 1): 4, (dia, 2, 2): 2, (dia, 4, 2): 0})
@@ -0,0 +1,23 @@
+import datetime
+from decimal import Decimal
+
+from cursos.tramos import CON_ALMUERZO, SIN_ALMUERZO, armar_programa, valor_en
+
+
+def test_valor_por_tramo_y_cuota_base():
+    abril, mayo = datetime.datetime(2025, 4, 30), datetime.datetime(2025, 5, 31)
+    programa = armar_programa(
+        [
+            (CON_ALMUERZO, mayo, Decimal('30000')),
+            (CON_ALMUERZO, abril, Decimal('25000')),
+            (SIN_ALMUERZO, abril, Decimal('15000')),
+        ],
+        {CON_ALMUERZO: Decimal('35000'), SIN_ALMUERZO: Decimal('20000')},
+    )
+    assert valor_en(programa, CON_ALMUERZO, datetime.datetime(2025, 3, 1)) == Decimal('25000')
+    # La fecha límite es inclusiva
+    assert valor_en(programa, CON_ALMUERZO, abril) == Decimal('25000')
+    assert valor_en(programa, CON_ALMUERZO, datetime.datetime(2025, 5, 1)) == Decimal('30000')
+    assert valor_en(programa, CON_ALMUERZO, datetime.datetime(2025, 6, 1)) == Decimal('35000')
+    assert valor_en(programa, SIN_ALMUERZO, datetime.datetime(2025, 5, 1)) == Decimal('20000')
+    assert valor_en(programa, 3, abril) is None
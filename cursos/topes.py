@@ -0,0 +1,79 @@
+"""
+Topes de horario: personas asignadas a cursos cuyas fechas (curso_fecha) se cruzan.
+
+Cada asignación de una persona a un curso (formador, coordinador o
+participante con cupo) se expande a un periodo por cada CursoFecha del
+curso, leyendo solo las columnas necesarias. Los solapamientos de toda una
+temporada salen de un barrido ordenado (cursos.intervalos.solapamientos);
+para validar una asignación nueva se arma el índice de la persona y se
+consulta cada fecha del curso con búsqueda binaria. Los cruces entre fechas
+del mismo curso no son topes.
+"""
+from collections import namedtuple
+
+from django.db.models import Q
+
+from cursos.estados import CURSO_ANULADO, ESTADOS_CON_CUPO
+from cursos.intervalos import IndiceIntervalos, Periodo, solapamientos
+from cursos.models import CursoCoordinador, CursoFecha, CursoFormador, PersonaCurso
+
+# Origen de un periodo: tipo de asignación, curso y fecha del curso
+Asignacion = namedtuple('Asignacion', 'tipo cur_id cuf_id')
+
+# tipo -> (modelo, camino al curso, filtro adicional)
+FUENTES = {
+    'formador': (CursoFormador, 'cur_id', Q()),
+    'coordinador': (CursoCoordinador, 'cur_id', Q()),
+    'participante': (PersonaCurso, 'cus_id__cur_id', Q(pec_estado__in=ESTADOS_CON_CUPO)),
+}
+
+
+def periodos(desde=None, hasta=None, per_ids=None, excluir_cur_id=None):
+    """Periodos (Periodo con dato Asignacion) de las asignaciones a cursos no anulados."""
+    for tipo, (modelo, curso, filtro) in FUENTES.items():
+        fecha = f'{curso}__cursofecha'
+        filas = modelo.objects.filter(filtro, **{f'{fecha}__isnull': False}).exclude(**{f'{curso}__cur_estado': CURSO_ANULADO})
+        if desde is not None:
+            filas = filas.filter(**{f'{fecha}__cuf_fecha_termino__gt': desde})
+        if hasta is not None:
+            filas = filas.filter(**{f'{fecha}__cuf_fecha_inicio__lt': hasta})
+        if per_ids is not None:
+            filas = filas.filter(per_id__in=per_ids)
+        if excluir_cur_id is not None:
+            filas = filas.exclude(**{curso: excluir_cur_id})
+        # distinct: un formador puede estar en varias secciones del mismo curso
+        filas = filas.order_by().values_list(
+            'per_id', f'{fecha}__cuf_fecha_inicio', f'{fecha}__cuf_fecha_termino', curso, f'{fecha}__cuf_id',
+        ).distinct()
+        for per_id, inicio, termino, cur_id, cuf_id in filas.iterator(chunk_size=5000):
+            yield Periodo(per_id, inicio, termino, Asignacion(tipo, cur_id, cuf_id))
+
+
+def topes(desde=None, hasta=None, per_ids=None):
+    """
+    Pares de periodos (a, b) de la misma persona en cursos distintos que se
+    cruzan, ordenados por persona e inicio.
+    """
+    return [(a, b) for a, b in solapamientos(periodos(desde, hasta, per_ids)) if a.dato.cur_id != b.dato.cur_id]
+
+
+def agenda(desde=None, hasta=None, per_ids=None):
+    """{per_id: IndiceIntervalos} para validar muchas asignaciones con una sola lectura."""
+    por_persona = {}
+    for periodo in periodos(desde, hasta, per_ids):
+        por_persona.setdefault(periodo.dueno, []).append(periodo)
+    return {per_id: IndiceIntervalos(lista) for per_id, lista in por_persona.items()}
+
+
+def topes_asignacion(per_id, cur_id, indice=None):
+    """
+    Cruces que produciría asignar la persona al curso: [(CursoFecha nueva
+    como (cuf_id, inicio, termino), Periodo existente)]. indice puede venir
+    de agenda(); si no, se lee de la BD solo lo de la persona.
+    """
+    if indice is None:
+        indice = IndiceIntervalos(periodos(per_ids=[per_id], excluir_cur_id=cur_id))
+    cruces = []
+    for fecha in CursoFecha.objects.filter(cur_id=cur_id).values_list('cuf_id', 'cuf_fecha_inicio', 'cuf_fecha_termino'):
+        cruces.extend((fecha, periodo) for periodo in indice.cruces(fecha[1], fecha[2]) if periodo.dato.cur_id != cur_id)
+    return cruces
@@ -0,0 +1,43 @@
+"""
+Tramos de precio de un curso, sin acceso a la BD.
+
+Cada cuota (curso_cuota) es un tramo: su valor rige para inscripciones hasta
+cuu_fecha (inclusive). Para un instante se usa el tramo con la primera fecha
+límite que no haya pasado; después del último tramo rige la cuota base del
+curso (cur_cuota_con_almuerzo o cur_cuota_sin_almuerzo). Las fechas de cada
+tipo se guardan ordenadas y la búsqueda es binaria.
+"""
+from bisect import bisect_left
+from collections import namedtuple
+
+# curso_cuota.cuu_tipo (y alimentacion.ali_tipo)
+CON_ALMUERZO = 1
+SIN_ALMUERZO = 2
+
+# limites: {tipo: fechas límite ordenadas}; valores: {tipo: valores en el mismo orden}; base: {tipo: valor sin tramo}
+Programa = namedtuple('Programa', 'limites valores base')
+
+
+def armar_programa(cuotas, base):
+    """
+    Programa a partir de cuotas (tipo, fecha límite, valor) y de la cuota base
+    por tipo. Si dos cuotas del mismo tipo tienen la misma fecha, vale la última.
+    """
+    por_tipo = {}
+    for tipo, fecha, valor in cuotas:
+        por_tipo.setdefault(tipo, {})[fecha] = valor
+    limites, valores = {}, {}
+    for tipo, tramos in por_tipo.items():
+        fechas = sorted(tramos)
+        limites[tipo] = tuple(fechas)
+        valores[tipo] = tuple(tramos[f] for f in fechas)
+    return Programa(limites, valores, dict(base))
+
+
+def valor_en(programa, tipo, instante):
+    """Valor que rige para el tipo en el instante, o None si el curso no tiene precio para ese tipo."""
+    fechas = programa.limites.get(tipo, ())
+    i = bisect_left(fechas, instante)
+    if i < len(fechas):
+        return programa.valores[tipo][i]
+    return programa.base.get(tipo)
@@ -0,0 +1,12 @@
+from django.urls import path
+
+from cursos import views
+
+app_name = 'cursos'
+
+urlpatterns = [
+    path('tablero/', views.tablero, name='tablero_vigentes'),
+    path('<int:cur_id>/tablero/', views.tablero, name='tablero'),
+    path('<int:cur_id>/inscritos.<slug:formato>', views.exportar_inscritos, name='exportar_inscritos'),
+    path('raciones.<slug:formato>', views.exportar_raciones, name='exportar_raciones'),
+]
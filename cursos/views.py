@@ -1,3 +1,89 @@
-from django.shortcuts import render
+import datetime
 
-# Create your views here.
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import Http404, HttpResponseBadRequest, JsonResponse
+from django.utils import timezone
+from django.views.decorators.http import require_safe
+
+from cursos.models import Curso, PersonaCurso
+from cursos.raciones import encabezado_plan, filas_plan, plan_raciones
+from cursos.tablero import tablero_curso, tableros_vigentes
+from maestros.models import Alimentacion
+from personas.exportacion import FORMATOS_EXPORTACION, TAMANO_BLOQUE, respuesta_exportacion
+from personas.run import formatear_run
+
+ENCABEZADO_INSCRITOS = ('Sección', 'RUN', 'Apellido paterno', 'Apellido materno', 'Nombres', 'Email', 'Teléfono', 'Comuna', 'Rol', 'Alimentación', 'Acreditado')
+
+
+def filas_inscritos(inscripciones):
+    """Una fila por inscripción (queryset de PersonaCurso), leyendo solo las columnas exportadas."""
+    inscripciones = inscripciones.select_related('cus_id', 'per_id__com_id', 'rol_id', 'ali_id').only(
+        'pec_acreditado', 'cus_id__cus_seccion', 'per_id__per_run', 'per_id__per_dv', 'per_id__per_apelpat',
+        'per_id__per_apelmat', 'per_id__per_nombres', 'per_id__per_email', 'per_id__per_fono',
+        'per_id__com_id__com_descripcion', 'rol_id__rol_descripcion', 'ali_id__ali_descripcion',
+    )
+    for inscripcion in inscripciones.iterator(chunk_size=TAMANO_BLOQUE):
+        persona = inscripcion.per_id
+        yield (
+            inscripcion.cus_id.cus_seccion,
+            formatear_run(persona.per_run, persona.per_dv),
+            persona.per_apelpat,
+            persona.per_apelmat or '',
+            persona.per_nombres,
+            persona.per_email,
+            persona.per_fono,
+            persona.com_id.com_descripcion,
+            inscripcion.rol_id.rol_descripcion,
+            inscripcion.ali_id.ali_descripcion,
+            'Sí' if inscripcion.pec_acreditado else 'No',
+        )
+
+
+@staff_member_required
+@require_safe
+def exportar_inscritos(request, cur_id, formato):
+    """Nómina de inscritos de un curso (todas sus secciones) en CSV o XLSX, con memoria constante."""
+    if formato not in FORMATOS_EXPORTACION:
+        raise Http404("Formato no soportado")
+    inscripciones = PersonaCurso.objects.filter(cus_id__cur_id=cur_id).order_by(
+        'cus_id__cus_seccion', 'per_id__per_apelpat', 'per_id__per_nombres', 'pec_id',
+    )
+    return respuesta_exportacion(formato, f'inscritos_curso_{cur_id}', ENCABEZADO_INSCRITOS, filas_inscritos(inscripciones))
+
+
+@staff_member_required
+@require_safe
+def tablero(request, cur_id=None):
+    """Inscripciones por estado y cupo de cada sección, de un curso o de todos los vigentes."""
+    if cur_id is not None:
+        return JsonResponse({'cur_id': cur_id, 'secciones': tablero_curso(cur_id)})
+    cursos = [{'cur_id': cur_id, 'secciones': secciones} for cur_id, secciones in tableros_vigentes().items()]
+    return JsonResponse({'cursos': cursos})
+
+
+def _fecha(request, nombre):
+    valor = request.GET.get(nombre)
+    if not valor:
+        return None
+    return timezone.make_aware(datetime.datetime.combine(datetime.date.fromisoformat(valor), datetime.time()))
+
+
+@staff_member_required
+@require_safe
+def exportar_raciones(request, formato):
+    """
+    Plan de raciones en CSV o XLSX: una fila por curso, día y tiempo con las
+    raciones de cada dieta. Parámetros: curso (uno o varios cur_id; por
+    defecto todos), desde y hasta (AAAA-MM-DD, hasta exclusivo).
+    """
+    if formato not in FORMATOS_EXPORTACION:
+        raise Http404("Formato no soportado")
+    try:
+        cur_ids = [int(valor) for valor in request.GET.getlist('curso')] or None
+        desde, hasta = _fecha(request, 'desde'), _fecha(request, 'hasta')
+    except ValueError:
+        return HttpResponseBadRequest("Parámetros de exportación inválidos")
+    plan = plan_raciones(desde, hasta, cur_ids)
+    codigos = dict(Curso.objects.filter(pk__in=plan.cur_id.tolist()).values_list('cur_id', 'cur_codigo'))
+    dietas = dict(Alimentacion.objects.filter(pk__in=plan.dietas.tolist()).values_list('ali_id', 'ali_descripcion'))
+    return respuesta_exportacion(formato, 'raciones', encabezado_plan(plan, dietas), filas_plan(plan, codigos))
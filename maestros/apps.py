@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class MastersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "maestros"
+
+    def ready(self):
+        # Registra la invalidación de catálogos en save/delete
+        from maestros import signals  # noqa: F401
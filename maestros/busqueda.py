@@ -0,0 +1,55 @@
+"""
+Búsqueda tipo typeahead de comunas y grupos.
+
+Los índices se construyen en memoria desde la caché de catálogos y se
+reconstruyen solos cuando cambia la versión de alguna tabla involucrada.
+"""
+from maestros.catalogo import derivado, obtener_catalogo
+from maestros.models import Region, Provincia, Comuna, Zona, Distrito, Grupo
+from maestros.texto import IndicePrefijos
+
+
+def _indice(modelo, campo):
+    return IndicePrefijos((fila[0], getattr(fila, campo)) for fila in obtener_catalogo(modelo).vigentes)
+
+
+def indice_comunas():
+    return derivado('indice_comunas', (Comuna,), lambda: _indice(Comuna, 'com_descripcion'))
+
+
+def indice_grupos():
+    return derivado('indice_grupos', (Grupo,), lambda: _indice(Grupo, 'gru_descripcion'))
+
+
+def buscar_comunas(consulta, limite=10):
+    """Comunas vigentes cuyo nombre empieza (o tiene una palabra que empieza) por la consulta."""
+    comunas = obtener_catalogo(Comuna)
+    provincias = obtener_catalogo(Provincia)
+    regiones = obtener_catalogo(Region)
+    resultado = []
+    for com_id in indice_comunas().buscar(consulta, limite):
+        comuna = comunas[com_id]
+        provincia = provincias[comuna.pro_id]
+        resultado.append({
+            'id': com_id,
+            'descripcion': comuna.com_descripcion,
+            'ruta': [regiones[provincia.reg_id].reg_descripcion, provincia.pro_descripcion],
+        })
+    return resultado
+
+
+def buscar_grupos(consulta, limite=10):
+    """Grupos vigentes cuyo nombre empieza (o tiene una palabra que empieza) por la consulta."""
+    grupos = obtener_catalogo(Grupo)
+    distritos = obtener_catalogo(Distrito)
+    zonas = obtener_catalogo(Zona)
+    resultado = []
+    for gru_id in indice_grupos().buscar(consulta, limite):
+        grupo = grupos[gru_id]
+        distrito = distritos[grupo.dis_id]
+        resultado.append({
+            'id': gru_id,
+            'descripcion': grupo.gru_descripcion,
+            'ruta': [zonas[distrito.zon_id].zon_descripcion, distrito.dis_descripcion],
+        })
+    return resultado
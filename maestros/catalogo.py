@@ -0,0 +1,194 @@
+"""
+Caché por proceso de las tablas maestras (catálogos).
+
+Cada catálogo se carga una sola vez por proceso en una estructura inmutable
+(tupla de namedtuples más un índice por id). La vigencia de la copia local se
+controla con la tabla catalogo_version: cada guardado o borrado de una fila
+maestra incrementa la versión de su tabla, y todos los procesos detectan el
+cambio en su siguiente verificación de versiones (como máximo cada
+CATALOGO_VERSION_TTL segundos).
+"""
+import threading
+import time
+from collections import namedtuple
+from types import MappingProxyType
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from maestros.managers import campo_vigente
+from maestros.models import (
+    Region, Provincia, Comuna, Zona, Distrito, Grupo, EstadoCivil, Cargo, Nivel, Rama, Rol,
+    TipoArchivo, TipoCurso, Alimentacion, ConceptoContable, CatalogoVersion,
+)
+
+# Modelos maestros que se sirven desde la caché
+MODELOS_CATALOGO = (
+    Region, Provincia, Comuna, Zona, Distrito, Grupo, EstadoCivil, Cargo, Nivel, Rama, Rol,
+    TipoArchivo, TipoCurso, Alimentacion, ConceptoContable,
+)
+
+# Segundos durante los que se confía en las versiones leídas sin volver a consultar la BD
+CATALOGO_VERSION_TTL = 5
+
+_lock = threading.RLock()
+_catalogos = {}
+_tipos_fila = {}
+_versiones = {}
+_versiones_leidas = None
+
+
+class Catalogo:
+    """
+    Copia inmutable de una tabla maestra.
+
+    Las filas son namedtuples cuyos campos llevan el nombre de la columna
+    (por ejemplo Provincia(pro_id, reg_id, pro_descripcion, pro_vigente)).
+    """
+    __slots__ = ('tabla', 'version', 'filas', 'por_id', 'vigentes')
+
+    def __init__(self, tabla, version, filas, campo_vigente):
+        self.tabla = tabla
+        self.version = version
+        # filas: todas las filas de la tabla, ordenadas por id
+        self.filas = tuple(filas)
+        # por_id: índice id -> fila (incluye filas no vigentes, que siguen referenciadas)
+        self.por_id = MappingProxyType({fila[0]: fila for fila in self.filas})
+        # vigentes: filas activas, en el mismo orden
+        self.vigentes = tuple(fila for fila in self.filas if getattr(fila, campo_vigente))
+
+    def get(self, pk, default=None):
+        return self.por_id.get(pk, default)
+
+    def __getitem__(self, pk):
+        return self.por_id[pk]
+
+    def __contains__(self, pk):
+        return pk in self.por_id
+
+    def __len__(self):
+        return len(self.filas)
+
+    def __repr__(self):
+        return f"<Catalogo {self.tabla} v{self.version}: {len(self.filas)} filas>"
+
+
+def _tipo_fila(modelo):
+    tipo = _tipos_fila.get(modelo)
+    if tipo is None:
+        # El id va primero para que Catalogo pueda indexar por fila[0]
+        campos = [modelo._meta.pk] + [c for c in modelo._meta.concrete_fields if not c.primary_key]
+        tipo = namedtuple(modelo.__name__, [c.column for c in campos])
+        tipo.atributos = tuple(c.attname for c in campos)
+        _tipos_fila[modelo] = tipo
+    return tipo
+
+
+def _ttl():
+    return getattr(settings, 'CATALOGO_VERSION_TTL', CATALOGO_VERSION_TTL)
+
+
+def versiones():
+    """Versiones conocidas de todos los catálogos (db_table -> versión)."""
+    global _versiones, _versiones_leidas
+    ahora = time.monotonic()
+    if _versiones_leidas is None or ahora - _versiones_leidas > _ttl():
+        _versiones = dict(CatalogoVersion.objects.values_list('cav_tabla', 'cav_version'))
+        _versiones_leidas = ahora
+    return _versiones
+
+
+def version(clave):
+    """Versión actual de una clave de catalogo_version (0 si nunca se ha incrementado)."""
+    return versiones().get(clave, 0)
+
+
+def version_catalogo(modelo):
+    """Versión actual del catálogo del modelo (0 si nunca se ha modificado)."""
+    return version(modelo._meta.db_table)
+
+
+def _cargar(modelo, version):
+    tipo = _tipo_fila(modelo)
+    filas = modelo._base_manager.order_by('pk').values_list(*tipo.atributos)
+    return Catalogo(modelo._meta.db_table, version, (tipo._make(f) for f in filas), campo_vigente(modelo))
+
+
+def obtener_catalogo(modelo):
+    """
+    Devuelve el Catalogo del modelo, recargándolo solo si su versión cambió.
+    """
+    tabla = modelo._meta.db_table
+    version = version_catalogo(modelo)
+    catalogo = _catalogos.get(tabla)
+    if catalogo is None or catalogo.version != version:
+        with _lock:
+            catalogo = _catalogos.get(tabla)
+            if catalogo is None or catalogo.version != version:
+                catalogo = _cargar(modelo, version)
+                _catalogos[tabla] = catalogo
+    return catalogo
+
+
+def obtener(modelo, pk, default=None):
+    """Fila del catálogo con id pk (vigente o no)."""
+    return obtener_catalogo(modelo).get(pk, default)
+
+
+def listar_vigentes(modelo):
+    """Filas vigentes del catálogo, ordenadas por id."""
+    return obtener_catalogo(modelo).vigentes
+
+
+def expirar_versiones():
+    """Obliga a releer las versiones en el próximo acceso de este proceso."""
+    global _versiones_leidas
+    _versiones_leidas = None
+
+
+def invalidar_version(clave):
+    """
+    Incrementa la versión de una clave de catalogo_version (el db_table de un
+    catálogo u otra clave, como la de un tablero de curso).
+
+    Se ejecuta dentro de la transacción que modificó los datos, de modo que la
+    nueva versión y las filas nuevas se hacen visibles juntas para los demás
+    procesos.
+    """
+    actualizados = CatalogoVersion.objects.filter(cav_tabla=clave).update(cav_version=F('cav_version') + 1)
+    if not actualizados:
+        _, creado = CatalogoVersion.objects.get_or_create(cav_tabla=clave, defaults={'cav_version': 1})
+        if not creado:
+            CatalogoVersion.objects.filter(cav_tabla=clave).update(cav_version=F('cav_version') + 1)
+    transaction.on_commit(expirar_versiones)
+
+
+def invalidar_catalogo(modelo):
+    """
+    Incrementa la versión del catálogo del modelo. Las operaciones masivas
+    (update, bulk_create) no disparan señales y deben llamar a esta función
+    explícitamente.
+    """
+    invalidar_version(modelo._meta.db_table)
+
+
+_derivados = {}
+
+
+def derivado(clave, modelos, construir):
+    """
+    Estructura calculada a partir de uno o más catálogos (índices, árboles).
+
+    construir() se ejecuta solo cuando cambia la versión de alguno de los
+    modelos indicados; mientras tanto se devuelve la misma instancia.
+    """
+    versiones_actuales = tuple(version_catalogo(m) for m in modelos)
+    guardado = _derivados.get(clave)
+    if guardado is None or guardado[0] != versiones_actuales:
+        with _lock:
+            guardado = _derivados.get(clave)
+            if guardado is None or guardado[0] != versiones_actuales:
+                guardado = (versiones_actuales, construir())
+                _derivados[clave] = guardado
+    return guardado[1]
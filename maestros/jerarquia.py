@@ -0,0 +1,173 @@
+"""
+Jerarquías materializadas de las tablas maestras.
+
+- Territorial (Región -> Provincia -> Comuna): tabla comuna_jerarquia.
+- Scout (Zona -> Distrito -> Grupo): tabla grupo_jerarquia.
+
+Cada tabla guarda, por hoja, su padre y su raíz, de modo que los filtros por
+región, zona o distrito se resuelven en SQL con un único IN indexado, sin unir
+tres tablas. En paralelo se mantiene un índice en memoria, construido desde la
+caché de catálogos, que responde ancestros y descendientes sin consultar la BD.
+"""
+from collections import defaultdict
+from types import MappingProxyType
+
+from django.db import transaction
+from django.dispatch import Signal
+
+from maestros.catalogo import derivado, obtener_catalogo
+from maestros.models import Provincia, Comuna, ComunaJerarquia, Distrito, Grupo, GrupoJerarquia
+
+# Se emite tras recalcular grupo_jerarquia (grupos que cambian de distrito o distritos de zona),
+# para que los datos desnormalizados por distrito/zona de otras apps se rehagan
+jerarquia_scout_modificada = Signal()
+
+
+class Jerarquia:
+    """Índice inmutable de una jerarquía de tres niveles (raíz -> padre -> hoja)."""
+    __slots__ = ('ancestros', 'hojas_por_padre', 'hojas_por_raiz')
+
+    def __init__(self, ancestros):
+        por_padre = defaultdict(set)
+        por_raiz = defaultdict(set)
+        for hoja, (padre, raiz) in ancestros.items():
+            por_padre[padre].add(hoja)
+            por_raiz[raiz].add(hoja)
+        # ancestros: hoja -> (padre, raiz)
+        self.ancestros = MappingProxyType(ancestros)
+        # hojas_por_padre / hojas_por_raiz: id -> frozenset de hojas
+        self.hojas_por_padre = MappingProxyType({k: frozenset(v) for k, v in por_padre.items()})
+        self.hojas_por_raiz = MappingProxyType({k: frozenset(v) for k, v in por_raiz.items()})
+
+
+def _construir(modelo_padre, modelo_hoja, campo_padre, campo_raiz):
+    padres = obtener_catalogo(modelo_padre)
+    ancestros = {}
+    for hoja in obtener_catalogo(modelo_hoja).filas:
+        padre = getattr(hoja, campo_padre)
+        ancestros[hoja[0]] = (padre, getattr(padres[padre], campo_raiz))
+    return Jerarquia(ancestros)
+
+
+# --- Región -> Provincia -> Comuna ---
+
+def jerarquia_territorial():
+    """Índice territorial vigente para las versiones actuales de los catálogos."""
+    return derivado('jerarquia_territorial', (Provincia, Comuna),
+                    lambda: _construir(Provincia, Comuna, 'pro_id', 'reg_id'))
+
+
+def ancestros_comuna(com_id):
+    """(pro_id, reg_id) de la comuna, o None si no existe."""
+    return jerarquia_territorial().ancestros.get(com_id)
+
+
+def region_de_comuna(com_id):
+    ancestros = ancestros_comuna(com_id)
+    return ancestros[1] if ancestros else None
+
+
+def comunas_de_provincia(pro_id):
+    return jerarquia_territorial().hojas_por_padre.get(pro_id, frozenset())
+
+
+def comunas_de_region(reg_id):
+    return jerarquia_territorial().hojas_por_raiz.get(reg_id, frozenset())
+
+
+def filtrar_por_region(queryset, campo, reg_id):
+    """
+    Filtra un queryset por la región de una FK a Comuna.
+
+    Ejemplo: filtrar_por_region(Persona.objects.all(), 'com_id', 5) o
+    filtrar_por_region(Curso.objects.all(), 'com_id_lugar', 5).
+    """
+    return queryset.filter(**{f'{campo}__in': comunas_de_region(reg_id)})
+
+
+def subconsulta_comunas_region(reg_id):
+    """Subconsulta SQL con las comunas de la región, para reportes del lado de la BD."""
+    return ComunaJerarquia.objects.filter(reg_id=reg_id).values('com_id')
+
+
+def sincronizar_comunas(com_ids=None):
+    """
+    Recalcula las filas de comuna_jerarquia: todas, o solo las de com_ids.
+    """
+    comunas = Comuna.objects.all()
+    existentes = ComunaJerarquia.objects.all()
+    if com_ids is not None:
+        comunas = comunas.filter(com_id__in=com_ids)
+        existentes = existentes.filter(com_id__in=com_ids)
+    filas = [
+        ComunaJerarquia(com_id_id=com_id, pro_id_id=pro_id, reg_id_id=reg_id)
+        for com_id, pro_id, reg_id in comunas.values_list('com_id', 'pro_id', 'pro_id__reg_id')
+    ]
+    with transaction.atomic():
+        existentes.delete()
+        ComunaJerarquia.objects.bulk_create(filas, batch_size=500)
+
+
+# --- Zona -> Distrito -> Grupo ---
+
+def jerarquia_scout():
+    """Índice zona/distrito/grupo vigente para las versiones actuales de los catálogos."""
+    return derivado('jerarquia_scout', (Distrito, Grupo),
+                    lambda: _construir(Distrito, Grupo, 'dis_id', 'zon_id'))
+
+
+def ancestros_grupo(gru_id):
+    """(dis_id, zon_id) del grupo, o None si no existe."""
+    return jerarquia_scout().ancestros.get(gru_id)
+
+
+def grupos_de_distrito(dis_id):
+    return jerarquia_scout().hojas_por_padre.get(dis_id, frozenset())
+
+
+def grupos_de_zona(zon_id):
+    return jerarquia_scout().hojas_por_raiz.get(zon_id, frozenset())
+
+
+def filtrar_por_distrito(queryset, campo, dis_id):
+    """Filtra un queryset por el distrito de una FK a Grupo (ej. PersonaGrupo 'gru_id')."""
+    return queryset.filter(**{f'{campo}__in': grupos_de_distrito(dis_id)})
+
+
+def filtrar_por_zona(queryset, campo, zon_id):
+    """Filtra un queryset por la zona de una FK a Grupo (ej. PersonaGrupo 'gru_id')."""
+    return queryset.filter(**{f'{campo}__in': grupos_de_zona(zon_id)})
+
+
+def subconsulta_grupos_distrito(dis_id):
+    return GrupoJerarquia.objects.filter(dis_id=dis_id).values('gru_id')
+
+
+def subconsulta_grupos_zona(zon_id):
+    return GrupoJerarquia.objects.filter(zon_id=zon_id).values('gru_id')
+
+
+def sincronizar_grupos(gru_ids=None):
+    """
+    Recalcula las filas de grupo_jerarquia: todas, o solo las de gru_ids.
+    """
+    grupos = Grupo.objects.all()
+    existentes = GrupoJerarquia.objects.all()
+    if gru_ids is not None:
+        grupos = grupos.filter(gru_id__in=gru_ids)
+        existentes = existentes.filter(gru_id__in=gru_ids)
+    filas = [
+        GrupoJerarquia(gru_id_id=gru_id, dis_id_id=dis_id, zon_id_id=zon_id)
+        for gru_id, dis_id, zon_id in grupos.values_list('gru_id', 'dis_id', 'dis_id__zon_id')
+    ]
+    with transaction.atomic():
+        existentes.delete()
+        GrupoJerarquia.objects.bulk_create(filas, batch_size=500)
+        jerarquia_scout_modificada.send(sender=GrupoJerarquia)
+
+
+def mover_distrito(dis_id, zon_id):
+    """Actualiza en un solo UPDATE la zona de todos los grupos de un distrito."""
+    with transaction.atomic():
+        GrupoJerarquia.objects.filter(dis_id=dis_id).update(zon_id=zon_id)
+        jerarquia_scout_modificada.send(sender=GrupoJerarquia)
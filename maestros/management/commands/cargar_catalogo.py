@@ -0,0 +1,171 @@
+import csv
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from maestros.catalogo import invalidar_catalogo
+from maestros.jerarquia import sincronizar_comunas, sincronizar_grupos
+from maestros.models import Region, Provincia, Comuna, Zona, Distrito, Grupo
+
+# tabla -> (modelo, prefijo de columnas, FK al padre, tabla padre, sincronización de jerarquía)
+TABLAS = {
+    'region': (Region, 'reg', None, None, None),
+    'provincia': (Provincia, 'pro', 'reg_id', 'region', sincronizar_comunas),
+    'comuna': (Comuna, 'com', 'pro_id', 'provincia', sincronizar_comunas),
+    'zona': (Zona, 'zon', None, None, None),
+    'distrito': (Distrito, 'dis', 'zon_id', 'zona', sincronizar_grupos),
+    'grupo': (Grupo, 'gru', 'dis_id', 'distrito', sincronizar_grupos),
+}
+
+VALORES_VERDADEROS = {'1', 'true', 't', 'si', 'sí', 's', 'x', 'yes', 'y'}
+
+
+def clave(texto):
+    """Clave natural normalizada: espacios colapsados y sin distinguir mayúsculas."""
+    return ' '.join(str(texto).split()).casefold()
+
+
+def leer_filas(ruta, delimitador):
+    """Genera un dict por fila leyendo el archivo de a una fila (.json se lee completo)."""
+    extension = ruta.suffix.lower()
+    if extension == '.csv':
+        with ruta.open(newline='', encoding='utf-8-sig') as archivo:
+            for fila in csv.DictReader(archivo, delimiter=delimitador):
+                yield fila
+    elif extension == '.jsonl':
+        with ruta.open(encoding='utf-8') as archivo:
+            for linea in archivo:
+                if linea.strip():
+                    yield json.loads(linea)
+    elif extension == '.json':
+        with ruta.open(encoding='utf-8') as archivo:
+            yield from json.load(archivo)
+    else:
+        raise CommandError(f"Formato no soportado: {extension} (use .csv, .json o .jsonl)")
+
+
+def a_booleano(valor, defecto):
+    if valor is None or str(valor).strip() == '':
+        return defecto
+    if isinstance(valor, bool):
+        return valor
+    return str(valor).strip().casefold() in VALORES_VERDADEROS
+
+
+class Command(BaseCommand):
+    help = (
+        "Carga o actualiza una tabla maestra (region, provincia, comuna, zona, distrito, grupo) "
+        "desde CSV/JSON con upserts por lotes. Columnas: descripcion, padre (descripción del "
+        "registro padre), vigente y, para zona, unilateral."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('tabla', choices=sorted(TABLAS))
+        parser.add_argument('archivo')
+        parser.add_argument('--lote', type=int, default=500, help="Filas por bulk_create/bulk_update")
+        parser.add_argument('--delimitador', default=',', help="Separador de columnas del CSV")
+        parser.add_argument('--simular', action='store_true', help="Procesa todo y revierte la transacción")
+
+    def handle(self, *args, **options):
+        modelo, prefijo, campo_padre, tabla_padre, sincronizar = TABLAS[options['tabla']]
+        ruta = Path(options['archivo'])
+        if not ruta.exists():
+            raise CommandError(f"No existe el archivo {ruta}")
+        lote = options['lote']
+
+        campo_descripcion = f'{prefijo}_descripcion'
+        campo_vigente = f'{prefijo}_vigente'
+        campos = [campo_descripcion, campo_vigente]
+        if campo_padre:
+            campos.append(campo_padre)
+        if modelo is Zona:
+            campos.append('zon_unilateral')
+
+        # Padres: descripción normalizada -> id (None si la descripción es ambigua)
+        padres = {}
+        if tabla_padre:
+            modelo_padre, prefijo_padre = TABLAS[tabla_padre][:2]
+            for pk, descripcion in modelo_padre.objects.values_list('pk', f'{prefijo_padre}_descripcion'):
+                padres[clave(descripcion)] = None if clave(descripcion) in padres else pk
+
+        # Existentes: (descripción normalizada, id padre) -> instancia
+        existentes = {}
+        for instancia in modelo.objects.only(*campos):
+            padre_id = getattr(instancia, f'{campo_padre}_id') if campo_padre else None
+            existentes[(clave(getattr(instancia, campo_descripcion)), padre_id)] = instancia
+
+        conteo = {'insertados': 0, 'actualizados': 0, 'sin_cambios': 0, 'errores': 0}
+        por_crear, por_actualizar = [], {}
+
+        def vaciar():
+            if por_crear:
+                modelo.objects.bulk_create(por_crear, batch_size=lote)
+                por_crear.clear()
+            if por_actualizar:
+                modelo.objects.bulk_update(list(por_actualizar.values()), campos, batch_size=lote)
+                por_actualizar.clear()
+
+        with transaction.atomic():
+            for numero, fila in enumerate(leer_filas(ruta, options['delimitador']), start=1):
+                descripcion = ' '.join(str(fila.get('descripcion') or '').split())
+                if not descripcion:
+                    self._error(conteo, numero, "falta la descripción")
+                    continue
+                valores = {
+                    campo_descripcion: descripcion,
+                    campo_vigente: a_booleano(fila.get('vigente'), True),
+                }
+                padre_id = None
+                if campo_padre:
+                    nombre_padre = clave(fila.get('padre') or '')
+                    if nombre_padre not in padres:
+                        self._error(conteo, numero, f"no existe el padre '{fila.get('padre')}'")
+                        continue
+                    padre_id = padres[nombre_padre]
+                    if padre_id is None:
+                        self._error(conteo, numero, f"el padre '{fila.get('padre')}' es ambiguo")
+                        continue
+                    valores[f'{campo_padre}_id'] = padre_id
+                if modelo is Zona:
+                    valores['zon_unilateral'] = a_booleano(fila.get('unilateral'), False)
+
+                llave = (clave(descripcion), padre_id)
+                instancia = existentes.get(llave)
+                if instancia is None:
+                    instancia = modelo(**valores)
+                    existentes[llave] = instancia
+                    por_crear.append(instancia)
+                    conteo['insertados'] += 1
+                elif any(getattr(instancia, c) != v for c, v in valores.items()):
+                    for c, v in valores.items():
+                        setattr(instancia, c, v)
+                    # Las filas aún no insertadas se actualizan en memoria
+                    if instancia.pk is not None:
+                        por_actualizar[instancia.pk] = instancia
+                        conteo['actualizados'] += 1
+                else:
+                    conteo['sin_cambios'] += 1
+
+                if len(por_crear) >= lote or len(por_actualizar) >= lote:
+                    vaciar()
+            vaciar()
+
+            # bulk_create/bulk_update no disparan señales: se invalida y sincroniza a mano
+            if conteo['insertados'] or conteo['actualizados']:
+                invalidar_catalogo(modelo)
+                if sincronizar:
+                    sincronizar()
+            if options['simular']:
+                transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{options['tabla']}: {conteo['insertados']} insertados, {conteo['actualizados']} actualizados, "
+            f"{conteo['sin_cambios']} sin cambios, {conteo['errores']} errores"
+            + (" (simulado, sin guardar)" if options['simular'] else "")
+        ))
+
+    def _error(self, conteo, numero, mensaje):
+        conteo['errores'] += 1
+        self.stderr.write(f"Fila {numero}: {mensaje}")
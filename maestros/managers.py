@@ -0,0 +1,26 @@
+from functools import lru_cache
+
+from django.db import models
+
+
+@lru_cache(maxsize=None)
+def campo_vigente(modelo):
+    """Nombre del campo booleano *_vigente del modelo (reg_vigente, per_vigente, ...)."""
+    for campo in modelo._meta.concrete_fields:
+        if campo.name.endswith('_vigente'):
+            return campo.name
+    raise ValueError(f"{modelo.__name__} no tiene campo *_vigente")
+
+
+class VigenteQuerySet(models.QuerySet):
+    """QuerySet compartido por todos los modelos con campo *_vigente."""
+
+    def vigentes(self):
+        return self.filter(**{campo_vigente(self.model): True})
+
+    def no_vigentes(self):
+        return self.filter(**{campo_vigente(self.model): False})
+
+
+class VigenteManager(models.Manager.from_queryset(VigenteQuerySet)):
+    """Manager por defecto: Modelo.objects.vigentes() filtra por el campo *_vigente del modelo."""
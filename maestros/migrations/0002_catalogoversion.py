@@ -0,0 +1,26 @@
+# Generated by Django 5.2.7 on 2026-10-18 03:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('maestros', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogoVersion',
+            fields=[
+                ('cav_id', models.AutoField(primary_key=True, serialize=False)),
+                ('cav_tabla', models.CharField(max_length=50, unique=True)),
+                ('cav_version', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Versión de Catálogo',
+                'verbose_name_plural': 'Versiones de Catálogo',
+                'db_table': 'catalogo_version',
+            },
+        ),
+    ]
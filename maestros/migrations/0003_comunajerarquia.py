@@ -0,0 +1,74 @@
+# Generated by Django 5.2.7 on 2026-10-18 03:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def poblar_jerarquia(apps, schema_editor):
+    Comuna = apps.get_model("maestros", "Comuna")
+    ComunaJerarquia = apps.get_model("maestros", "ComunaJerarquia")
+    ComunaJerarquia.objects.bulk_create(
+        [
+            ComunaJerarquia(com_id_id=com_id, pro_id_id=pro_id, reg_id_id=reg_id)
+            for com_id, pro_id, reg_id in Comuna.objects.values_list(
+                "com_id", "pro_id", "pro_id__reg_id"
+            )
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("maestros", "0002_catalogoversion"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ComunaJerarquia",
+            fields=[
+                (
+                    "com_id",
+                    models.OneToOneField(
+                        db_column="com_id",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="jerarquia",
+                        serialize=False,
+                        to="maestros.comuna",
+                    ),
+                ),
+                (
+                    "pro_id",
+                    models.ForeignKey(
+                        db_column="pro_id",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="maestros.provincia",
+                    ),
+                ),
+                (
+                    "reg_id",
+                    models.ForeignKey(
+                        db_column="reg_id",
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="maestros.region",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Jerarquía de Comuna",
+                "verbose_name_plural": "Jerarquías de Comunas",
+                "db_table": "comuna_jerarquia",
+                "indexes": [
+                    models.Index(
+                        fields=["reg_id", "com_id"], name="comuna_jerarquia_reg_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(poblar_jerarquia, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 5.2.7 on 2026-10-18 03:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def poblar_jerarquia(apps, schema_editor):
+    Grupo = apps.get_model("maestros", "Grupo")
+    GrupoJerarquia = apps.get_model("maestros", "GrupoJerarquia")
+    GrupoJerarquia.objects.bulk_create(
+        [
+            GrupoJerarquia(gru_id_id=gru_id, dis_id_id=dis_id, zon_id_id=zon_id)
+            for gru_id, dis_id, zon_id in Grupo.objects.values_list(
+                "gru_id", "dis_id", "dis_id__zon_id"
+            )
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("maestros", "0003_comunajerarquia"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GrupoJerarquia",
+            fields=[
+                (
+                    "gru_id",
+                    models.OneToOneField(
+                        db_column="gru_id",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="jerarquia",
+                        serialize=False,
+                        to="maestros.grupo",
+                    ),
+                ),
+                (
+                    "dis_id",
+                    models.ForeignKey(
+                        db_column="dis_id",
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="maestros.distrito",
+                    ),
+                ),
+                (
+                    "zon_id",
+                    models.ForeignKey(
+                        db_column="zon_id",
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="maestros.zona",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Jerarquía de Grupo",
+                "verbose_name_plural": "Jerarquías de Grupos",
+                "db_table": "grupo_jerarquia",
+                "indexes": [
+                    models.Index(
+                        fields=["dis_id", "gru_id"], name="grupo_jerarquia_dis_idx"
+                    ),
+                    models.Index(
+                        fields=["zon_id", "gru_id"], name="grupo_jerarquia_zon_idx"
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(poblar_jerarquia, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("maestros", "0004_grupojerarquia"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Secuencia",
+            fields=[
+                ("sec_id", models.AutoField(primary_key=True, serialize=False)),
+                ("sec_ambito", models.CharField(max_length=100, unique=True)),
+                ("sec_valor", models.BigIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Secuencia",
+                "verbose_name_plural": "Secuencias",
+                "db_table": "secuencia",
+            },
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from maestros.managers import VigenteManager
 
 # Tabla: region
 class Region(models.Model):
@@ -9,6 +10,9 @@ class Region(models.Model):
     # reg_vigente: Indica si la región está activa (True) o inactiva (False)
     reg_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'region'
         verbose_name = 'Región'
@@ -28,6 +32,9 @@ class Provincia(models.Model):
     # pro_vigente: Indica si la provincia está activa (True) o inactiva (False)
     pro_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'provincia'
         verbose_name = 'Provincia'
@@ -47,6 +54,9 @@ class Comuna(models.Model):
     # com_vigente: Indica si la comuna está activa (True) o inactiva (False)
     com_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'comuna'
         verbose_name = 'Comuna'
@@ -66,6 +76,9 @@ class Zona(models.Model):
     # zon_vigente: Indica si la zona está activa (True) o inactiva (False)
     zon_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'zona'
         verbose_name = 'Zona'
@@ -85,6 +98,9 @@ class Distrito(models.Model):
     # dis_vigente: Indica si el distrito está activo (True) o inactivo (False)
     dis_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'distrito'
         verbose_name = 'Distrito'
@@ -104,6 +120,9 @@ class Grupo(models.Model):
     # gru_vigente: Indica si el grupo está activo (True) o inactivo (False)
     gru_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'grupo'
         verbose_name = 'Grupo'
@@ -121,6 +140,9 @@ class EstadoCivil(models.Model):
     # esc_vigente: Indica si el estado civil está activo (True) o inactivo (False)
     esc_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'estado_civil'
         verbose_name = 'Estado Civil'
@@ -138,6 +160,9 @@ class Cargo(models.Model):
     # car_vigente: Indica si el cargo está activo (True) o inactivo (False)
     car_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'cargo'
         verbose_name = 'Cargo'
@@ -157,6 +182,9 @@ class Nivel(models.Model):
     # niv_vigente: Indica si el nivel está activo (True) o inactivo (False)
     niv_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'nivel'
         verbose_name = 'Nivel'
@@ -174,6 +202,9 @@ class Rama(models.Model):
     # ram_vigente: Indica si la rama está activa (True) o inactiva (False)
     ram_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'rama'
         verbose_name = 'Rama'
@@ -193,6 +224,9 @@ class Rol(models.Model):
     # rol_vigente: Indica si el rol está activo (True) o inactivo (False)
     rol_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'rol'
         verbose_name = 'Rol'
@@ -210,6 +244,9 @@ class TipoArchivo(models.Model):
     # tar_vigente: Indica si el tipo de archivo está activo (True) o inactivo (False)
     tar_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'tipo_archivo'
         verbose_name = 'Tipo de Archivo'
@@ -231,6 +268,9 @@ class TipoCurso(models.Model):
     # tcu_vigente: Indica si el tipo de curso está activo (True) o inactivo (False)
     tcu_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'tipo_curso'
         verbose_name = 'Tipo de Curso'
@@ -250,6 +290,9 @@ class Alimentacion(models.Model):
     # ali_vigente: Indica si el tipo de alimentación está activo (True) o inactivo (False)
     ali_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'alimentacion'
         verbose_name = 'Alimentación'
@@ -267,6 +310,9 @@ class ConceptoContable(models.Model):
     # coc_vigente: Indica si el concepto contable está activo (True) o inactivo (False)
     coc_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'concepto_contable'
         verbose_name = 'Concepto Contable'
@@ -274,3 +320,80 @@ class ConceptoContable(models.Model):
 
     def __str__(self):
         return self.coc_descripcion
+
+# Tabla: catalogo_version
+class CatalogoVersion(models.Model):
+    # cav_id: Identificador único del registro de versión (clave primaria)
+    cav_id = models.AutoField(primary_key=True)
+    # cav_tabla: Nombre de la tabla maestra versionada (db_table del modelo) u otra clave, como tablero:<cur_id>
+    cav_tabla = models.CharField(max_length=50, unique=True)
+    # cav_version: Versión vigente del catálogo; se incrementa en cada cambio
+    cav_version = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = 'catalogo_version'
+        verbose_name = 'Versión de Catálogo'
+        verbose_name_plural = 'Versiones de Catálogo'
+
+    def __str__(self):
+        return f"{self.cav_tabla} v{self.cav_version}"
+
+# Tabla: comuna_jerarquia (ruta materializada comuna -> provincia -> región)
+class ComunaJerarquia(models.Model):
+    # com_id: Comuna (clave primaria, relación OneToOne con Comuna)
+    com_id = models.OneToOneField(Comuna, on_delete=models.CASCADE, primary_key=True, db_column='com_id', related_name='jerarquia')
+    # pro_id: Provincia a la que pertenece la comuna
+    pro_id = models.ForeignKey(Provincia, on_delete=models.CASCADE, db_column='pro_id', related_name='+')
+    # reg_id: Región a la que pertenece la comuna (indexada junto a com_id en Meta)
+    reg_id = models.ForeignKey(Region, on_delete=models.CASCADE, db_column='reg_id', related_name='+', db_index=False)
+
+    class Meta:
+        db_table = 'comuna_jerarquia'
+        verbose_name = 'Jerarquía de Comuna'
+        verbose_name_plural = 'Jerarquías de Comunas'
+        indexes = [
+            # Permite resolver "comunas de la región X" solo con el índice
+            models.Index(fields=['reg_id', 'com_id'], name='comuna_jerarquia_reg_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.com_id} ({self.pro_id}, {self.reg_id})"
+
+# Tabla: grupo_jerarquia (ruta materializada grupo -> distrito -> zona)
+class GrupoJerarquia(models.Model):
+    # gru_id: Grupo (clave primaria, relación OneToOne con Grupo)
+    gru_id = models.OneToOneField(Grupo, on_delete=models.CASCADE, primary_key=True, db_column='gru_id', related_name='jerarquia')
+    # dis_id: Distrito al que pertenece el grupo (indexado junto a gru_id en Meta)
+    dis_id = models.ForeignKey(Distrito, on_delete=models.CASCADE, db_column='dis_id', related_name='+', db_index=False)
+    # zon_id: Zona a la que pertenece el grupo (indexada junto a gru_id en Meta)
+    zon_id = models.ForeignKey(Zona, on_delete=models.CASCADE, db_column='zon_id', related_name='+', db_index=False)
+
+    class Meta:
+        db_table = 'grupo_jerarquia'
+        verbose_name = 'Jerarquía de Grupo'
+        verbose_name_plural = 'Jerarquías de Grupos'
+        indexes = [
+            # Permiten resolver "grupos del distrito/zona X" solo con el índice
+            models.Index(fields=['dis_id', 'gru_id'], name='grupo_jerarquia_dis_idx'),
+            models.Index(fields=['zon_id', 'gru_id'], name='grupo_jerarquia_zon_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.gru_id} ({self.dis_id}, {self.zon_id})"
+
+# Tabla: secuencia (contadores de numeración correlativa, mantenidos por maestros.secuencias)
+class Secuencia(models.Model):
+    # sec_id: Identificador único del contador (clave primaria)
+    sec_id = models.AutoField(primary_key=True)
+    # sec_ambito: Ámbito de la numeración (ej. 'curso:2026', 'comprobante:3')
+    sec_ambito = models.CharField(max_length=100, unique=True)
+    # sec_valor: Último número entregado en el ámbito
+    sec_valor = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = 'secuencia'
+        verbose_name = 'Secuencia'
+        verbose_name_plural = 'Secuencias'
+
+    def __str__(self):
+        return f"{self.sec_ambito}: {self.sec_valor}"
@@ -0,0 +1,59 @@
+"""
+Numeración correlativa por ámbito (tabla secuencia).
+
+Cada ámbito ('curso:2026', 'comprobante:3', ...) tiene su propio contador.
+Reservar es un UPDATE sec_valor = sec_valor + n sobre la fila del ámbito y
+la lectura del nuevo valor, en la misma transacción: solo se bloquea esa
+fila, así que numerar en ámbitos distintos no se espera entre sí (SQLite
+igual tiene un solo escritor a la vez). El bloqueo dura hasta el fin de la
+transacción que reserva. Si el número se reserva en la transacción que
+guarda el documento y ésta se revierte, el número vuelve a quedar libre:
+numeración sin saltos. Reservado en una transacción propia y corta, un fallo
+posterior deja un salto. Las cargas masivas reservan un bloque de una vez.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.transaction import TransactionManagementError
+
+from maestros.models import Secuencia
+
+
+def ambito(*partes):
+    return ':'.join(str(parte) for parte in partes)
+
+
+@transaction.atomic
+def reservar(ambito, cantidad=1):
+    """Reserva cantidad números consecutivos del ámbito y los devuelve como range."""
+    if cantidad < 1:
+        raise ValueError("La cantidad a reservar debe ser positiva")
+    secuencia = Secuencia.objects.filter(sec_ambito=ambito)
+    if not secuencia.update(sec_valor=F('sec_valor') + cantidad):
+        try:
+            with transaction.atomic():
+                Secuencia.objects.create(sec_ambito=ambito, sec_valor=cantidad)
+        except IntegrityError:
+            # Otro proceso creó el ámbito entre el UPDATE y el INSERT
+            secuencia.update(sec_valor=F('sec_valor') + cantidad)
+    valor = secuencia.values_list('sec_valor', flat=True).get()
+    return range(valor - cantidad + 1, valor + 1)
+
+
+def reservar_sin_saltos(ambito, cantidad=1):
+    """
+    Como reservar, pero exige estar dentro de la transacción que guarda los
+    documentos numerados: si se revierte, los números no se pierden.
+    """
+    if not transaction.get_connection().in_atomic_block:
+        raise TransactionManagementError(
+            "La numeración sin saltos debe reservarse dentro de la transacción que guarda el documento"
+        )
+    return reservar(ambito, cantidad)
+
+
+@transaction.atomic
+def ajustar_minimo(ambito, valor):
+    """Deja el contador en al menos valor (ej. al guardar un número asignado a mano)."""
+    secuencia, creada = Secuencia.objects.get_or_create(sec_ambito=ambito, defaults={'sec_valor': valor})
+    if not creada:
+        Secuencia.objects.filter(pk=secuencia.pk, sec_valor__lt=valor).update(sec_valor=valor)
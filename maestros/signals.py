@@ -0,0 +1,37 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from maestros.catalogo import MODELOS_CATALOGO, invalidar_catalogo
+from maestros.jerarquia import mover_distrito, sincronizar_comunas, sincronizar_grupos
+from maestros.models import Comuna, Distrito, Grupo, Provincia
+
+
+# Cualquier alta, modificación o baja de una fila maestra invalida su catálogo
+def catalogo_modificado(sender, **kwargs):
+    invalidar_catalogo(sender)
+
+
+for modelo in MODELOS_CATALOGO:
+    post_save.connect(catalogo_modificado, sender=modelo, dispatch_uid=f'catalogo_save_{modelo._meta.db_table}')
+    post_delete.connect(catalogo_modificado, sender=modelo, dispatch_uid=f'catalogo_delete_{modelo._meta.db_table}')
+
+
+# Jerarquías materializadas: la baja de filas la resuelve el CASCADE de comuna_jerarquia/grupo_jerarquia
+@receiver(post_save, sender=Comuna, dispatch_uid='jerarquia_comuna')
+def comuna_guardada(sender, instance, **kwargs):
+    sincronizar_comunas([instance.pk])
+
+
+@receiver(post_save, sender=Provincia, dispatch_uid='jerarquia_provincia')
+def provincia_guardada(sender, instance, **kwargs):
+    sincronizar_comunas(Comuna.objects.filter(pro_id=instance.pk).values_list('com_id', flat=True))
+
+
+@receiver(post_save, sender=Grupo, dispatch_uid='jerarquia_grupo')
+def grupo_guardado(sender, instance, **kwargs):
+    sincronizar_grupos([instance.pk])
+
+
+@receiver(post_save, sender=Distrito, dispatch_uid='jerarquia_distrito')
+def distrito_guardado(sender, instance, **kwargs):
+    mover_distrito(instance.pk, instance.zon_id_id)
@@ -0,0 +1,90 @@
+import time
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from maestros import catalogo
+from maestros.catalogo import (
+    derivado, expirar_versiones, invalidar_version, listar_vigentes, obtener, obtener_catalogo, version,
+    version_catalogo,
+)
+from maestros.models import CatalogoVersion, Region
+
+
+@override_settings(CATALOGO_VERSION_TTL=60)
+class CatalogoTests(TestCase):
+
+    def setUp(self):
+        # Cada test revierte catalogo_version: la caché del proceso no puede sobrevivir entre tests
+        catalogo._catalogos.clear()
+        catalogo._derivados.clear()
+        expirar_versiones()
+
+    def crear_region(self, descripcion, vigente=True):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Region.objects.create(reg_descripcion=descripcion, reg_vigente=vigente)
+
+    def test_lecturas_tras_guardar_y_borrar(self):
+        self.assertEqual(listar_vigentes(Region), ())
+        region = self.crear_region('Metropolitana')
+        self.assertEqual([r.reg_descripcion for r in listar_vigentes(Region)], ['Metropolitana'])
+
+        region.reg_vigente = False
+        with self.captureOnCommitCallbacks(execute=True):
+            region.save()
+        self.assertEqual(listar_vigentes(Region), ())
+        # Las filas no vigentes siguen disponibles por id
+        self.assertFalse(obtener(Region, region.pk).reg_vigente)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            region.delete()
+        self.assertIsNone(obtener(Region, region.pk))
+
+    def test_la_version_leida_expira_en_el_commit(self):
+        self.crear_region('Metropolitana')
+        antes = obtener_catalogo(Region)
+        with self.captureOnCommitCallbacks() as callbacks:
+            Region.objects.create(reg_descripcion='Valparaíso', reg_vigente=True)
+        self.assertIn(expirar_versiones, callbacks)
+        # Antes del commit este proceso sigue con la versión leída
+        self.assertIs(obtener_catalogo(Region), antes)
+
+        for callback in callbacks:
+            callback()
+        actual = obtener_catalogo(Region)
+        self.assertEqual(actual.version, antes.version + 1)
+        self.assertEqual(len(actual), 2)
+        # Sin cambios nuevos se reutiliza la misma copia
+        self.assertIs(obtener_catalogo(Region), actual)
+
+    def test_cambio_de_otro_proceso_se_ve_al_vencer_el_ttl(self):
+        region = self.crear_region('Metropolitana')
+        antes = obtener_catalogo(Region)
+        # Otro proceso modifica la fila y su versión; aquí no corre ningún on_commit
+        Region.objects.filter(pk=region.pk).update(reg_descripcion='RM')
+        CatalogoVersion.objects.filter(cav_tabla='region').update(cav_version=antes.version + 1)
+        self.assertEqual(obtener(Region, region.pk).reg_descripcion, 'Metropolitana')
+
+        vencido = time.monotonic() + 61
+        with mock.patch.object(catalogo.time, 'monotonic', return_value=vencido):
+            self.assertEqual(version_catalogo(Region), antes.version + 1)
+            self.assertEqual(obtener(Region, region.pk).reg_descripcion, 'RM')
+
+    def test_invalidar_version_crea_e_incrementa_la_clave(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidar_version('tablero:1')
+        self.assertEqual(version('tablero:1'), 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidar_version('tablero:1')
+        self.assertEqual(version('tablero:1'), 2)
+        self.assertEqual(version('tablero:2'), 0)
+
+    def test_derivado_se_reconstruye_solo_al_cambiar_la_version(self):
+        construir = mock.Mock(side_effect=lambda: {r.reg_id for r in listar_vigentes(Region)})
+        self.assertEqual(derivado('regiones', [Region], construir), set())
+        derivado('regiones', [Region], construir)
+        self.assertEqual(construir.call_count, 1)
+
+        region = self.crear_region('Metropolitana')
+        self.assertEqual(derivado('regiones', [Region], construir), {region.pk})
+        self.assertEqual(construir.call_count, 2)
@@ -0,0 +1,41 @@
+from django.db import transaction
+from django.db.transaction import TransactionManagementError
+from django.test import TestCase, TransactionTestCase
+
+from maestros.models import Secuencia
+from maestros.secuencias import ajustar_minimo, ambito, reservar, reservar_sin_saltos
+
+
+class ReservarTests(TestCase):
+
+    def test_numeros_correlativos_por_ambito(self):
+        self.assertEqual([reservar('curso:2026')[0] for _ in range(3)], [1, 2, 3])
+        self.assertEqual(reservar('curso:2027')[0], 1)
+        self.assertEqual(ambito('comprobante', 5), 'comprobante:5')
+
+    def test_reserva_de_bloque(self):
+        reservar('lote')
+        self.assertEqual(list(reservar('lote', 4)), [2, 3, 4, 5])
+        self.assertEqual(reservar('lote')[0], 6)
+        with self.assertRaises(ValueError):
+            reservar('lote', 0)
+
+    def test_reversion_libera_numero_sin_saltos(self):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                self.assertEqual(reservar_sin_saltos('comprobante:1')[0], 1)
+                raise RuntimeError
+        self.assertEqual(reservar_sin_saltos('comprobante:1')[0], 1)
+
+    def test_ajustar_minimo_solo_adelanta(self):
+        ajustar_minimo('curso:2026', 50)
+        self.assertEqual(reservar('curso:2026')[0], 51)
+        ajustar_minimo('curso:2026', 10)
+        self.assertEqual(Secuencia.objects.get(sec_ambito='curso:2026').sec_valor, 51)
+
+
+class SinTransaccionTests(TransactionTestCase):
+
+    def test_sin_saltos_exige_transaccion(self):
+        with self.assertRaises(TransactionManagementError):
+            reservar_sin_saltos('comprobante:1')
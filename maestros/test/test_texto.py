@@ -0,0 +1,22 @@
+from maestros.texto import IndicePrefijos, plegar
+
+
+def test_plegar_quita_tildes_y_mayusculas():
+    assert plegar("Viña  del Mar") == "vina del mar"
+    assert plegar("ÑUÑOA") == "nunoa"
+    assert plegar("Grupo Scout N°5 - San José") == "grupo scout n 5 san jose"
+    assert plegar(None) == ""
+
+
+def test_indice_prefijos_prioriza_inicio_del_nombre():
+    indice = IndicePrefijos([(1, "Viña del Mar"), (2, "Marchigüe"), (3, "Valparaíso"), (4, "Villa Alemana")])
+    assert indice.buscar("mar") == [2, 1]
+    assert indice.buscar("VI") == [4, 1]
+    assert indice.buscar("del m") == [1]
+
+
+def test_indice_prefijos_limite_y_consulta_vacia():
+    indice = IndicePrefijos([(i, f"San Pedro {i}") for i in range(20)])
+    assert len(indice.buscar("san", limite=5)) == 5
+    assert indice.buscar("") == []
+    assert indice.buscar("xyz") == []
@@ -0,0 +1,72 @@
+"""
+Utilidades de texto sin dependencias de la BD: normalización y búsqueda por prefijo.
+"""
+import unicodedata
+from bisect import bisect_left
+
+
+def plegar(texto):
+    """
+    Normaliza un texto para comparar: sin tildes, sin mayúsculas y con los
+    separadores colapsados en un espacio ("Viña  del Mar" -> "vina del mar").
+    """
+    if not texto:
+        return ''
+    descompuesto = unicodedata.normalize('NFKD', str(texto))
+    sin_tildes = ''.join(c for c in descompuesto if not unicodedata.combining(c))
+    return ' '.join(''.join(c if c.isalnum() else ' ' for c in sin_tildes.casefold()).split())
+
+
+class IndicePrefijos:
+    """
+    Índice inmutable de búsqueda por prefijo sobre arreglos ordenados (bisect).
+
+    Una consulta coincide con un texto si es prefijo del texto completo o del
+    texto a partir de alguna de sus palabras ("mar" encuentra "Viña del Mar").
+    Los resultados se ordenan primero por coincidencia al inicio y luego
+    alfabéticamente, y cada consulta cuesta O(log n + limite).
+    """
+    __slots__ = ('_inicios', '_palabras')
+
+    def __init__(self, entradas):
+        inicios = []
+        palabras = []
+        for identificador, texto in entradas:
+            clave = plegar(texto)
+            if not clave:
+                continue
+            inicios.append((clave, identificador))
+            posicion = clave.find(' ')
+            while posicion != -1:
+                palabras.append((clave[posicion + 1:], identificador))
+                posicion = clave.find(' ', posicion + 1)
+        inicios.sort()
+        palabras.sort()
+        self._inicios = tuple(inicios)
+        self._palabras = tuple(palabras)
+
+    def __len__(self):
+        return len(self._inicios)
+
+    @staticmethod
+    def _recorrer(arreglo, prefijo):
+        posicion = bisect_left(arreglo, (prefijo,))
+        while posicion < len(arreglo) and arreglo[posicion][0].startswith(prefijo):
+            yield arreglo[posicion][1]
+            posicion += 1
+
+    def buscar(self, consulta, limite=10):
+        """Ids que coinciden con la consulta, mejor clasificados primero."""
+        prefijo = plegar(consulta)
+        if not prefijo or limite <= 0:
+            return []
+        resultado = []
+        vistos = set()
+        for arreglo in (self._inicios, self._palabras):
+            for identificador in self._recorrer(arreglo, prefijo):
+                if identificador not in vistos:
+                    vistos.add(identificador)
+                    resultado.append(identificador)
+                    if len(resultado) >= limite:
+                        return resultado
+        return resultado
@@ -0,0 +1,11 @@
+from django.urls import path
+
+from maestros import views
+
+app_name = 'maestros'
+
+urlpatterns = [
+    path('', views.versiones_catalogos, name='versiones'),
+    path('buscar/<slug:tipo>/', views.buscar, name='buscar'),
+    path('<slug:tabla>/', views.catalogo, name='catalogo'),
+]
@@ -1,3 +1,76 @@
-from django.shortcuts import render
+import json
 
-# Create your views here.
+from django.conf import settings
+from django.http import Http404, HttpResponse, JsonResponse
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_safe
+
+from maestros.busqueda import buscar_comunas, buscar_grupos
+from maestros.catalogo import MODELOS_CATALOGO, derivado, listar_vigentes, version_catalogo, versiones
+
+# Catálogos publicados, por nombre de tabla (ej. /api/maestros/comuna/)
+CATALOGOS = {modelo._meta.db_table: modelo for modelo in MODELOS_CATALOGO}
+
+# Búsquedas typeahead disponibles (ej. /api/maestros/buscar/comuna/?q=vina)
+BUSQUEDAS = {
+    'comuna': buscar_comunas,
+    'grupo': buscar_grupos,
+}
+
+# Máximo de resultados que puede pedir una búsqueda
+BUSQUEDA_LIMITE_MAXIMO = 50
+
+# Segundos que navegadores y proxies pueden reutilizar la respuesta sin revalidar
+CATALOGO_MAX_AGE = getattr(settings, 'CATALOGO_MAX_AGE', 300)
+
+
+def etag_catalogo(request, tabla):
+    # La versión sale de la caché de versiones del proceso: un 304 no consulta la BD
+    modelo = CATALOGOS.get(tabla)
+    if modelo is None:
+        return None
+    return f'{tabla}-{version_catalogo(modelo)}'
+
+
+def _serializar(modelo):
+    filas = [fila._asdict() for fila in listar_vigentes(modelo)]
+    return json.dumps({
+        'tabla': modelo._meta.db_table,
+        'version': version_catalogo(modelo),
+        'filas': filas,
+    }, ensure_ascii=False).encode('utf-8')
+
+
+@require_safe
+@cache_control(public=True, max_age=CATALOGO_MAX_AGE, stale_while_revalidate=CATALOGO_MAX_AGE)
+@condition(etag_func=etag_catalogo)
+def catalogo(request, tabla):
+    """Filas vigentes de un catálogo maestro, con ETag fuerte derivado de su versión."""
+    modelo = CATALOGOS.get(tabla)
+    if modelo is None:
+        raise Http404(f"No existe el catálogo {tabla}")
+    # El JSON se serializa una vez por versión del catálogo
+    cuerpo = derivado(('json', tabla), (modelo,), lambda: _serializar(modelo))
+    return HttpResponse(cuerpo, content_type='application/json; charset=utf-8')
+
+
+@require_safe
+@cache_control(public=True, max_age=CATALOGO_MAX_AGE)
+def versiones_catalogos(request):
+    """Versión actual de cada catálogo, para que los clientes sepan qué revalidar."""
+    conocidas = versiones()
+    return JsonResponse({tabla: conocidas.get(tabla, 0) for tabla in CATALOGOS})
+
+
+@require_safe
+@cache_control(public=True, max_age=CATALOGO_MAX_AGE)
+def buscar(request, tipo):
+    """Sugerencias de comunas o grupos para campos de selección con autocompletado."""
+    busqueda = BUSQUEDAS.get(tipo)
+    if busqueda is None:
+        raise Http404(f"No existe la búsqueda {tipo}")
+    try:
+        limite = min(int(request.GET.get('limite', 10)), BUSQUEDA_LIMITE_MAXIMO)
+    except ValueError:
+        limite = 10
+    return JsonResponse({'resultados': busqueda(request.GET.get('q', ''), limite)})
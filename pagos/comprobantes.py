@@ -0,0 +1,33 @@
+"""
+Numeración de comprobantes de pago (comprobante_pago.cpa_numero).
+
+Los números son correlativos y sin saltos por concepto contable (contador
+'comprobante:<coc_id>' de maestros.secuencias): se reservan dentro de la
+transacción que guarda el comprobante (ComprobantePago.save abre una si el
+llamador no la tiene), así que si ésta se revierte el número vuelve a quedar
+libre. Mientras tanto solo esperan los comprobantes del mismo
+concepto. El índice único (coc_id, cpa_numero) respalda la asignación.
+"""
+from maestros.secuencias import ajustar_minimo, ambito, reservar_sin_saltos
+
+
+def ambito_comprobante(coc_id):
+    return ambito('comprobante', coc_id)
+
+
+def numerar_comprobantes(comprobantes):
+    """
+    Asigna cpa_numero a los comprobantes que no lo tienen (ej. antes de
+    bulk_create), un bloque por concepto. Debe llamarse dentro de la
+    transacción que los guarda. Los que ya traen número adelantan el contador.
+    """
+    sin_numero = {}
+    for comprobante in comprobantes:
+        if comprobante.cpa_numero is None:
+            sin_numero.setdefault(comprobante.coc_id_id, []).append(comprobante)
+        else:
+            ajustar_minimo(ambito_comprobante(comprobante.coc_id_id), comprobante.cpa_numero)
+    # Siempre en el mismo orden de conceptos, para que dos lotes no se bloqueen entre sí
+    for coc_id, grupo in sorted(sin_numero.items()):
+        for comprobante, numero in zip(grupo, reservar_sin_saltos(ambito_comprobante(coc_id), len(grupo))):
+            comprobante.cpa_numero = numero
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-18 03:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cursos", "0002_personaestadocurso_persona_estado_curso_vig_idx"),
+        ("pagos", "0001_initial"),
+        ("personas", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="prepago",
+            index=models.Index(
+                condition=models.Q(("ppa_vigente", True)),
+                fields=["per_id", "cur_id"],
+                name="prepago_vigente_idx",
+            ),
+        ),
+    ]
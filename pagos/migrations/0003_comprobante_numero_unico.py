@@ -0,0 +1,58 @@
+# Generated by Django 5.2.7 on 2026-10-18 04:03
+
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def verificar_numeros(apps, schema_editor):
+    ComprobantePago = apps.get_model("pagos", "ComprobantePago")
+    repetidos = list(
+        ComprobantePago.objects.values_list("coc_id", "cpa_numero")
+        .annotate(n=Count("pk"))
+        .filter(n__gt=1)
+        .order_by()
+    )
+    if repetidos:
+        raise RuntimeError(
+            "Hay comprobantes con el mismo número en un concepto contable; "
+            "corríjalos antes de migrar (coc_id/cpa_numero): "
+            + ", ".join(f"{coc_id}/{numero}" for coc_id, numero, _ in repetidos[:20])
+        )
+
+
+def iniciar_secuencias(apps, schema_editor):
+    ComprobantePago = apps.get_model("pagos", "ComprobantePago")
+    Secuencia = apps.get_model("maestros", "Secuencia")
+    maximos = (
+        ComprobantePago.objects.values_list("coc_id")
+        .annotate(maximo=Max("cpa_numero"))
+        .order_by()
+    )
+    Secuencia.objects.bulk_create(
+        [
+            Secuencia(sec_ambito=f"comprobante:{coc_id}", sec_valor=maximo)
+            for coc_id, maximo in maximos
+        ]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("maestros", "0005_secuencia"),
+        ("pagos", "0002_prepago_prepago_vigente_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(verificar_numeros, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="comprobantepago",
+            name="cpa_numero",
+            field=models.IntegerField(blank=True),
+        ),
+        migrations.AlterUniqueTogether(
+            name="comprobantepago",
+            unique_together={("coc_id", "cpa_numero")},
+        ),
+        migrations.RunPython(iniciar_secuencias, migrations.RunPython.noop),
+    ]
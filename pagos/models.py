@@ -1,8 +1,10 @@
-from django.db import models
+from django.db import models, transaction
+from maestros.managers import VigenteManager
 from usuarios.models import Usuario
 from personas.models import Persona
 from cursos.models import Curso, PersonaCurso
 from maestros.models import ConceptoContable
+from pagos.comprobantes import numerar_comprobantes
 
 # Tabla: pago_persona
 class PagoPersona(models.Model):
@@ -45,8 +47,8 @@ class ComprobantePago(models.Model):
     cpa_fecha_hora = models.DateTimeField()
     # cpa_fecha: Fecha del comprobante
     cpa_fecha = models.DateField()
-    # cpa_numero: Número del comprobante
-    cpa_numero = models.IntegerField()
+    # cpa_numero: Número del comprobante, correlativo por concepto (si se deja vacío, pagos.comprobantes asigna el siguiente)
+    cpa_numero = models.IntegerField(blank=True)
     # cpa_valor: Valor total del comprobante
     cpa_valor = models.DecimalField(max_digits=21, decimal_places=6)
 
@@ -54,10 +56,18 @@ class ComprobantePago(models.Model):
         db_table = 'comprobante_pago'
         verbose_name = 'Comprobante de Pago'
         verbose_name_plural = 'Comprobantes de Pago'
+        unique_together = ('coc_id', 'cpa_numero') # Un número por concepto contable
 
     def __str__(self):
         return f"Comprobante {self.cpa_numero} ({self.cpa_valor})"
 
+    def save(self, *args, **kwargs):
+        # El número se reserva en la misma transacción que inserta el comprobante: si falla, no queda un salto
+        with transaction.atomic(using=kwargs.get('using')):
+            if self._state.adding:
+                numerar_comprobantes([self])
+            super().save(*args, **kwargs)
+
 # Tabla: pago_comprobante (Tabla de unión entre PagoPersona y ComprobantePago)
 class PagoComprobante(models.Model):
     # pco_id: Identificador único de la relación (clave primaria)
@@ -114,10 +124,17 @@ class Prepago(models.Model):
     # ppa_vigente: Indica si el prepago está activo (True) o inactivo (False)
     ppa_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'prepago'
         verbose_name = 'Prepago'
         verbose_name_plural = 'Prepagos'
+        indexes = [
+            # Índice parcial: prepagos vigentes de una persona por curso
+            models.Index(fields=['per_id', 'cur_id'], name='prepago_vigente_idx', condition=models.Q(ppa_vigente=True)),
+        ]
 
     def __str__(self):
         return f"Prepago {self.ppa_id} de {self.per_id} por {self.ppa_valor} para {self.cur_id}"
@@ -0,0 +1,60 @@
+from decimal import Decimal
+
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from cursos.models import PersonaCurso
+from cursos.test.datos import DatosCurso
+from maestros.models import ConceptoContable
+from pagos.models import ComprobantePago
+
+
+class Emision(DatosCurso):
+    """Una inscripción y dos conceptos contables mínimos para emitir comprobantes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.crear_maestros()
+        cls.inscripcion = PersonaCurso.objects.create(
+            per_id=cls.responsable, cus_id=cls.curso_con_seccion(cupo=30), rol_id=cls.rol, ali_id=cls.alimentacion,
+            pec_registro=False, pec_acreditado=False,
+        )
+        cls.concepto = ConceptoContable.objects.create(coc_descripcion='Cuota', coc_vigente=True)
+        cls.otro_concepto = ConceptoContable.objects.create(coc_descripcion='Polera', coc_vigente=True)
+
+    def crear(self, concepto=None, **kwargs):
+        return ComprobantePago.objects.create(
+            usu_id=self.usuario, pec_id=self.inscripcion, coc_id=concepto or self.concepto,
+            cpa_fecha_hora=timezone.now(), cpa_fecha=timezone.localdate(), cpa_valor=Decimal('1000'), **kwargs,
+        )
+
+
+class NumeracionComprobantesTests(Emision, TestCase):
+
+    def test_numeros_correlativos_por_concepto(self):
+        numeros = [self.crear().cpa_numero for _ in range(3)]
+        self.assertEqual(numeros, [1, 2, 3])
+        self.assertEqual(self.crear(self.otro_concepto).cpa_numero, 1)
+
+    def test_reversion_libera_el_numero(self):
+        self.crear()
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                self.crear()
+                raise RuntimeError
+        self.assertEqual(self.crear().cpa_numero, 2)
+
+    def test_numero_manual_adelanta_el_contador(self):
+        self.crear(cpa_numero=40)
+        self.assertEqual(self.crear().cpa_numero, 41)
+
+
+class ComprobanteEnAutocommitTests(Emision, TransactionTestCase):
+    """Sin la transacción envolvente de TestCase: el llamador no abre ninguna."""
+
+    def setUp(self):
+        self.setUpTestData()
+
+    def test_create_sin_transaccion_numera(self):
+        self.assertEqual([self.crear().cpa_numero for _ in range(2)], [1, 2])
@@ -1,6 +1,19 @@
 from django.apps import AppConfig
+from django.db import connections
+from django.db.models.signals import post_migrate
+
+
+def asegurar_fts(sender, using, **kwargs):
+    # Las reconstrucciones de tabla de SQLite eliminan los triggers de persona_fts
+    from personas.busqueda import instalar_fts
+    instalar_fts(connections[using])
 
 
 class PersonsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "personas"
+
+    def ready(self):
+        post_migrate.connect(asegurar_fts, sender=self)
+        # Mantiene los contadores de miembros por grupo, distrito y zona
+        from personas import signals  # noqa: F401
@@ -0,0 +1,140 @@
+"""
+Búsqueda de personas por nombre, insensible a tildes y mayúsculas.
+
+En SQLite se usa una tabla virtual FTS5 (persona_fts) de contenido externo
+sobre persona, con tokenizador unicode61 sin diacríticos e índices de prefijo;
+la mantienen sincronizada triggers de la BD, por lo que también la actualizan
+bulk_create/bulk_update. En otros motores (o sin FTS5) se busca cada palabra
+con contains sobre las columnas plegadas en la BD: minúsculas y sin las
+tildes del español (TILDES), como plegar() en Python; otras letras con
+diacríticos solo coinciden escritas igual.
+"""
+from django.db import connection
+from django.db.models import F, Q, Value
+from django.db.models.functions import Lower, Replace
+
+from maestros.texto import plegar
+from personas.models import Persona
+
+# Columnas indexadas y su peso en el ranking bm25 (más peso, más relevante)
+COLUMNAS_FTS = (
+    ('per_apelpat', 10.0),
+    ('per_nombres', 6.0),
+    ('per_apelmat', 4.0),
+    ('per_apodo', 2.0),
+)
+
+_COLUMNAS = ', '.join(c for c, _ in COLUMNAS_FTS)
+_NUEVAS = ', '.join(f'new.{c}' for c, _ in COLUMNAS_FTS)
+_ANTIGUAS = ', '.join(f'old.{c}' for c, _ in COLUMNAS_FTS)
+
+SQL_TABLA_FTS = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS persona_fts USING fts5({_COLUMNAS}, "
+    "content='persona', content_rowid='per_id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+)
+
+SQL_TRIGGERS_FTS = (
+    f"CREATE TRIGGER IF NOT EXISTS persona_fts_ai AFTER INSERT ON persona BEGIN "
+    f"INSERT INTO persona_fts(rowid, {_COLUMNAS}) VALUES (new.per_id, {_NUEVAS}); END",
+    f"CREATE TRIGGER IF NOT EXISTS persona_fts_ad AFTER DELETE ON persona BEGIN "
+    f"INSERT INTO persona_fts(persona_fts, rowid, {_COLUMNAS}) VALUES ('delete', old.per_id, {_ANTIGUAS}); END",
+    f"CREATE TRIGGER IF NOT EXISTS persona_fts_au AFTER UPDATE OF {_COLUMNAS} ON persona BEGIN "
+    f"INSERT INTO persona_fts(persona_fts, rowid, {_COLUMNAS}) VALUES ('delete', old.per_id, {_ANTIGUAS}); "
+    f"INSERT INTO persona_fts(rowid, {_COLUMNAS}) VALUES (new.per_id, {_NUEVAS}); END",
+)
+
+# Letras con tilde del español que se pliegan en la búsqueda sin FTS, en ambas cajas (LOWER de
+# SQLite solo cambia ASCII); cada una es un REPLACE anidado, así que la lista se mantiene corta
+TILDES = {
+    con_tilde: sin_tilde
+    for letra, sin_tilde in (('á', 'a'), ('é', 'e'), ('í', 'i'), ('ó', 'o'), ('ú', 'u'), ('ü', 'u'), ('ñ', 'n'))
+    for con_tilde in (letra, letra.upper())
+}
+
+_fts_disponible = None
+
+
+def instalar_fts(conexion):
+    """
+    Crea (si faltan) la tabla FTS5 y sus triggers, y reconstruye el índice
+    cuando algún trigger no existía. Es idempotente: se llama desde la
+    migración y tras cada migrate, porque SQLite descarta los triggers cuando
+    Django reconstruye la tabla persona al alterarla.
+    """
+    global _fts_disponible
+    if conexion.vendor != 'sqlite':
+        return False
+    with conexion.cursor() as cursor:
+        cursor.execute("SELECT count(*) FROM sqlite_master WHERE type = 'table' AND name = 'persona'")
+        if not cursor.fetchone()[0]:
+            return False
+        cursor.execute("SELECT count(*) FROM pragma_compile_options WHERE compile_options = 'ENABLE_FTS5'")
+        if not cursor.fetchone()[0]:
+            _fts_disponible = False
+            return False
+        cursor.execute("SELECT count(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'persona_fts_%'")
+        triggers_existentes = cursor.fetchone()[0]
+        cursor.execute(SQL_TABLA_FTS)
+        for sql in SQL_TRIGGERS_FTS:
+            cursor.execute(sql)
+        if triggers_existentes < len(SQL_TRIGGERS_FTS):
+            cursor.execute("INSERT INTO persona_fts(persona_fts) VALUES ('rebuild')")
+    _fts_disponible = True
+    return True
+
+
+def fts_disponible():
+    global _fts_disponible
+    if _fts_disponible is None:
+        if connection.vendor != 'sqlite':
+            _fts_disponible = False
+        else:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT count(*) FROM sqlite_master WHERE name = 'persona_fts'")
+                _fts_disponible = bool(cursor.fetchone()[0])
+    return _fts_disponible
+
+
+def _consulta_fts(palabras):
+    # Cada palabra se busca como prefijo; todas deben aparecer (AND implícito)
+    return ' '.join(f'"{palabra}"*' for palabra in palabras)
+
+
+def columna_plegada(columna):
+    """Expresión de BD con la columna en minúsculas y sin tildes."""
+    expresion = F(columna)
+    for con_tilde, sin_tilde in TILDES.items():
+        expresion = Replace(expresion, Value(con_tilde), Value(sin_tilde))
+    return Lower(expresion)
+
+
+def buscar_personas(texto, limite=50, solo_vigentes=True):
+    """
+    Ids de personas cuyo nombre, apellidos o apodo contienen palabras que
+    empiezan por las del texto ("gonzalez mar"), de mayor a menor relevancia.
+    """
+    palabras = plegar(texto).split()
+    if not palabras:
+        return []
+    if fts_disponible():
+        pesos = ', '.join(str(peso) for _, peso in COLUMNAS_FTS)
+        sql = (
+            "SELECT persona_fts.rowid FROM persona_fts "
+            "JOIN persona ON persona.per_id = persona_fts.rowid "
+            "WHERE persona_fts MATCH %s"
+            + (" AND persona.per_vigente" if solo_vigentes else "")
+            + f" ORDER BY bm25(persona_fts, {pesos}) LIMIT %s"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [_consulta_fts(palabras), limite])
+            return [fila[0] for fila in cursor.fetchall()]
+
+    personas = Persona.objects.vigentes() if solo_vigentes else Persona.objects.all()
+    personas = personas.alias(**{f'{columna}_plegada': columna_plegada(columna) for columna, _ in COLUMNAS_FTS})
+    for palabra in palabras:
+        condicion = Q()
+        for columna, _ in COLUMNAS_FTS:
+            condicion |= Q(**{f'{columna}_plegada__contains': palabra})
+        personas = personas.filter(condicion)
+    return list(personas.order_by('per_apelpat', 'per_nombres', 'per_id').values_list('per_id', flat=True)[:limite])
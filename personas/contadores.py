@@ -0,0 +1,107 @@
+"""
+Contadores de miembros vigentes por grupo, distrito y zona.
+
+La tabla contador_miembros guarda una fila por nodo de la jerarquía scout con
+la cantidad de membresías vigentes (persona_grupo.peg_vigente) bajo él. Los
+signals de PersonaGrupo la ajustan con UPDATE ... SET cnm_cantidad =
+cnm_cantidad + n en la misma transacción del cambio; las operaciones masivas
+(bulk_create/bulk_update, que no emiten signals) deben llamar a
+ajustar_contadores. Si la tabla se desvía, recalcular_contadores la rehace en
+una sola pasada.
+"""
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F
+
+from maestros.models import Grupo
+from personas.models import ContadorMiembros, PersonaGrupo
+
+NIVEL_GRUPO = 'grupo'
+NIVEL_DISTRITO = 'distrito'
+NIVEL_ZONA = 'zona'
+NIVELES = (NIVEL_GRUPO, NIVEL_DISTRITO, NIVEL_ZONA)
+
+
+def _por_nodo(cantidades_por_grupo, ancestros):
+    """{gru_id: n} -> {(nivel, nodo): n} sumando hacia el distrito y la zona."""
+    totales = Counter()
+    for gru_id, cantidad in cantidades_por_grupo.items():
+        dis_id, zon_id = ancestros[gru_id]
+        totales[(NIVEL_GRUPO, gru_id)] += cantidad
+        totales[(NIVEL_DISTRITO, dis_id)] += cantidad
+        totales[(NIVEL_ZONA, zon_id)] += cantidad
+    return totales
+
+
+def _ancestros(gru_ids=None):
+    grupos = Grupo.objects.all() if gru_ids is None else Grupo.objects.filter(gru_id__in=gru_ids)
+    return {gru_id: (dis_id, zon_id) for gru_id, dis_id, zon_id in grupos.values_list('gru_id', 'dis_id', 'dis_id__zon_id')}
+
+
+@transaction.atomic
+def ajustar_contadores(deltas_por_grupo):
+    """
+    Suma a los contadores los cambios {gru_id: +n/-n} de membresías vigentes,
+    propagándolos al distrito y la zona del grupo.
+    """
+    deltas_por_grupo = {gru_id: delta for gru_id, delta in deltas_por_grupo.items() if delta}
+    if not deltas_por_grupo:
+        return
+    ancestros = _ancestros(deltas_por_grupo)
+    deltas = _por_nodo({g: d for g, d in deltas_por_grupo.items() if g in ancestros}, ancestros)
+    ContadorMiembros.objects.bulk_create(
+        [ContadorMiembros(cnm_nivel=nivel, cnm_nodo=nodo) for nivel, nodo in deltas],
+        ignore_conflicts=True,
+    )
+    # Un UPDATE por nivel y valor del delta (en un alta: tres, uno por nivel)
+    nodos_por_cambio = defaultdict(list)
+    for (nivel, nodo), delta in deltas.items():
+        if delta:
+            nodos_por_cambio[(nivel, delta)].append(nodo)
+    for (nivel, delta), nodos in nodos_por_cambio.items():
+        ContadorMiembros.objects.filter(cnm_nivel=nivel, cnm_nodo__in=nodos).update(cnm_cantidad=F('cnm_cantidad') + delta)
+
+
+def _reemplazar(niveles, totales):
+    ContadorMiembros.objects.filter(cnm_nivel__in=niveles).delete()
+    ContadorMiembros.objects.bulk_create(
+        [ContadorMiembros(cnm_nivel=nivel, cnm_nodo=nodo, cnm_cantidad=cantidad) for (nivel, nodo), cantidad in totales.items()],
+        batch_size=500,
+    )
+
+
+@transaction.atomic
+def recalcular_contadores():
+    """Rehace todos los contadores desde persona_grupo con una sola consulta agregada."""
+    cantidades = dict(
+        PersonaGrupo.objects.vigentes().order_by().values_list('gru_id').annotate(cantidad=Count('peg_id'))
+    )
+    ancestros = _ancestros()
+    totales = _por_nodo(cantidades, ancestros)
+    # Los nodos sin miembros también tienen contador (en cero)
+    for gru_id, (dis_id, zon_id) in ancestros.items():
+        for clave in ((NIVEL_GRUPO, gru_id), (NIVEL_DISTRITO, dis_id), (NIVEL_ZONA, zon_id)):
+            totales.setdefault(clave, 0)
+    _reemplazar(NIVELES, totales)
+    return totales
+
+
+@transaction.atomic
+def recalcular_superiores():
+    """
+    Rehace los contadores de distritos y zonas sumando los de sus grupos; se
+    usa cuando un grupo cambia de distrito o un distrito de zona. O(grupos).
+    """
+    cantidades = dict(ContadorMiembros.objects.filter(cnm_nivel=NIVEL_GRUPO).values_list('cnm_nodo', 'cnm_cantidad'))
+    ancestros = _ancestros()
+    totales = _por_nodo({g: cantidades.get(g, 0) for g in ancestros}, ancestros)
+    _reemplazar((NIVEL_DISTRITO, NIVEL_ZONA), {clave: n for clave, n in totales.items() if clave[0] != NIVEL_GRUPO})
+
+
+def miembros(nivel, nodos=None):
+    """{nodo: miembros vigentes} del nivel, para todos los nodos o los indicados."""
+    contadores = ContadorMiembros.objects.filter(cnm_nivel=nivel)
+    if nodos is not None:
+        contadores = contadores.filter(cnm_nodo__in=nodos)
+    return dict(contadores.values_list('cnm_nodo', 'cnm_cantidad'))
@@ -0,0 +1,173 @@
+"""
+Detección y fusión de personas duplicadas.
+
+buscar_duplicados lee las personas una sola vez (solo las columnas que
+compara), las agrupa por claves de bloqueo y puntúa únicamente los pares que
+comparten un bloque; nunca compara todos contra todos. fusionar_personas
+traspasa a la persona conservada todas las filas que apuntan a los
+duplicados (cualquier FK a Persona, descubierta desde el modelo) y borra los
+duplicados, todo en una transacción. Si una fila del duplicado choca con una
+de la persona conservada (ej. ambas inscritas en la misma sección), antes de
+borrarla se traspasan a la conservada las filas que dependen de ella
+(comprobantes, historial de estados); si alguna tampoco se puede traspasar,
+la fusión se rechaza.
+"""
+from collections import defaultdict
+from itertools import combinations
+
+from django.db import transaction
+from django.dispatch import Signal
+
+from maestros.managers import campo_vigente
+from personas.models import Persona, PersonaNivelMaximo
+from personas.niveles import recalcular_niveles
+from personas.similitud import claves_bloqueo, puntaje, registro
+
+# Puntaje mínimo: ej. RUN con un dígito errado, mismo nombre y misma fecha de nacimiento (0.68)
+UMBRAL_DUPLICADO = 0.65
+
+# Bloques más grandes se descartan (ej. un email genérico compartido por cientos de personas)
+MAXIMO_BLOQUE = 50
+
+# Tablas derivadas de persona que se recalculan tras fusionar en lugar de traspasarse
+MODELOS_DERIVADOS = (PersonaNivelMaximo,)
+
+# Se emite tras juntar filas que chocaban (sender: el modelo; conservadas: sus pk), para que
+# otras apps rehagan lo que derivan de las filas dependientes traspasadas
+filas_fusionadas = Signal()
+
+
+class FusionRechazada(ValueError):
+    """Una fila del duplicado no se puede traspasar sin perder datos."""
+
+
+def registros_personas():
+    campos = ('per_id', 'per_run', 'per_apelpat', 'per_apelmat', 'per_nombres', 'per_fecha_nac', 'per_email')
+    for per_id, run, apelpat, apelmat, nombres, fecha_nac, email in (
+        Persona.objects.order_by().values_list(*campos).iterator(chunk_size=5000)
+    ):
+        yield registro(per_id, run, apelpat, apelmat, nombres, fecha_nac.date() if fecha_nac else None, email)
+
+
+def buscar_duplicados(umbral=UMBRAL_DUPLICADO, maximo_bloque=MAXIMO_BLOQUE):
+    """
+    Pares candidatos [(per_id_a, per_id_b, puntaje, claves)] con puntaje >=
+    umbral, del más al menos probable. claves nombra los bloques compartidos.
+    """
+    registros = {}
+    bloques = defaultdict(list)
+    for reg in registros_personas():
+        registros[reg.per_id] = reg
+        for clave in claves_bloqueo(reg):
+            bloques[clave].append(reg.per_id)
+
+    motivos = defaultdict(set)
+    for clave, ids in bloques.items():
+        if 1 < len(ids) <= maximo_bloque:
+            for par in combinations(sorted(ids), 2):
+                motivos[par].add(clave[0])
+
+    candidatos = []
+    for (a, b), claves in motivos.items():
+        valor = puntaje(registros[a], registros[b])
+        if valor >= umbral:
+            candidatos.append((a, b, valor, sorted(claves)))
+    candidatos.sort(key=lambda c: (-c[2], c[0], c[1]))
+    return candidatos
+
+
+def _relaciones(modelo=Persona):
+    """(modelo, campo FK) de cada tabla que apunta al modelo (por defecto, a Persona)."""
+    for relacion in modelo._meta.related_objects:
+        if relacion.related_model in MODELOS_DERIVADOS or relacion.many_to_many:
+            continue
+        yield relacion.related_model, relacion.field
+
+
+def _conjuntos_unicos(modelo, campo):
+    """Conjuntos de campos únicos del modelo que incluyen el FK (sin contarlo)."""
+    conjuntos = [tuple(c) for c in modelo._meta.unique_together]
+    conjuntos += [tuple(r.fields) for r in modelo._meta.total_unique_constraints]
+    conjuntos += [tuple(r.fields) for r in modelo._meta.constraints if getattr(r, 'condition', None) is not None and r.fields]
+    if campo.unique:
+        conjuntos.append((campo.name,))
+    for conjunto in conjuntos:
+        if campo.name in conjunto:
+            yield [modelo._meta.get_field(nombre).attname for nombre in conjunto if nombre != campo.name]
+
+
+def _traspasar(modelo, campo, conservar_id, duplicado_id, dependiente=False):
+    """
+    Pasa las filas del modelo que apuntan a duplicado_id (por campo) a
+    conservar_id. Con dependiente (filas de otra fila que se está juntando)
+    no se acepta ningún choque.
+    """
+    filas = modelo._default_manager.filter(**{campo.attname: duplicado_id})
+    colisiones = set()
+    for otros in _conjuntos_unicos(modelo, campo):
+        propias = {
+            tuple(fila[1:]): fila[0]
+            for fila in modelo._default_manager.filter(**{campo.attname: conservar_id}).values_list('pk', *otros)
+        }
+        for pk, *clave in filas.values_list('pk', *otros):
+            clave = tuple(clave)
+            # Los NULL no chocan en un índice único
+            if None not in clave and clave in propias:
+                colisiones.add((pk, propias[clave]))
+    if colisiones and dependiente:
+        raise FusionRechazada(
+            f"{modelo._meta.db_table}: las filas {sorted(pk for pk, _ in colisiones)} chocan con las de "
+            f"{campo.related_model._meta.db_table} {conservar_id}"
+        )
+    vigente = campo_vigente(modelo) if colisiones and hasattr(modelo._default_manager, 'vigentes') else None
+    for pk_duplicada, pk_propia in colisiones:
+        # Lo que cuelga de la fila que se borra (comprobantes, estados) pasa a la que queda
+        for dependiente_modelo, dependiente_campo in _relaciones(modelo):
+            _traspasar(dependiente_modelo, dependiente_campo, pk_propia, pk_duplicada, dependiente=True)
+        # Se conserva la fila de la persona que queda; si solo la del duplicado estaba vigente, se reactiva
+        if vigente and modelo._default_manager.filter(pk=pk_duplicada, **{vigente: True}).exists():
+            propia = modelo._default_manager.get(pk=pk_propia)
+            if not getattr(propia, vigente):
+                setattr(propia, vigente, True)
+                propia.save(update_fields=[vigente])
+    if colisiones:
+        modelo._default_manager.filter(pk__in=[pk for pk, _ in colisiones]).delete()
+        filas_fusionadas.send(sender=modelo, conservadas=sorted({pk for _, pk in colisiones}))
+    return filas.update(**{campo.attname: conservar_id})
+
+
+def _completar_datos(conservada, duplicada):
+    """Copia a la persona conservada los datos que le faltan y el duplicado sí tiene."""
+    cambios = []
+    for campo in Persona._meta.concrete_fields:
+        if campo.primary_key or campo.attname in ('per_run', 'per_dv'):
+            continue
+        if getattr(conservada, campo.attname) in (None, '') and getattr(duplicada, campo.attname) not in (None, ''):
+            setattr(conservada, campo.attname, getattr(duplicada, campo.attname))
+            cambios.append(campo.attname)
+    return cambios
+
+
+@transaction.atomic
+def fusionar_personas(conservar_id, duplicado_ids):
+    """
+    Fusiona los duplicados en la persona conservar_id. Las filas que
+    chocarían con una restricción única (ej. la misma membresía de grupo) se
+    quedan con la de la persona conservada, que recibe sus dependientes.
+    Lanza FusionRechazada si un dependiente tampoco cabe (no se borra nada).
+    Devuelve {tabla: filas traspasadas}.
+    """
+    duplicado_ids = [pk for pk in dict.fromkeys(duplicado_ids) if pk != conservar_id]
+    personas = Persona.objects.con_detalle().select_for_update().in_bulk([conservar_id, *duplicado_ids])
+    conservada = personas[conservar_id]
+    traspasadas = defaultdict(int)
+    cambios = set()
+    for duplicado_id in duplicado_ids:
+        for modelo, campo in _relaciones():
+            traspasadas[modelo._meta.db_table] += _traspasar(modelo, campo, conservar_id, duplicado_id)
+        cambios.update(_completar_datos(conservada, personas[duplicado_id]))
+    Persona.objects.filter(pk__in=duplicado_ids).delete()
+    if cambios:
+        conservada.save(update_fields=sorted(cambios))
+    recalcular_niveles([conservar_id])
+    return dict(traspasadas)
@@ -0,0 +1,97 @@
+"""
+Exportación de nóminas a CSV o XLSX con memoria constante.
+
+Las filas llegan de un generador que recorre la BD con iterator(chunk_size),
+de modo que nunca se materializa el queryset completo. El CSV se escribe fila
+a fila en un StreamingHttpResponse; el XLSX usa el modo de solo escritura de
+openpyxl, que vuelca cada fila a un archivo temporal en disco.
+"""
+import csv
+import datetime
+import tempfile
+
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils import timezone
+
+from personas.run import formatear_run
+
+# Filas que se leen de la BD por viaje
+TAMANO_BLOQUE = 2000
+
+FORMATOS_EXPORTACION = ('csv', 'xlsx')
+
+ENCABEZADO_MIEMBROS = ('Grupo', 'RUN', 'Apellido paterno', 'Apellido materno', 'Nombres', 'Email', 'Teléfono', 'Comuna', 'Fecha de nacimiento')
+
+
+class _Eco:
+    """Pseudo-archivo para csv.writer: devuelve la línea en lugar de guardarla."""
+
+    def write(self, valor):
+        return valor
+
+
+def _fecha(valor):
+    if isinstance(valor, datetime.datetime):
+        return timezone.localtime(valor).date() if timezone.is_aware(valor) else valor.date()
+    return valor
+
+
+def _lineas_csv(encabezado, filas):
+    escritor = csv.writer(_Eco())
+    # BOM para que Excel abra el archivo como UTF-8
+    yield '\ufeff' + escritor.writerow(encabezado)
+    for fila in filas:
+        yield escritor.writerow(fila)
+
+
+def respuesta_csv(nombre, encabezado, filas):
+    respuesta = StreamingHttpResponse(_lineas_csv(encabezado, filas), content_type='text/csv; charset=utf-8')
+    respuesta['Content-Disposition'] = f'attachment; filename="{nombre}.csv"'
+    return respuesta
+
+
+def respuesta_xlsx(nombre, encabezado, filas):
+    try:
+        from openpyxl import Workbook
+    except ImportError as exc:
+        raise ImportError("Exportar XLSX requiere el paquete openpyxl") from exc
+    libro = Workbook(write_only=True)
+    hoja = libro.create_sheet(nombre[:31])
+    hoja.append(encabezado)
+    for fila in filas:
+        hoja.append(fila)
+    archivo = tempfile.TemporaryFile()
+    libro.save(archivo)
+    archivo.seek(0)
+    return FileResponse(
+        archivo, as_attachment=True, filename=f'{nombre}.xlsx',
+        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    )
+
+
+def respuesta_exportacion(formato, nombre, encabezado, filas):
+    if formato == 'xlsx':
+        return respuesta_xlsx(nombre, encabezado, filas)
+    return respuesta_csv(nombre, encabezado, filas)
+
+
+def filas_miembros(membresias):
+    """Una fila por membresía (queryset de PersonaGrupo), leyendo solo las columnas exportadas."""
+    membresias = membresias.select_related('per_id__com_id', 'gru_id').only(
+        'gru_id__gru_descripcion', 'per_id__per_run', 'per_id__per_dv', 'per_id__per_apelpat',
+        'per_id__per_apelmat', 'per_id__per_nombres', 'per_id__per_email', 'per_id__per_fono',
+        'per_id__per_fecha_nac', 'per_id__com_id__com_descripcion',
+    )
+    for membresia in membresias.iterator(chunk_size=TAMANO_BLOQUE):
+        persona = membresia.per_id
+        yield (
+            membresia.gru_id.gru_descripcion,
+            formatear_run(persona.per_run, persona.per_dv),
+            persona.per_apelpat,
+            persona.per_apelmat or '',
+            persona.per_nombres,
+            persona.per_email,
+            persona.per_fono,
+            persona.com_id.com_descripcion,
+            _fecha(persona.per_fecha_nac),
+        )
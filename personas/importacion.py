@@ -0,0 +1,272 @@
+"""
+Importación masiva de nóminas de personas desde CSV o XLSX.
+
+El archivo se recorre fila a fila y se procesa en lotes: cada lote consulta
+una sola vez los RUN ya registrados, crea o actualiza las personas con
+bulk_create/bulk_update y agrega las membresías de grupo que falten. Comuna,
+estado civil y grupo se resuelven desde la caché de catálogos, de modo que la
+memoria usada depende del tamaño del lote y no del archivo.
+"""
+import csv
+import datetime
+import re
+from collections import Counter
+from pathlib import Path
+
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+from django.utils import timezone
+
+from maestros.catalogo import listar_vigentes
+from maestros.models import Comuna, EstadoCivil, Grupo
+from maestros.texto import plegar
+from personas.contadores import ajustar_contadores
+from personas.models import Persona, PersonaGrupo
+from personas.run import RunInvalido, normalizar_run
+
+# Columnas obligatorias del encabezado (sin tildes ni mayúsculas). Opcionales: apelmat,
+# apodo, tipo_fono, grupo, profesion, religion, nom_emergencia, fono_emergencia
+COLUMNAS_OBLIGATORIAS = ('run', 'nombres', 'apelpat', 'email', 'fecha_nac', 'direccion', 'fono', 'comuna', 'estado_civil')
+
+# Campos de Persona que una nueva importación puede sobrescribir en personas existentes
+CAMPOS_ACTUALIZABLES = (
+    'per_nombres', 'per_apelpat', 'per_apelmat', 'per_email', 'per_fecha_nac', 'per_direccion',
+    'per_tipo_fono', 'per_fono', 'per_apodo', 'com_id', 'esc_id', 'per_profesion', 'per_religion',
+    'per_nom_emergencia', 'per_fono_emergencia', 'per_vigente',
+)
+
+FORMATOS_FECHA = ('%d-%m-%Y', '%d/%m/%Y', '%Y-%m-%d', '%d.%m.%Y')
+
+
+class FilaInvalida(ValueError):
+    """Una fila de la nómina no se puede importar; el mensaje va al reporte."""
+
+
+def leer_filas(ruta):
+    """Genera un dict por fila del archivo, con las claves del encabezado normalizadas."""
+    ruta = Path(ruta)
+    extension = ruta.suffix.lower()
+    if extension == '.csv':
+        with ruta.open(newline='', encoding='utf-8-sig') as archivo:
+            muestra = archivo.read(4096)
+            archivo.seek(0)
+            try:
+                dialecto = csv.Sniffer().sniff(muestra, delimiters=',;\t')
+            except csv.Error:
+                # Sin separador reconocible (una sola columna o archivo vacío): coma por defecto
+                dialecto = csv.excel
+            lector = csv.reader(archivo, dialecto)
+            encabezado = [plegar(c).replace(' ', '_') for c in next(lector, [])]
+            for valores in lector:
+                yield dict(zip(encabezado, valores))
+    elif extension == '.xlsx':
+        try:
+            from openpyxl import load_workbook
+        except ImportError as exc:
+            raise ImportError("Importar XLSX requiere el paquete openpyxl") from exc
+        libro = load_workbook(ruta, read_only=True, data_only=True)
+        try:
+            filas = libro.active.iter_rows(values_only=True)
+            encabezado = [plegar(c).replace(' ', '_') for c in next(filas, ())]
+            for valores in filas:
+                if any(v not in (None, '') for v in valores):
+                    yield dict(zip(encabezado, valores))
+        finally:
+            libro.close()
+    else:
+        raise ValueError(f"Formato no soportado: {extension} (use .csv o .xlsx)")
+
+
+def _texto(valor):
+    return ' '.join(str(valor).split()) if valor is not None else ''
+
+
+def normalizar_email(valor):
+    email = _texto(valor).lower()
+    try:
+        validate_email(email)
+    except ValidationError:
+        raise FilaInvalida(f"email inválido: {valor!r}")
+    return email
+
+
+def normalizar_fono(valor):
+    """Solo dígitos, sin el prefijo de país 56: '+56 9 1234 5678' -> '912345678'."""
+    digitos = re.sub(r'\D', '', _texto(valor))
+    if digitos.startswith('56') and len(digitos) == 11:
+        digitos = digitos[2:]
+    if not 8 <= len(digitos) <= 9:
+        raise FilaInvalida(f"teléfono inválido: {valor!r}")
+    return digitos
+
+
+def normalizar_fecha(valor):
+    if isinstance(valor, datetime.datetime):
+        fecha = valor.date()
+    elif isinstance(valor, datetime.date):
+        fecha = valor
+    else:
+        texto = _texto(valor)
+        for formato in FORMATOS_FECHA:
+            try:
+                fecha = datetime.datetime.strptime(texto, formato).date()
+                break
+            except ValueError:
+                continue
+        else:
+            raise FilaInvalida(f"fecha de nacimiento inválida: {valor!r}")
+    return timezone.make_aware(datetime.datetime.combine(fecha, datetime.time()))
+
+
+def mapa_catalogo(modelo, campo):
+    """Descripción plegada -> id, para las filas vigentes del catálogo."""
+    return {plegar(getattr(fila, campo)): fila[0] for fila in listar_vigentes(modelo)}
+
+
+class ImportadorPersonas:
+    """
+    Importa una nómina. Uso:
+
+        importador = ImportadorPersonas(usuario, reporte=archivo_csv)
+        resumen = importador.importar('nomina.xlsx')
+    """
+
+    def __init__(self, usuario, reporte=None, tamano_lote=500):
+        self.usuario = usuario
+        self.tamano_lote = tamano_lote
+        self.reporte = csv.writer(reporte) if reporte is not None else None
+        if self.reporte:
+            self.reporte.writerow(['fila', 'run', 'error'])
+        self.comunas = mapa_catalogo(Comuna, 'com_descripcion')
+        self.estados_civiles = mapa_catalogo(EstadoCivil, 'esc_descripcion')
+        self.grupos = mapa_catalogo(Grupo, 'gru_descripcion')
+        self.resumen = {'filas': 0, 'creadas': 0, 'actualizadas': 0, 'sin_cambios': 0, 'membresias': 0, 'errores': 0}
+
+    def importar(self, ruta):
+        lote = {}
+        for numero, fila in enumerate(leer_filas(ruta), start=2):
+            self.resumen['filas'] += 1
+            try:
+                datos = self.normalizar(fila)
+            except FilaInvalida as error:
+                self.registrar_error(numero, fila.get('run'), str(error))
+                continue
+            # Un RUN repetido en el mismo lote: gana la última fila
+            lote[datos['per_run']] = datos
+            if len(lote) >= self.tamano_lote:
+                self.guardar_lote(lote)
+                lote = {}
+        if lote:
+            self.guardar_lote(lote)
+        return self.resumen
+
+    def registrar_error(self, numero, run, mensaje):
+        self.resumen['errores'] += 1
+        if self.reporte:
+            self.reporte.writerow([numero, _texto(run), mensaje])
+
+    def _resolver(self, mapa, fila, columna, obligatorio=True):
+        valor = plegar(fila.get(columna))
+        if not valor:
+            if obligatorio:
+                raise FilaInvalida(f"falta {columna}")
+            return None
+        if valor not in mapa:
+            raise FilaInvalida(f"{columna} desconocido: {fila.get(columna)!r}")
+        return mapa[valor]
+
+    def normalizar(self, fila):
+        faltantes = [c for c in COLUMNAS_OBLIGATORIAS if not _texto(fila.get(c))]
+        if faltantes:
+            raise FilaInvalida(f"faltan columnas: {', '.join(faltantes)}")
+        try:
+            run, dv = normalizar_run(fila['run'])
+        except RunInvalido as error:
+            raise FilaInvalida(str(error))
+        try:
+            tipo_fono = int(fila.get('tipo_fono') or 2)
+        except (TypeError, ValueError):
+            raise FilaInvalida(f"tipo_fono inválido: {fila.get('tipo_fono')!r}")
+        fono_emergencia = _texto(fila.get('fono_emergencia'))
+        return {
+            'per_run': run,
+            'per_dv': dv,
+            'per_nombres': _texto(fila['nombres'])[:50],
+            'per_apelpat': _texto(fila['apelpat'])[:50],
+            'per_apelmat': _texto(fila.get('apelmat'))[:50] or None,
+            'per_email': normalizar_email(fila['email']),
+            'per_fecha_nac': normalizar_fecha(fila['fecha_nac']),
+            'per_direccion': _texto(fila['direccion'])[:255],
+            'per_tipo_fono': tipo_fono,
+            'per_fono': normalizar_fono(fila['fono']),
+            'per_apodo': _texto(fila.get('apodo'))[:50],
+            'per_profesion': _texto(fila.get('profesion'))[:100] or None,
+            'per_religion': _texto(fila.get('religion'))[:50] or None,
+            'per_nom_emergencia': _texto(fila.get('nom_emergencia'))[:50] or None,
+            'per_fono_emergencia': normalizar_fono(fono_emergencia) if fono_emergencia else None,
+            'com_id_id': self._resolver(self.comunas, fila, 'comuna'),
+            'esc_id_id': self._resolver(self.estados_civiles, fila, 'estado_civil'),
+            'gru_id': self._resolver(self.grupos, fila, 'grupo', obligatorio=False),
+        }
+
+    @transaction.atomic
+    def guardar_lote(self, lote):
+        ahora = timezone.now()
+        # con_detalle: only() sobre el manager por defecto dejaría diferidas las columnas de detalle
+        existentes = {
+            persona.per_run: persona
+            for persona in Persona.objects.con_detalle().filter(per_run__in=list(lote))
+            .only('per_id', 'per_run', 'per_dv', *CAMPOS_ACTUALIZABLES)
+        }
+        por_crear, por_actualizar, importadas, grupos_por_run = [], {}, [], {}
+        for run, datos in lote.items():
+            gru_id = datos.pop('gru_id')
+            if gru_id:
+                grupos_por_run[run] = gru_id
+            datos['per_vigente'] = True
+            persona = existentes.get(run)
+            if persona is None:
+                persona = Persona(usu_id=self.usuario, per_fecha_hora=ahora, **datos)
+                por_crear.append(persona)
+            elif cambios := tuple(c for c, v in datos.items() if getattr(persona, c) != v):
+                # Solo se reescriben las personas cuyos datos cambiaron, y solo esos campos
+                for campo in cambios:
+                    setattr(persona, campo, datos[campo])
+                persona.per_fecha_hora = ahora
+                por_actualizar.setdefault(cambios, []).append(persona)
+            else:
+                self.resumen['sin_cambios'] += 1
+            importadas.append(persona)
+        Persona.objects.bulk_create(por_crear, batch_size=self.tamano_lote)
+        # bulk_update arma un CASE por campo: se agrupa por conjunto de campos modificados
+        for cambios, personas in por_actualizar.items():
+            campos = [Persona._meta.get_field(c).name for c in cambios] + ['per_fecha_hora']
+            Persona.objects.bulk_update(personas, campos, batch_size=self.tamano_lote)
+            self.resumen['actualizadas'] += len(personas)
+        self.resumen['creadas'] += len(por_crear)
+
+        if grupos_por_run:
+            self.guardar_membresias({
+                (persona.per_id, grupos_por_run[persona.per_run])
+                for persona in importadas if persona.per_run in grupos_por_run
+            })
+
+    def guardar_membresias(self, pares):
+        """Crea las membresías (per_id, gru_id) que falten y reactiva las no vigentes."""
+        actuales = {
+            (m.per_id_id, m.gru_id_id): m
+            for m in PersonaGrupo.objects.filter(per_id__in={per_id for per_id, _ in pares})
+        }
+        nuevas = [
+            PersonaGrupo(per_id_id=per_id, gru_id_id=gru_id, peg_vigente=True)
+            for per_id, gru_id in pares if (per_id, gru_id) not in actuales
+        ]
+        reactivadas = [actuales[par] for par in pares if par in actuales and not actuales[par].peg_vigente]
+        for membresia in reactivadas:
+            membresia.peg_vigente = True
+        PersonaGrupo.objects.bulk_create(nuevas, batch_size=self.tamano_lote)
+        PersonaGrupo.objects.bulk_update(reactivadas, ['peg_vigente'], batch_size=self.tamano_lote)
+        # bulk_create/bulk_update no emiten signals: los contadores se ajustan aquí
+        ajustar_contadores(Counter(m.gru_id_id for m in nuevas + reactivadas))
+        self.resumen['membresias'] += len(nuevas) + len(reactivadas)
@@ -0,0 +1,31 @@
+import csv
+import sys
+
+from django.core.management.base import BaseCommand
+
+from personas.duplicados import MAXIMO_BLOQUE, UMBRAL_DUPLICADO, buscar_duplicados
+
+
+class Command(BaseCommand):
+    help = (
+        "Busca personas posiblemente duplicadas comparando solo las que comparten RUN, "
+        "apellido y fecha de nacimiento, o email. Escribe un CSV con los pares y su puntaje."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--umbral', type=float, default=UMBRAL_DUPLICADO, help="Puntaje mínimo (0 a 1)")
+        parser.add_argument('--maximo-bloque', type=int, default=MAXIMO_BLOQUE, help="Descarta claves compartidas por más personas")
+        parser.add_argument('--salida', help="Archivo CSV de salida (por defecto, stdout)")
+
+    def handle(self, *args, **options):
+        candidatos = buscar_duplicados(options['umbral'], options['maximo_bloque'])
+        salida = open(options['salida'], 'w', newline='', encoding='utf-8') if options['salida'] else sys.stdout
+        try:
+            escritor = csv.writer(salida)
+            escritor.writerow(['per_id_a', 'per_id_b', 'puntaje', 'claves'])
+            for a, b, valor, claves in candidatos:
+                escritor.writerow([a, b, valor, ' '.join(claves)])
+        finally:
+            if salida is not sys.stdout:
+                salida.close()
+        self.stderr.write(self.style.SUCCESS(f"{len(candidatos)} pares candidatos"))
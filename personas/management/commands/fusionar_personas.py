@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from personas.duplicados import FusionRechazada, fusionar_personas
+from personas.models import Persona
+
+
+class Command(BaseCommand):
+    help = "Fusiona personas duplicadas en una: traspasa inscripciones, pagos, membresías, etc. y borra los duplicados."
+
+    def add_arguments(self, parser):
+        parser.add_argument('conservar', type=int, help="per_id de la persona que se conserva")
+        parser.add_argument('duplicados', type=int, nargs='+', help="per_id de los duplicados")
+
+    def handle(self, *args, **options):
+        ids = [options['conservar'], *options['duplicados']]
+        faltantes = set(ids) - set(Persona.objects.filter(pk__in=ids).values_list('pk', flat=True))
+        if faltantes:
+            raise CommandError(f"No existen las personas {sorted(faltantes)}")
+        try:
+            traspasadas = fusionar_personas(options['conservar'], options['duplicados'])
+        except FusionRechazada as error:
+            raise CommandError(f"No se fusionó: {error}")
+        for tabla, cantidad in sorted(traspasadas.items()):
+            if cantidad:
+                self.stdout.write(f"{tabla}: {cantidad}")
+        self.stdout.write(self.style.SUCCESS(f"Fusionadas {len(options['duplicados'])} personas en {options['conservar']}"))
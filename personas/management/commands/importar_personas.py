@@ -0,0 +1,42 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from personas.importacion import COLUMNAS_OBLIGATORIAS, ImportadorPersonas
+from usuarios.models import Usuario
+
+
+class Command(BaseCommand):
+    help = (
+        "Importa una nómina de personas (CSV o XLSX) con sus membresías de grupo. "
+        f"Columnas obligatorias: {', '.join(COLUMNAS_OBLIGATORIAS)}."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('archivo')
+        parser.add_argument('--usuario', required=True, help="usu_username de quien registra la importación")
+        parser.add_argument('--reporte', help="CSV donde escribir los errores por fila (por defecto, stderr)")
+        parser.add_argument('--lote', type=int, default=500, help="Filas por lote")
+
+    def handle(self, *args, **options):
+        try:
+            usuario = Usuario.objects.get(usu_username=options['usuario'])
+        except Usuario.DoesNotExist:
+            raise CommandError(f"No existe el usuario {options['usuario']}")
+
+        reporte = open(options['reporte'], 'w', newline='', encoding='utf-8') if options['reporte'] else sys.stderr
+        try:
+            importador = ImportadorPersonas(usuario, reporte=reporte, tamano_lote=options['lote'])
+            resumen = importador.importar(options['archivo'])
+        except (ValueError, ImportError, OSError) as error:
+            raise CommandError(str(error))
+        finally:
+            if reporte is not sys.stderr:
+                reporte.close()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{resumen['filas']} filas: {resumen['creadas']} personas creadas, "
+            f"{resumen['actualizadas']} actualizadas, {resumen['sin_cambios']} sin cambios, "
+            f"{resumen['membresias']} membresías, "
+            f"{resumen['errores']} errores"
+        ))
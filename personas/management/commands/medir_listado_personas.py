@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+
+from personas.models import Persona
+from personas.views import ORDEN_LISTADO
+
+
+def campos_leidos(queryset):
+    """Nombres (attname) de las columnas que el queryset trae de la BD."""
+    # deferred_loading: (nombres, True) para defer(); (nombres, False) para only()
+    nombres, es_defer = queryset.query.deferred_loading
+    campos = []
+    for campo in Persona._meta.concrete_fields:
+        mencionado = campo.name in nombres or campo.attname in nombres
+        if (not mencionado) if es_defer else (mencionado or campo.primary_key):
+            campos.append(campo.attname)
+    return campos
+
+
+def bytes_por_pagina(queryset, tamano):
+    """Bytes de datos que devuelve la BD para una página de tamano filas."""
+    campos = campos_leidos(queryset)
+    total = 0
+    for fila in queryset.order_by(*ORDEN_LISTADO).values_list(*campos)[:tamano]:
+        total += sum(len(str(valor).encode('utf-8')) for valor in fila if valor is not None)
+    return len(campos), total
+
+
+class Command(BaseCommand):
+    help = "Compara los bytes leídos por página de personas con y sin las columnas de detalle."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tamano', type=int, default=50, help="Filas por página")
+
+    def handle(self, *args, **options):
+        tamano = options['tamano']
+        columnas_antes, antes = bytes_por_pagina(Persona.objects.con_detalle(), tamano)
+        columnas_despues, despues = bytes_por_pagina(Persona.objects.all(), tamano)
+        ahorro = 100 * (antes - despues) / antes if antes else 0
+        self.stdout.write(f"Página de {tamano} personas:")
+        self.stdout.write(f"  con detalle: {columnas_antes} columnas, {antes} bytes")
+        self.stdout.write(f"  por defecto: {columnas_despues} columnas, {despues} bytes ({ahorro:.1f}% menos)")
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from personas.contadores import NIVELES, recalcular_contadores
+
+
+class Command(BaseCommand):
+    help = "Recalcula en una sola pasada los contadores de miembros vigentes por grupo, distrito y zona."
+
+    def handle(self, *args, **options):
+        totales = recalcular_contadores()
+        for nivel in NIVELES:
+            nodos = [cantidad for (n, _), cantidad in totales.items() if n == nivel]
+            self.stdout.write(f"{nivel}: {len(nodos)} nodos, {sum(nodos)} miembros")
+        self.stdout.write(self.style.SUCCESS("Contadores recalculados"))
@@ -0,0 +1,35 @@
+from django.db import models
+
+from maestros.managers import VigenteQuerySet
+
+# Columnas pesadas o de uso puntual (ficha médica, foto, contacto de emergencia)
+# que los listados no muestran; el manager por defecto no las lee
+COLUMNAS_DETALLE = (
+    'per_alergia_enfermedad',
+    'per_limitacion',
+    'per_otros',
+    'per_foto',
+    'per_direccion',
+    'per_nom_emergencia',
+    'per_fono_emergencia',
+)
+
+
+class PersonaQuerySet(VigenteQuerySet):
+
+    def con_detalle(self):
+        """Incluye las columnas de COLUMNAS_DETALLE (fichas, exportaciones completas)."""
+        return self.defer(None)
+
+
+class PersonaManager(models.Manager.from_queryset(PersonaQuerySet)):
+    """
+    Manager por defecto de Persona: difiere COLUMNAS_DETALLE. Leer una de ellas
+    en una instancia cuesta una consulta extra; para varias filas o varias
+    columnas use Persona.objects.con_detalle() o persona.cargar_detalle().
+    only() no deshace el defer: para leer columnas de detalle con only() parta
+    de con_detalle().
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().defer(*COLUMNAS_DETALLE)
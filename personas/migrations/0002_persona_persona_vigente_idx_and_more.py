@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-18 03:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("maestros", "0004_grupojerarquia"),
+        ("personas", "0001_initial"),
+        ("usuarios", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="persona",
+            index=models.Index(
+                condition=models.Q(("per_vigente", True)),
+                fields=["per_apelpat", "per_nombres"],
+                name="persona_vigente_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="personagrupo",
+            index=models.Index(
+                condition=models.Q(("peg_vigente", True)),
+                fields=["gru_id", "per_id"],
+                name="persona_grupo_vigente_idx",
+            ),
+        ),
+    ]
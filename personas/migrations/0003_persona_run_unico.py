@@ -0,0 +1,47 @@
+# Generated by Django 5.2.7 on 2026-10-18 03:26
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Upper
+
+
+def verificar_runs(apps, schema_editor):
+    Persona = apps.get_model("personas", "Persona")
+    # 'k' y 'K' son el mismo dígito: se comparan ya normalizados
+    repetidos = list(
+        Persona.objects.annotate(dv=Upper("per_dv"))
+        .values_list("per_run", "dv")
+        .annotate(n=Count("pk"))
+        .filter(n__gt=1)
+        .order_by("per_run")
+    )
+    if repetidos:
+        raise RuntimeError(
+            "Hay RUN repetidos en persona; fusione o corrija esas personas antes de migrar: "
+            + ", ".join(f"{run}-{dv}" for run, dv, _ in repetidos[:20])
+        )
+
+
+def normalizar_dv(apps, schema_editor):
+    Persona = apps.get_model("personas", "Persona")
+    Persona.objects.filter(per_dv="k").update(per_dv="K")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("maestros", "0004_grupojerarquia"),
+        ("personas", "0002_persona_persona_vigente_idx_and_more"),
+        ("usuarios", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(verificar_runs, migrations.RunPython.noop),
+        migrations.RunPython(normalizar_dv, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="persona",
+            constraint=models.UniqueConstraint(
+                fields=("per_run", "per_dv"), name="persona_run_unico"
+            ),
+        ),
+    ]
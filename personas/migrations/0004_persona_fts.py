@@ -0,0 +1,60 @@
+from django.db import migrations
+
+# SQL de personas.busqueda al crear la migración: la migración no importa código
+# de la aplicación, que puede cambiar después
+SQL_TABLA_FTS = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS persona_fts USING fts5("
+    "per_apelpat, per_nombres, per_apelmat, per_apodo, "
+    "content='persona', content_rowid='per_id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+)
+
+SQL_TRIGGERS_FTS = (
+    "CREATE TRIGGER IF NOT EXISTS persona_fts_ai AFTER INSERT ON persona BEGIN "
+    "INSERT INTO persona_fts(rowid, per_apelpat, per_nombres, per_apelmat, per_apodo) "
+    "VALUES (new.per_id, new.per_apelpat, new.per_nombres, new.per_apelmat, new.per_apodo); END",
+    "CREATE TRIGGER IF NOT EXISTS persona_fts_ad AFTER DELETE ON persona BEGIN "
+    "INSERT INTO persona_fts(persona_fts, rowid, per_apelpat, per_nombres, per_apelmat, per_apodo) "
+    "VALUES ('delete', old.per_id, old.per_apelpat, old.per_nombres, old.per_apelmat, old.per_apodo); END",
+    "CREATE TRIGGER IF NOT EXISTS persona_fts_au "
+    "AFTER UPDATE OF per_apelpat, per_nombres, per_apelmat, per_apodo ON persona BEGIN "
+    "INSERT INTO persona_fts(persona_fts, rowid, per_apelpat, per_nombres, per_apelmat, per_apodo) "
+    "VALUES ('delete', old.per_id, old.per_apelpat, old.per_nombres, old.per_apelmat, old.per_apodo); "
+    "INSERT INTO persona_fts(rowid, per_apelpat, per_nombres, per_apelmat, per_apodo) "
+    "VALUES (new.per_id, new.per_apelpat, new.per_nombres, new.per_apelmat, new.per_apodo); END",
+)
+
+
+def crear_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT count(*) FROM pragma_compile_options "
+            "WHERE compile_options = 'ENABLE_FTS5'"
+        )
+        if not cursor.fetchone()[0]:
+            return
+    schema_editor.execute(SQL_TABLA_FTS)
+    for sql in SQL_TRIGGERS_FTS:
+        schema_editor.execute(sql)
+    schema_editor.execute("INSERT INTO persona_fts(persona_fts) VALUES ('rebuild')")
+
+
+def eliminar_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for trigger in ("persona_fts_ai", "persona_fts_ad", "persona_fts_au"):
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    schema_editor.execute("DROP TABLE IF EXISTS persona_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("personas", "0003_persona_run_unico"),
+    ]
+
+    operations = [
+        migrations.RunPython(crear_fts, eliminar_fts),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.7 on 2026-10-18 03:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("maestros", "0004_grupojerarquia"),
+        ("personas", "0004_persona_fts"),
+        ("usuarios", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="persona",
+            name="persona_vigente_idx",
+        ),
+        migrations.AddIndex(
+            model_name="persona",
+            index=models.Index(
+                fields=["per_apelpat", "per_nombres", "per_id"],
+                name="persona_orden_idx",
+            ),
+        ),
+    ]
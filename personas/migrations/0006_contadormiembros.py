@@ -0,0 +1,60 @@
+# Generated by Django 5.2.7 on 2026-10-18 03:41
+
+from collections import Counter
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def poblar_contadores(apps, schema_editor):
+    Grupo = apps.get_model("maestros", "Grupo")
+    PersonaGrupo = apps.get_model("personas", "PersonaGrupo")
+    ContadorMiembros = apps.get_model("personas", "ContadorMiembros")
+    cantidades = dict(
+        PersonaGrupo.objects.filter(peg_vigente=True)
+        .order_by()
+        .values_list("gru_id")
+        .annotate(cantidad=Count("peg_id"))
+    )
+    totales = Counter()
+    for gru_id, dis_id, zon_id in Grupo.objects.values_list(
+        "gru_id", "dis_id", "dis_id__zon_id"
+    ):
+        cantidad = cantidades.get(gru_id, 0)
+        totales[("grupo", gru_id)] += cantidad
+        totales[("distrito", dis_id)] += cantidad
+        totales[("zona", zon_id)] += cantidad
+    ContadorMiembros.objects.bulk_create(
+        [
+            ContadorMiembros(cnm_nivel=nivel, cnm_nodo=nodo, cnm_cantidad=cantidad)
+            for (nivel, nodo), cantidad in totales.items()
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("maestros", "0004_grupojerarquia"),
+        ("personas", "0005_persona_orden_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContadorMiembros",
+            fields=[
+                ("cnm_id", models.AutoField(primary_key=True, serialize=False)),
+                ("cnm_nivel", models.CharField(max_length=10)),
+                ("cnm_nodo", models.IntegerField()),
+                ("cnm_cantidad", models.IntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Contador de Miembros",
+                "verbose_name_plural": "Contadores de Miembros",
+                "db_table": "contador_miembros",
+                "unique_together": {("cnm_nivel", "cnm_nodo")},
+            },
+        ),
+        migrations.RunPython(poblar_contadores, migrations.RunPython.noop),
+    ]
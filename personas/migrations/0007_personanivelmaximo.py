@@ -0,0 +1,84 @@
+# Generated by Django 5.2.7 on 2026-10-18 03:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def poblar_niveles_maximos(apps, schema_editor):
+    PersonaNivel = apps.get_model("personas", "PersonaNivel")
+    PersonaNivelMaximo = apps.get_model("personas", "PersonaNivelMaximo")
+    # Mismo criterio que personas.niveles.calcular_maximos: mayor orden, ante empate el menor niv_id
+    maximos = {}
+    for per_id, ram_id, niv_id, orden in PersonaNivel.objects.values_list(
+        "per_id", "ram_id", "niv_id", "niv_id__niv_orden"
+    ).iterator():
+        actual = maximos.get((per_id, ram_id))
+        if actual is None or (orden, -niv_id) > (actual[1], -actual[0]):
+            maximos[(per_id, ram_id)] = (niv_id, orden)
+    PersonaNivelMaximo.objects.bulk_create(
+        [
+            PersonaNivelMaximo(
+                per_id_id=per_id, ram_id_id=ram_id, niv_id_id=niv_id, pnm_orden=orden
+            )
+            for (per_id, ram_id), (niv_id, orden) in maximos.items()
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("maestros", "0004_grupojerarquia"),
+        ("personas", "0006_contadormiembros"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PersonaNivelMaximo",
+            fields=[
+                ("pnm_id", models.AutoField(primary_key=True, serialize=False)),
+                ("pnm_orden", models.IntegerField()),
+                (
+                    "niv_id",
+                    models.ForeignKey(
+                        db_column="niv_id",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="maestros.nivel",
+                    ),
+                ),
+                (
+                    "per_id",
+                    models.ForeignKey(
+                        db_column="per_id",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="niveles_maximos",
+                        to="personas.persona",
+                    ),
+                ),
+                (
+                    "ram_id",
+                    models.ForeignKey(
+                        db_column="ram_id",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="maestros.rama",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Nivel Máximo de Persona",
+                "verbose_name_plural": "Niveles Máximos de Personas",
+                "db_table": "persona_nivel_maximo",
+                "indexes": [
+                    models.Index(
+                        fields=["ram_id", "pnm_orden"],
+                        name="persona_nivel_max_rama_idx",
+                    )
+                ],
+                "unique_together": {("per_id", "ram_id")},
+            },
+        ),
+        migrations.RunPython(poblar_niveles_maximos, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,6 @@
 from django.db import models
+from maestros.managers import VigenteManager
+from personas.managers import COLUMNAS_DETALLE, PersonaManager
 from maestros.models import Region, Provincia, Comuna, Zona, Distrito, Grupo, EstadoCivil, Cargo, Nivel, Rama, Rol # Importar modelos maestros
 from usuarios.models import Usuario # Importar Usuario
 
@@ -61,14 +63,38 @@ class Persona(models.Model):
     # per_vigente: Indica si la persona está activa (True) o inactiva (False)
     per_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes(); difiere las columnas de detalle
+    objects = PersonaManager()
+
     class Meta:
         db_table = 'persona'
         verbose_name = 'Persona'
         verbose_name_plural = 'Personas'
+        indexes = [
+            # Listados ordenados por apellido (paginación por cursor), vigentes o no: per_vigente se filtra al recorrerlo
+            models.Index(fields=['per_apelpat', 'per_nombres', 'per_id'], name='persona_orden_idx'),
+        ]
+        constraints = [
+            # Un RUN identifica a una sola persona; el índice resuelve las búsquedas por RUN
+            models.UniqueConstraint(fields=['per_run', 'per_dv'], name='persona_run_unico'),
+        ]
 
     def __str__(self):
         return f"{self.per_nombres} {self.per_apelpat}"
 
+    def save(self, *args, **kwargs):
+        # El dígito verificador se guarda en mayúscula: 'k' y 'K' no deben pasar la restricción de RUN único
+        if self.per_dv:
+            self.per_dv = self.per_dv.upper()
+        super().save(*args, **kwargs)
+
+    def cargar_detalle(self):
+        # Carga en una sola consulta las columnas de detalle diferidas por el manager
+        diferidas = self.get_deferred_fields().intersection(COLUMNAS_DETALLE)
+        if diferidas:
+            self.refresh_from_db(fields=diferidas)
+        return self
+
 # Tabla: persona_grupo
 class PersonaGrupo(models.Model):
     # peg_id: Identificador único de la relación (clave primaria)
@@ -80,15 +106,42 @@ class PersonaGrupo(models.Model):
     # peg_vigente: Indica si la relación está activa (True) o inactiva (False)
     peg_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'persona_grupo'
         verbose_name = 'Persona en Grupo'
         verbose_name_plural = 'Personas en Grupos'
         unique_together = ('gru_id', 'per_id') # Asegura que una persona pertenezca a un grupo solo una vez
+        indexes = [
+            # Índice parcial: miembros vigentes por grupo
+            models.Index(fields=['gru_id', 'per_id'], name='persona_grupo_vigente_idx', condition=models.Q(peg_vigente=True)),
+        ]
 
     def __str__(self):
         return f"{self.per_id} en {self.gru_id}"
 
+# Tabla: contador_miembros
+class ContadorMiembros(models.Model):
+    # cnm_id: Identificador único del contador (clave primaria)
+    cnm_id = models.AutoField(primary_key=True)
+    # cnm_nivel: Nivel de la jerarquía scout ('grupo', 'distrito' o 'zona')
+    cnm_nivel = models.CharField(max_length=10)
+    # cnm_nodo: Id del grupo, distrito o zona según cnm_nivel
+    cnm_nodo = models.IntegerField()
+    # cnm_cantidad: Membresías vigentes (persona_grupo.peg_vigente) bajo el nodo
+    cnm_cantidad = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'contador_miembros'
+        verbose_name = 'Contador de Miembros'
+        verbose_name_plural = 'Contadores de Miembros'
+        unique_together = ('cnm_nivel', 'cnm_nodo') # Un contador por nodo
+
+    def __str__(self):
+        return f"{self.cnm_nivel} {self.cnm_nodo}: {self.cnm_cantidad}"
+
 # Tabla: persona_nivel
 class PersonaNivel(models.Model):
     # pen_id: Identificador único de la relación (clave primaria)
@@ -109,6 +162,32 @@ class PersonaNivel(models.Model):
     def __str__(self):
         return f"{self.per_id} - {self.niv_id} ({self.ram_id})"
 
+# Tabla: persona_nivel_maximo
+class PersonaNivelMaximo(models.Model):
+    # pnm_id: Identificador único del resumen (clave primaria)
+    pnm_id = models.AutoField(primary_key=True)
+    # per_id: Clave foránea a Persona (relación ManyToOne)
+    per_id = models.ForeignKey(Persona, on_delete=models.CASCADE, db_column='per_id', related_name='niveles_maximos')
+    # ram_id: Clave foránea a Rama (relación ManyToOne)
+    ram_id = models.ForeignKey(Rama, on_delete=models.CASCADE, db_column='ram_id', related_name='+')
+    # niv_id: Nivel más alto de la persona en la rama (relación ManyToOne)
+    niv_id = models.ForeignKey(Nivel, on_delete=models.CASCADE, db_column='niv_id', related_name='+')
+    # pnm_orden: niv_orden del nivel más alto (copiado para filtrar y ordenar sin unir nivel)
+    pnm_orden = models.IntegerField()
+
+    class Meta:
+        db_table = 'persona_nivel_maximo'
+        verbose_name = 'Nivel Máximo de Persona'
+        verbose_name_plural = 'Niveles Máximos de Personas'
+        unique_together = ('per_id', 'ram_id') # Una fila por persona y rama
+        indexes = [
+            # Elegibilidad: personas con nivel >= X en una rama
+            models.Index(fields=['ram_id', 'pnm_orden'], name='persona_nivel_max_rama_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.per_id} - {self.ram_id}: {self.niv_id}"
+
 # Tabla: persona_formador
 class PersonaFormador(models.Model):
     # pef_id: Identificador único de la relación (clave primaria)
@@ -121,7 +200,7 @@ class PersonaFormador(models.Model):
     pef_hab_2 = models.BooleanField()
     # pef_verif: Indicador de verificación (booleano)
     pef_verif = models.BooleanField()
-    # pef_historial: Historial de capacitaciones de la persona
+    # pef_historial: Historial de capacitaciones en texto libre (histórico; el historial estructurado está en cursos.HistorialFormador)
     pef_historial = models.TextField(null=True, blank=True)
 
     class Meta:
@@ -147,6 +226,9 @@ class PersonaIndividual(models.Model):
     # pei_vigente: Indica si la relación está activa (True) o inactiva (False)
     pei_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'persona_individual'
         verbose_name = 'Persona Individual'
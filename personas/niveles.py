@@ -0,0 +1,74 @@
+"""
+Nivel más alto de cada persona por rama.
+
+persona_nivel_maximo resume persona_nivel unido a nivel.niv_orden: una fila
+por (persona, rama) con el nivel de mayor orden. Se rehace por persona en cada
+alta, cambio o baja de PersonaNivel y, para todas las personas afectadas,
+cuando cambia el niv_orden de un Nivel. Las consultas de elegibilidad y
+ubicación leen el resumen en una sola consulta, sin importar cuántas personas
+se evalúen.
+"""
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+
+from personas.models import PersonaNivel, PersonaNivelMaximo
+
+
+def calcular_maximos(niveles):
+    """
+    [(per_id, ram_id, niv_id, niv_orden)] -> {(per_id, ram_id): (niv_id, niv_orden)}
+    con el nivel de mayor orden; ante empate gana el menor niv_id.
+    """
+    maximos = {}
+    for per_id, ram_id, niv_id, orden in niveles:
+        actual = maximos.get((per_id, ram_id))
+        if actual is None or (orden, -niv_id) > (actual[1], -actual[0]):
+            maximos[(per_id, ram_id)] = (niv_id, orden)
+    return maximos
+
+
+@transaction.atomic
+def recalcular_niveles(per_ids=None):
+    """
+    Rehace el resumen de las personas indicadas (ids o subconsulta de per_id),
+    o de todas si per_ids es None. Una consulta de lectura por llamada.
+    """
+    niveles = PersonaNivel.objects.all()
+    existentes = PersonaNivelMaximo.objects.all()
+    if per_ids is not None:
+        niveles = niveles.filter(per_id__in=per_ids)
+        existentes = existentes.filter(per_id__in=per_ids)
+    maximos = calcular_maximos(niveles.values_list('per_id', 'ram_id', 'niv_id', 'niv_id__niv_orden').iterator())
+    existentes.delete()
+    PersonaNivelMaximo.objects.bulk_create(
+        [
+            PersonaNivelMaximo(per_id_id=per_id, ram_id_id=ram_id, niv_id_id=niv_id, pnm_orden=orden)
+            for (per_id, ram_id), (niv_id, orden) in maximos.items()
+        ],
+        batch_size=500,
+    )
+    return len(maximos)
+
+
+def niveles_maximos(per_ids, ram_id=None):
+    """
+    {per_id: {ram_id: niv_orden}} para muchas personas en una consulta.
+    per_ids puede ser una subconsulta (ej. los per_id inscritos en un curso),
+    así la ubicación de todo un curso se resuelve sin iterar participantes.
+    """
+    resumen = PersonaNivelMaximo.objects.filter(per_id__in=per_ids)
+    if ram_id is not None:
+        resumen = resumen.filter(ram_id=ram_id)
+    resultado = defaultdict(dict)
+    for per_id, rama, orden in resumen.values_list('per_id', 'ram_id', 'pnm_orden').iterator():
+        resultado[per_id][rama] = orden
+    return dict(resultado)
+
+
+def anotar_nivel_maximo(queryset, ram_id, campo='per_id', nombre='nivel_maximo'):
+    """Anota en un queryset con FK a Persona (campo) el niv_orden máximo en la rama, o None."""
+    return queryset.annotate(**{nombre: Subquery(
+        PersonaNivelMaximo.objects.filter(per_id=OuterRef(campo), ram_id=ram_id).values('pnm_orden')[:1]
+    )})
@@ -0,0 +1,57 @@
+"""
+RUN chileno: normalización, cálculo y validación del dígito verificador (módulo 11).
+"""
+import re
+
+# Dígitos del RUN (con o sin puntos) seguidos opcionalmente de guion y dígito verificador
+_PATRON_RUN = re.compile(r'^(\d{1,3}(?:\.?\d{3})*)\s*-?\s*([\dkK])$')
+
+
+class RunInvalido(ValueError):
+    """El texto no es un RUN válido o su dígito verificador no corresponde."""
+
+
+def calcular_dv(run):
+    """Dígito verificador ('0'-'9' o 'K') del número de RUN."""
+    suma = 0
+    factor = 2
+    for digito in reversed(str(int(run))):
+        suma += int(digito) * factor
+        factor = 2 if factor == 7 else factor + 1
+    resto = 11 - suma % 11
+    if resto == 11:
+        return '0'
+    if resto == 10:
+        return 'K'
+    return str(resto)
+
+
+def normalizar_run(texto):
+    """
+    Convierte "12.345.678-5", "12345678-5" o "123456785" en (12345678, '5').
+
+    Lanza RunInvalido si el formato es incorrecto o el dígito verificador no
+    corresponde al número.
+    """
+    limpio = str(texto or '').strip()
+    coincidencia = _PATRON_RUN.match(limpio)
+    if not coincidencia:
+        raise RunInvalido(f"RUN con formato inválido: {texto!r}")
+    run = int(coincidencia.group(1).replace('.', ''))
+    dv = coincidencia.group(2).upper()
+    if run == 0 or calcular_dv(run) != dv:
+        raise RunInvalido(f"Dígito verificador incorrecto para el RUN {texto!r}")
+    return run, dv
+
+
+def es_run_valido(texto):
+    try:
+        normalizar_run(texto)
+    except RunInvalido:
+        return False
+    return True
+
+
+def formatear_run(run, dv):
+    """(12345678, '5') -> '12.345.678-5'."""
+    return f"{int(run):,}".replace(',', '.') + f"-{str(dv).upper()}"
@@ -0,0 +1,32 @@
+from personas.models import Persona
+from personas.run import RunInvalido, normalizar_run
+
+# Máximo de parámetros por IN (SQLite admite 999 variables por consulta)
+TAMANO_LOTE_IN = 900
+
+
+def ids_por_run(runs):
+    """
+    Resuelve un lote de RUN en texto ("12.345.678-5") a per_id.
+
+    Devuelve (encontrados, invalidos): encontrados mapea cada RUN válido a su
+    per_id, o a None si no está registrado; invalidos lista los textos que no
+    son RUN válidos. Hasta TAMANO_LOTE_IN RUN se resuelven en una consulta.
+    """
+    normalizados = {}
+    invalidos = []
+    for texto in runs:
+        try:
+            normalizados[texto] = normalizar_run(texto)
+        except RunInvalido:
+            invalidos.append(texto)
+
+    numeros = sorted({run for run, _ in normalizados.values()})
+    por_run = {}
+    for inicio in range(0, len(numeros), TAMANO_LOTE_IN):
+        lote = numeros[inicio:inicio + TAMANO_LOTE_IN]
+        for per_id, run, dv in Persona.objects.filter(per_run__in=lote).values_list('per_id', 'per_run', 'per_dv'):
+            por_run[(run, dv.upper())] = per_id
+
+    encontrados = {texto: por_run.get(clave) for texto, clave in normalizados.items()}
+    return encontrados, invalidos
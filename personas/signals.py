@@ -0,0 +1,80 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from maestros.jerarquia import jerarquia_scout_modificada
+from maestros.models import Grupo, Nivel
+from personas.contadores import NIVEL_GRUPO, ajustar_contadores, recalcular_superiores
+from personas.models import ContadorMiembros, PersonaGrupo, PersonaNivel
+from personas.niveles import recalcular_niveles
+
+
+@receiver(pre_save, sender=PersonaGrupo)
+def recordar_membresia(sender, instance, raw=False, **kwargs):
+    # Estado en la BD antes del cambio: (gru_id, peg_vigente), o None si es nueva
+    instance._membresia_previa = None
+    if not raw and not instance._state.adding and instance.pk is not None:
+        instance._membresia_previa = (
+            PersonaGrupo.objects.filter(pk=instance.pk).values_list('gru_id', 'peg_vigente').first()
+        )
+
+
+@receiver(post_save, sender=PersonaGrupo)
+def contar_membresia(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    deltas = {}
+    previa = getattr(instance, '_membresia_previa', None)
+    if previa and previa[1]:
+        deltas[previa[0]] = deltas.get(previa[0], 0) - 1
+    if instance.peg_vigente:
+        deltas[instance.gru_id_id] = deltas.get(instance.gru_id_id, 0) + 1
+    ajustar_contadores(deltas)
+
+
+@receiver(post_delete, sender=PersonaGrupo)
+def descontar_membresia(sender, instance, **kwargs):
+    if instance.peg_vigente:
+        ajustar_contadores({instance.gru_id_id: -1})
+
+
+@receiver(jerarquia_scout_modificada)
+def mover_contadores(sender, **kwargs):
+    # Un grupo que cambia de distrito (o un distrito de zona) mueve sus miembros hacia arriba
+    recalcular_superiores()
+
+
+@receiver(post_delete, sender=Grupo)
+def eliminar_contador_grupo(sender, instance, **kwargs):
+    ContadorMiembros.objects.filter(cnm_nivel=NIVEL_GRUPO, cnm_nodo=instance.pk).delete()
+    recalcular_superiores()
+
+
+@receiver(pre_save, sender=PersonaNivel)
+def recordar_persona_nivel(sender, instance, raw=False, **kwargs):
+    # Si la fila pasa a otra persona, también hay que rehacer el resumen de la anterior
+    instance._persona_previa = None
+    if not raw and not instance._state.adding and instance.pk is not None:
+        instance._persona_previa = PersonaNivel.objects.filter(pk=instance.pk).values_list('per_id', flat=True).first()
+
+
+@receiver(post_save, sender=PersonaNivel)
+@receiver(post_delete, sender=PersonaNivel)
+def resumir_niveles(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    per_ids = {instance.per_id_id, getattr(instance, '_persona_previa', None)} - {None}
+    recalcular_niveles(per_ids)
+
+
+@receiver(pre_save, sender=Nivel)
+def recordar_orden_nivel(sender, instance, raw=False, **kwargs):
+    instance._orden_previo = None
+    if not raw and not instance._state.adding and instance.pk is not None:
+        instance._orden_previo = Nivel.objects.filter(pk=instance.pk).values_list('niv_orden', flat=True).first()
+
+
+@receiver(post_save, sender=Nivel)
+def reordenar_niveles(sender, instance, created, raw=False, **kwargs):
+    # Cambiar el orden de un nivel puede cambiar el máximo de todas las personas que lo tienen
+    if not raw and not created and getattr(instance, '_orden_previo', None) != instance.niv_orden:
+        recalcular_niveles(PersonaNivel.objects.filter(niv_id=instance.pk).values('per_id'))
@@ -0,0 +1,78 @@
+"""
+Comparación de registros de personas para detectar duplicados, sin acceso a la BD.
+
+Cada persona se resume en un Registro con los datos ya normalizados. Los
+candidatos se forman por claves de bloqueo (mismo RUN, mismo apellido y
+fecha de nacimiento, mismo email), de modo que solo se comparan personas que
+comparten alguna clave; cada par recibe un puntaje entre 0 y 1.
+"""
+from collections import namedtuple
+from difflib import SequenceMatcher
+
+from maestros.texto import plegar
+
+# per_id, run (número), nombre completo plegado, apellido paterno plegado, fecha de nacimiento (date) y email
+Registro = namedtuple('Registro', 'per_id run nombre apelpat fecha_nac email')
+
+# Peso de cada criterio en el puntaje (suman 1)
+PESO_RUN = 0.3
+PESO_NOMBRE = 0.3
+PESO_FECHA = 0.2
+PESO_EMAIL = 0.2
+
+
+def registro(per_id, run, apelpat, apelmat, nombres, fecha_nac, email):
+    return Registro(
+        per_id=per_id,
+        run=run,
+        nombre=plegar(f"{nombres} {apelpat} {apelmat or ''}"),
+        apelpat=plegar(apelpat),
+        fecha_nac=fecha_nac,
+        email=(email or '').strip().lower(),
+    )
+
+
+def claves_bloqueo(reg):
+    """Claves que agrupan candidatos: dos personas solo se comparan si comparten alguna."""
+    claves = [('run', reg.run)]
+    if reg.apelpat and reg.fecha_nac:
+        claves.append(('apellido_nacimiento', reg.apelpat, reg.fecha_nac))
+    if reg.email:
+        claves.append(('email', reg.email))
+    return claves
+
+
+def similitud_run(a, b):
+    """1 si son iguales; 0.6 si difieren en un dígito o en dos dígitos vecinos transpuestos."""
+    if a == b:
+        return 1.0
+    a, b = str(a), str(b)
+    if len(a) != len(b):
+        return 0.0
+    diferencias = [i for i, (x, y) in enumerate(zip(a, b)) if x != y]
+    if len(diferencias) == 1:
+        return 0.6
+    if len(diferencias) == 2 and diferencias[1] == diferencias[0] + 1:
+        i = diferencias[0]
+        if a[i] == b[i + 1] and a[i + 1] == b[i]:
+            return 0.6
+    return 0.0
+
+
+def similitud_nombre(a, b):
+    """Parecido de los nombres completos, tolerante al orden de las palabras."""
+    if a == b:
+        return 1.0
+    directo = SequenceMatcher(None, a, b).ratio()
+    ordenado = SequenceMatcher(None, ' '.join(sorted(a.split())), ' '.join(sorted(b.split()))).ratio()
+    return max(directo, ordenado)
+
+
+def puntaje(a, b):
+    """Probabilidad aproximada (0 a 1) de que dos registros sean la misma persona."""
+    total = PESO_RUN * similitud_run(a.run, b.run) + PESO_NOMBRE * similitud_nombre(a.nombre, b.nombre)
+    if a.fecha_nac and a.fecha_nac == b.fecha_nac:
+        total += PESO_FECHA
+    if a.email and a.email == b.email:
+        total += PESO_EMAIL
+    return round(total, 4)
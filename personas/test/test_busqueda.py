@@ -0,0 +1,25 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from cursos.test.datos import DatosCurso
+from personas.busqueda import buscar_personas
+
+
+class BusquedaPersonasTests(DatosCurso, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.crear_maestros()
+        cls.munoz = cls.persona(2000000, per_apelpat='MUÑOZ', per_nombres='José Ángel')
+        cls.otra = cls.persona(2000001, per_apelpat='Muno', per_nombres='Ana')
+
+    def test_busqueda_sin_tildes_ni_mayusculas(self):
+        self.assertEqual(buscar_personas('munoz jose'), [self.munoz.pk])
+        self.assertEqual(buscar_personas('Muñoz ángel'), [self.munoz.pk])
+
+    def test_busqueda_sin_fts_tambien_pliega_tildes(self):
+        with mock.patch('personas.busqueda._fts_disponible', False):
+            self.assertEqual(buscar_personas('munoz jose'), [self.munoz.pk])
+            self.assertEqual(buscar_personas('MUÑOZ ANGEL'), [self.munoz.pk])
+            self.assertEqual(buscar_personas('muno'), [self.munoz.pk, self.otra.pk])
@@ -0,0 +1,100 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from cursos.test.datos import DatosCurso
+from maestros.models import Distrito, Grupo, Zona
+from personas.contadores import NIVEL_DISTRITO, NIVEL_GRUPO, NIVEL_ZONA, miembros, recalcular_superiores
+from personas.models import ContadorMiembros, PersonaGrupo
+
+
+class ContadoresTests(DatosCurso, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.distrito = cls.grupo.dis_id
+        cls.zona = cls.distrito.zon_id
+        cls.zona_sur = Zona.objects.create(zon_descripcion='Zona Sur', zon_unilateral=False, zon_vigente=True)
+        cls.distrito_sur = Distrito.objects.create(zon_id=cls.zona_sur, dis_descripcion='Distrito Sur', dis_vigente=True)
+        cls.grupo_sur = Grupo.objects.create(dis_id=cls.distrito_sur, gru_descripcion='Grupo Beta', gru_vigente=True)
+
+    def membresia(self, i, grupo=None, vigente=True):
+        return PersonaGrupo.objects.create(per_id=self.personas[i], gru_id=grupo or self.grupo, peg_vigente=vigente)
+
+    def verificar(self, grupo, distrito, zona, grupo_sur, distrito_sur, zona_sur):
+        # Un nodo que nunca tuvo miembros puede no tener fila: cuenta como cero
+        for nivel, nodos, esperado in (
+            (NIVEL_GRUPO, (self.grupo.pk, self.grupo_sur.pk), (grupo, grupo_sur)),
+            (NIVEL_DISTRITO, (self.distrito.pk, self.distrito_sur.pk), (distrito, distrito_sur)),
+            (NIVEL_ZONA, (self.zona.pk, self.zona_sur.pk), (zona, zona_sur)),
+        ):
+            cantidades = miembros(nivel, nodos)
+            self.assertEqual(tuple(cantidades.get(nodo, 0) for nodo in nodos), esperado, nivel)
+
+    def test_signals_ajustan_grupo_distrito_y_zona(self):
+        primera = self.membresia(0)
+        self.membresia(1)
+        self.membresia(2, vigente=False)
+        self.verificar(2, 2, 2, 0, 0, 0)
+
+        primera.peg_vigente = False
+        primera.save()
+        self.verificar(1, 1, 1, 0, 0, 0)
+
+        # Reactivar en otro grupo descuenta del anterior solo si estaba vigente
+        primera.peg_vigente = True
+        primera.gru_id = self.grupo_sur
+        primera.save()
+        self.verificar(1, 1, 1, 1, 1, 1)
+
+        primera.gru_id = self.grupo
+        primera.save()
+        self.verificar(2, 2, 2, 0, 0, 0)
+
+        primera.delete()
+        PersonaGrupo.objects.get(per_id=self.personas[2]).delete()
+        self.verificar(1, 1, 1, 0, 0, 0)
+
+    def test_mover_grupo_y_distrito_rehace_los_superiores(self):
+        self.membresia(0)
+        self.membresia(1)
+        self.membresia(2, grupo=self.grupo_sur)
+
+        self.grupo.dis_id = self.distrito_sur
+        self.grupo.save()
+        self.verificar(2, 0, 0, 1, 3, 3)
+
+        self.distrito_sur.zon_id = self.zona
+        self.distrito_sur.save()
+        self.verificar(2, 0, 3, 1, 3, 0)
+
+    def test_baja_de_grupo_elimina_su_contador(self):
+        self.membresia(0)
+        self.membresia(1, grupo=self.grupo_sur)
+        self.grupo_sur.delete()
+        self.assertEqual(miembros(NIVEL_GRUPO), {self.grupo.pk: 1})
+        self.assertEqual(miembros(NIVEL_DISTRITO).get(self.distrito.pk), 1)
+        self.assertEqual(miembros(NIVEL_DISTRITO).get(self.distrito_sur.pk, 0), 0)
+        self.assertEqual(miembros(NIVEL_ZONA).get(self.zona_sur.pk, 0), 0)
+
+    def test_recalcular_superiores_parte_de_los_grupos(self):
+        self.membresia(0)
+        self.membresia(1, grupo=self.grupo_sur)
+        ContadorMiembros.objects.exclude(cnm_nivel=NIVEL_GRUPO).update(cnm_cantidad=50)
+        recalcular_superiores()
+        self.verificar(1, 1, 1, 1, 1, 1)
+
+    def test_comando_repara_contadores_desviados(self):
+        self.membresia(0)
+        self.membresia(1)
+        self.membresia(2, grupo=self.grupo_sur)
+        ContadorMiembros.objects.filter(cnm_nivel=NIVEL_GRUPO).update(cnm_cantidad=99)
+        ContadorMiembros.objects.filter(cnm_nivel=NIVEL_ZONA, cnm_nodo=self.zona_sur.pk).delete()
+
+        salida = StringIO()
+        call_command('recalcular_contadores', stdout=salida)
+        self.verificar(2, 2, 2, 1, 1, 1)
+        self.assertIn('grupo: 2 nodos, 3 miembros', salida.getvalue())
+        self.assertIn('Contadores recalculados', salida.getvalue())
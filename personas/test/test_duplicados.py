@@ -0,0 +1,68 @@
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+
+from cursos.estados import INSCRITO
+from cursos.models import PersonaCurso, PersonaEstadoCurso
+from cursos.test.datos import DatosCurso
+from maestros.models import ConceptoContable, Nivel
+from pagos.models import ComprobantePago, PagoPersona
+from personas.duplicados import FusionRechazada, _relaciones, _traspasar, fusionar_personas
+from personas.models import Persona, PersonaGrupo, PersonaNivel, PersonaNivelMaximo
+
+
+class FusionPersonasTests(DatosCurso, TestCase):
+
+    def setUp(self):
+        self.conservada, self.duplicada = self.personas[:2]
+        self.inscripciones = [self.inscribir(0), self.inscribir(1)]
+        concepto = ConceptoContable.objects.create(coc_descripcion='Cuota', coc_vigente=True)
+        for inscripcion in self.inscripciones:
+            ComprobantePago.objects.create(
+                usu_id=self.usuario, pec_id=inscripcion, coc_id=concepto, cpa_fecha_hora=timezone.now(),
+                cpa_fecha=timezone.localdate(), cpa_valor=Decimal('1000'),
+            )
+            PagoPersona.objects.create(
+                per_id=inscripcion.per_id, cur_id=self.seccion.cur_id, usu_id=self.usuario,
+                pap_fecha_hora=timezone.now(), pap_tipo=1, pap_valor=Decimal('1000'),
+            )
+        # Solo la membresía del duplicado está vigente
+        PersonaGrupo.objects.create(per_id=self.conservada, gru_id=self.grupo, peg_vigente=False)
+        PersonaGrupo.objects.create(per_id=self.duplicada, gru_id=self.grupo, peg_vigente=True)
+        self.nivel = Nivel.objects.create(niv_descripcion='Avanzado', niv_orden=3, niv_vigente=True)
+        PersonaNivel.objects.create(per_id=self.duplicada, niv_id=self.nivel, ram_id=self.rama)
+        self.historial = PersonaEstadoCurso.objects.count()
+
+    def fusionar(self):
+        return fusionar_personas(self.conservada.pk, [self.duplicada.pk])
+
+    def test_todas_las_filas_pasan_a_la_persona_conservada(self):
+        self.fusionar()
+        self.assertFalse(Persona.objects.filter(pk=self.duplicada.pk).exists())
+        for modelo, campo in _relaciones():
+            self.assertFalse(modelo._default_manager.filter(**{campo.attname: self.duplicada.pk}).exists(), modelo)
+        membresia = PersonaGrupo.objects.get(per_id=self.conservada)
+        self.assertTrue(membresia.peg_vigente)
+        self.assertEqual(
+            list(PersonaNivelMaximo.objects.filter(per_id=self.conservada).values_list('ram_id', 'niv_id', 'pnm_orden')),
+            [(self.rama.pk, self.nivel.pk, 3)],
+        )
+
+    def test_inscripcion_repetida_conserva_pagos_e_historial(self):
+        self.fusionar()
+        inscripcion = PersonaCurso.objects.get(per_id=self.conservada, cus_id=self.seccion)
+        self.assertEqual(inscripcion.pk, self.inscripciones[0].pk)
+        self.assertEqual(inscripcion.pec_estado, INSCRITO)
+        # Los comprobantes y estados de la inscripción borrada cuelgan ahora de la que queda
+        self.assertEqual(ComprobantePago.objects.filter(pec_id=inscripcion).count(), 2)
+        self.assertEqual(PersonaEstadoCurso.objects.filter(pec_id=inscripcion).count(), self.historial)
+        self.assertEqual(PagoPersona.objects.filter(per_id=self.conservada).count(), 2)
+        # Dos inscripciones pasan a ser una: se devuelve un cupo
+        self.seccion.refresh_from_db()
+        self.assertEqual(self.seccion.cus_ocupados, 1)
+
+    def test_dependiente_que_choca_rechaza_la_fusion(self):
+        with self.assertRaises(FusionRechazada):
+            _traspasar(PersonaGrupo, PersonaGrupo._meta.get_field('per_id'), self.conservada.pk, self.duplicada.pk, dependiente=True)
+        self.assertEqual(PersonaGrupo.objects.filter(per_id=self.duplicada).count(), 1)
@@ -0,0 +1,85 @@
+import csv
+import io
+from types import SimpleNamespace
+from unittest import mock
+
+from django.http import FileResponse, Http404, StreamingHttpResponse
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+from openpyxl import load_workbook
+
+from cursos.test.datos import DatosCurso
+from maestros.models import Grupo
+from personas.exportacion import ENCABEZADO_MIEMBROS
+from personas.models import PersonaGrupo
+from personas.views import exportar_miembros
+
+
+def leer_csv(respuesta):
+    contenido = b''.join(respuesta.streaming_content).decode('utf-8')
+    # El BOM va solo al comienzo, para Excel
+    assert contenido.startswith('\ufeff')
+    return list(csv.reader(io.StringIO(contenido[1:])))
+
+
+def leer_xlsx(respuesta):
+    libro = load_workbook(io.BytesIO(b''.join(respuesta.streaming_content)), read_only=True)
+    return [list(fila) for fila in libro.active.iter_rows(values_only=True)]
+
+
+class ExportarMiembrosTests(DatosCurso, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.otro_grupo = Grupo.objects.create(dis_id=cls.grupo.dis_id, gru_descripcion='Grupo Beta', gru_vigente=True)
+        ana, luis, baja, ex = cls.personas
+        ana.per_apelpat, ana.per_nombres = 'Araya', 'Ana'
+        ana.save()
+        luis.per_apelpat, luis.per_apelmat, luis.per_nombres = 'Zúñiga', 'Muñoz', 'Luis'
+        luis.save()
+        baja.per_vigente = False
+        baja.save()
+        PersonaGrupo.objects.create(per_id=luis, gru_id=cls.grupo, peg_vigente=True)
+        PersonaGrupo.objects.create(per_id=ana, gru_id=cls.grupo, peg_vigente=True)
+        PersonaGrupo.objects.create(per_id=ana, gru_id=cls.otro_grupo, peg_vigente=True)
+        PersonaGrupo.objects.create(per_id=baja, gru_id=cls.grupo, peg_vigente=True)
+        PersonaGrupo.objects.create(per_id=ex, gru_id=cls.grupo, peg_vigente=False)
+
+    def exportar(self, formato, **parametros):
+        request = RequestFactory().get(f'/api/personas/exportar.{formato}', parametros)
+        request.user = SimpleNamespace(is_active=True, is_staff=True)
+        return exportar_miembros(request, formato)
+
+    def test_csv_en_streaming_con_miembros_vigentes(self):
+        respuesta = self.exportar('csv')
+        self.assertIsInstance(respuesta, StreamingHttpResponse)
+        self.assertEqual(respuesta['Content-Disposition'], 'attachment; filename="miembros.csv"')
+        filas = leer_csv(respuesta)
+        self.assertEqual(filas[0], list(ENCABEZADO_MIEMBROS))
+        hoy = timezone.localtime(self.personas[0].per_fecha_nac).date().isoformat()
+        self.assertEqual(filas[1:], [
+            ['Grupo Alfa', '2.000.000-0', 'Araya', '', 'Ana', 'jp@mail.cl', '912345678', 'Ñuñoa', hoy],
+            ['Grupo Alfa', '2.000.001-0', 'Zúñiga', 'Muñoz', 'Luis', 'jp@mail.cl', '912345678', 'Ñuñoa', hoy],
+            ['Grupo Beta', '2.000.000-0', 'Araya', '', 'Ana', 'jp@mail.cl', '912345678', 'Ñuñoa', hoy],
+        ])
+
+    def test_xlsx_se_abre_con_las_mismas_filas(self):
+        respuesta = self.exportar('xlsx', grupo=self.otro_grupo.pk)
+        self.assertIsInstance(respuesta, FileResponse)
+        self.assertIn('miembros.xlsx', respuesta['Content-Disposition'])
+        filas = leer_xlsx(respuesta)
+        self.assertEqual(filas[0], list(ENCABEZADO_MIEMBROS))
+        self.assertEqual([fila[:5] for fila in filas[1:]], [['Grupo Beta', '2.000.000-0', 'Araya', None, 'Ana']])
+
+    def test_filtro_por_distrito_y_lectura_por_bloques(self):
+        # Con bloques de una fila el resultado no cambia: iterator() recorre la BD por partes
+        with mock.patch('personas.exportacion.TAMANO_BLOQUE', 1):
+            filas = leer_csv(self.exportar('csv', distrito=self.grupo.dis_id_id))
+        self.assertEqual(len(filas), 4)
+        self.assertEqual(len(leer_csv(self.exportar('csv', zona=self.grupo.dis_id.zon_id_id + 100))), 1)
+
+    def test_formato_o_parametros_invalidos(self):
+        with self.assertRaises(Http404):
+            self.exportar('pdf')
+        self.assertEqual(self.exportar('csv', grupo='x').status_code, 400)
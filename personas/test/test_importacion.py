@@ -0,0 +1,15 @@
+from personas.importacion import leer_filas
+
+
+def test_leer_filas_detecta_el_separador(tmp_path):
+    ruta = tmp_path / 'nomina.csv'
+    ruta.write_text('RUN;Nombres\n11.111.111-1;Juan\n', encoding='utf-8')
+    assert list(leer_filas(ruta)) == [{'run': '11.111.111-1', 'nombres': 'Juan'}]
+
+
+def test_leer_filas_de_una_sola_columna(tmp_path):
+    ruta = tmp_path / 'nomina.csv'
+    ruta.write_text('RUN\n11.111.111-1\n', encoding='utf-8')
+    assert list(leer_filas(ruta)) == [{'run': '11.111.111-1'}]
+    ruta.write_text('', encoding='utf-8')
+    assert list(leer_filas(ruta)) == []
@@ -0,0 +1,22 @@
+import json
+from types import SimpleNamespace
+
+from django.test import RequestFactory, TestCase
+
+from personas.views import listar_personas
+
+
+class ListadoPersonasTests(TestCase):
+
+    def listar(self, **parametros):
+        request = RequestFactory().get('/api/personas/', parametros)
+        request.user = SimpleNamespace(is_active=True, is_staff=True)
+        return listar_personas(request)
+
+    def test_limite_no_positivo_usa_uno(self):
+        respuesta = self.listar(limite='-5')
+        self.assertEqual(respuesta.status_code, 200)
+        self.assertEqual(json.loads(respuesta.content), {'resultados': [], 'siguiente': None})
+
+    def test_limite_no_numerico(self):
+        self.assertEqual(self.listar(limite='x').status_code, 400)
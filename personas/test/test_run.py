@@ -0,0 +1,32 @@
+import pytest
+
+from personas.run import RunInvalido, calcular_dv, es_run_valido, formatear_run, normalizar_run
+
+
+def test_calcular_dv():
+    assert calcular_dv(12345678) == "5"
+    assert calcular_dv(11111111) == "1"
+    assert calcular_dv(10000013) == "K"
+    assert calcular_dv(6) == "K"
+
+
+def test_normalizar_run_acepta_formatos_habituales():
+    assert normalizar_run("12.345.678-5") == (12345678, "5")
+    assert normalizar_run("12345678-5") == (12345678, "5")
+    assert normalizar_run(" 123456785 ") == (12345678, "5")
+    assert normalizar_run("10.000.013-k") == (10000013, "K")
+
+
+def test_normalizar_run_rechaza_dv_incorrecto_y_formato():
+    with pytest.raises(RunInvalido):
+        normalizar_run("12.345.678-9")
+    with pytest.raises(RunInvalido):
+        normalizar_run("12,345,678-5")
+    with pytest.raises(RunInvalido):
+        normalizar_run("")
+    assert not es_run_valido("abc")
+
+
+def test_formatear_run():
+    assert formatear_run(12345678, "5") == "12.345.678-5"
+    assert formatear_run(10000013, "k") == "10.000.013-K"
@@ -0,0 +1,21 @@
+import datetime
+
+from personas.similitud import claves_bloqueo, puntaje, registro, similitud_run
+
+
+def test_similitud_run_tolera_un_error_de_digitacion():
+    assert similitud_run(12345678, 12345678) == 1.0
+    assert similitud_run(12345678, 12345778) == 0.6
+    assert similitud_run(12345678, 12346578) == 0.6
+    assert similitud_run(12345678, 87654321) == 0.0
+
+
+def test_puntaje_y_claves_de_duplicados():
+    nacimiento = datetime.date(1990, 5, 15)
+    a = registro(1, 12345678, "Pérez", "Soto", "Juan Andrés", nacimiento, "JP@mail.cl")
+    b = registro(2, 12345768, "Perez", "Soto", "Juan Andres", nacimiento, "jp@mail.cl ")
+    c = registro(3, 9876543, "González", None, "María", datetime.date(1985, 1, 1), "mg@mail.cl")
+    assert ('apellido_nacimiento', 'perez', nacimiento) in claves_bloqueo(a)
+    assert set(claves_bloqueo(a)) & set(claves_bloqueo(b))
+    assert puntaje(a, b) > 0.85
+    assert puntaje(a, c) < 0.3
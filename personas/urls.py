@@ -0,0 +1,10 @@
+from django.urls import path
+
+from personas import views
+
+app_name = 'personas'
+
+urlpatterns = [
+    path('', views.listar_personas, name='listado'),
+    path('exportar.<slug:formato>', views.exportar_miembros, name='exportar'),
+]
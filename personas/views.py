@@ -1,3 +1,134 @@
-from django.shortcuts import render
+from django.contrib.admin.views.decorators import staff_member_required
+from django.core import signing
+from django.db.models import Q
+from django.http import Http404, HttpResponseBadRequest, JsonResponse
+from django.views.decorators.http import require_safe
 
-# Create your views here.
+from maestros.catalogo import obtener_catalogo
+from maestros.jerarquia import subconsulta_grupos_distrito, subconsulta_grupos_zona
+from maestros.models import Comuna
+from personas.exportacion import ENCABEZADO_MIEMBROS, FORMATOS_EXPORTACION, filas_miembros, respuesta_exportacion
+from personas.models import Persona, PersonaGrupo
+from personas.run import formatear_run
+
+# Orden del listado; coincide con el índice persona_orden_idx
+ORDEN_LISTADO = ('per_apelpat', 'per_nombres', 'per_id')
+
+# Columnas que entrega el listado (las pesadas quedan fuera)
+COLUMNAS_LISTADO = ('per_id', 'per_run', 'per_dv', 'per_apelpat', 'per_apelmat', 'per_nombres', 'per_email', 'com_id', 'per_vigente')
+
+LISTADO_LIMITE = 50
+LISTADO_LIMITE_MAXIMO = 200
+
+_SAL_CURSOR = 'personas.listado'
+
+
+def codificar_cursor(fila):
+    """Cursor opaco (firmado) con la clave de orden de la última fila entregada."""
+    return signing.dumps([fila[campo] for campo in ORDEN_LISTADO], salt=_SAL_CURSOR, compress=True)
+
+
+def decodificar_cursor(cursor):
+    apelpat, nombres, per_id = signing.loads(cursor, salt=_SAL_CURSOR)
+    return apelpat, nombres, per_id
+
+
+def despues_de(apelpat, nombres, per_id):
+    """
+    (per_apelpat, per_nombres, per_id) > (apelpat, nombres, per_id), escrito con
+    la desigualdad inicial sobre per_apelpat para que la BD recorra el índice
+    desde la posición del cursor en lugar de saltar filas con OFFSET.
+    """
+    return Q(per_apelpat__gte=apelpat) & (
+        Q(per_apelpat__gt=apelpat)
+        | Q(per_nombres__gt=nombres)
+        | Q(per_nombres=nombres, per_id__gt=per_id)
+    )
+
+
+def _entero(request, nombre):
+    valor = request.GET.get(nombre)
+    return int(valor) if valor not in (None, '') else None
+
+
+def grupos_filtrados(request):
+    """Grupos pedidos con los parámetros grupo, distrito o zona (lista o subconsulta), o None."""
+    gru_id = _entero(request, 'grupo')
+    dis_id = _entero(request, 'distrito')
+    zon_id = _entero(request, 'zona')
+    if gru_id is not None:
+        return [gru_id]
+    if dis_id is not None:
+        return subconsulta_grupos_distrito(dis_id)
+    if zon_id is not None:
+        return subconsulta_grupos_zona(zon_id)
+    return None
+
+
+@staff_member_required
+@require_safe
+def listar_personas(request):
+    """
+    Listado paginado por cursor (keyset). Parámetros: grupo, distrito, zona,
+    vigente (1 por defecto, 0, o todos), limite y cursor (el 'siguiente' de la
+    página anterior). Cualquier página cuesta lo mismo que la primera.
+    """
+    try:
+        grupos = grupos_filtrados(request)
+        limite = max(1, min(_entero(request, 'limite') or LISTADO_LIMITE, LISTADO_LIMITE_MAXIMO))
+        posicion = decodificar_cursor(request.GET['cursor']) if request.GET.get('cursor') else None
+    except (ValueError, signing.BadSignature):
+        return HttpResponseBadRequest("Parámetros de listado inválidos")
+
+    personas = Persona.objects.all()
+    vigente = request.GET.get('vigente', '1')
+    if vigente == '1':
+        personas = personas.vigentes()
+    elif vigente == '0':
+        personas = personas.no_vigentes()
+
+    if grupos is not None:
+        miembros = PersonaGrupo.objects.vigentes().filter(gru_id__in=grupos).values('per_id')
+        personas = personas.filter(per_id__in=miembros)
+
+    if posicion:
+        personas = personas.filter(despues_de(*posicion))
+    filas = list(personas.order_by(*ORDEN_LISTADO).values(*COLUMNAS_LISTADO)[:limite + 1])
+
+    siguiente = codificar_cursor(filas[limite - 1]) if len(filas) > limite else None
+    comunas = obtener_catalogo(Comuna)
+    resultados = []
+    for fila in filas[:limite]:
+        comuna = comunas.get(fila['com_id'])
+        resultados.append({
+            'id': fila['per_id'],
+            'run': formatear_run(fila['per_run'], fila['per_dv']),
+            'nombres': fila['per_nombres'],
+            'apelpat': fila['per_apelpat'],
+            'apelmat': fila['per_apelmat'],
+            'email': fila['per_email'],
+            'comuna': comuna.com_descripcion if comuna else None,
+            'vigente': fila['per_vigente'],
+        })
+    return JsonResponse({'resultados': resultados, 'siguiente': siguiente})
+
+
+@staff_member_required
+@require_safe
+def exportar_miembros(request, formato):
+    """
+    Nómina de miembros vigentes (una fila por membresía) en CSV o XLSX, con
+    los mismos filtros grupo/distrito/zona del listado. La memoria usada no
+    depende de la cantidad de filas.
+    """
+    if formato not in FORMATOS_EXPORTACION:
+        raise Http404("Formato no soportado")
+    try:
+        grupos = grupos_filtrados(request)
+    except ValueError:
+        return HttpResponseBadRequest("Parámetros de exportación inválidos")
+    membresias = PersonaGrupo.objects.vigentes().filter(per_id__per_vigente=True)
+    if grupos is not None:
+        membresias = membresias.filter(gru_id__in=grupos)
+    membresias = membresias.order_by('gru_id', 'per_id__per_apelpat', 'per_id__per_nombres', 'per_id')
+    return respuesta_exportacion(formato, 'miembros', ENCABEZADO_MIEMBROS, filas_miembros(membresias))
@@ -1,4 +1,5 @@
 from django.db import models
+from maestros.managers import VigenteManager
 
 # Tabla: proveedor
 class Proveedor(models.Model):
@@ -17,6 +18,9 @@ class Proveedor(models.Model):
     # prv_vigente: Indica si el proveedor está activo (True) o inactivo (False)
     prv_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'proveedor'
         verbose_name = 'Proveedor'
@@ -1,4 +1,5 @@
 from django.test import TestCase
+from django.utils import timezone
 from unittest.mock import MagicMock
 
 # Mocking foreign key dependencies
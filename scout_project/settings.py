@@ -83,6 +83,9 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        # Las transacciones toman el bloqueo de escritura al empezar: con varios
+        # escritores concurrentes (ej. reservas de cupo) esperan en lugar de fallar
+        "OPTIONS": {"transaction_mode": "IMMEDIATE", "timeout": 20},
     }
 }
 
@@ -123,6 +126,10 @@ USE_TZ = True
 
 STATIC_URL = "static/"
 
+# Fotos subidas (Persona.per_foto, Usuario.usu_ruta_foto) y sus miniaturas
+MEDIA_URL = "media/"
+MEDIA_ROOT = BASE_DIR / "media"
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
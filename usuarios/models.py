@@ -1,4 +1,5 @@
 from django.db import models
+from maestros.managers import VigenteManager
 
 class Usuario(models.Model):
     # usu_id: Identificador único del usuario (clave primaria)
@@ -14,6 +15,9 @@ class Usuario(models.Model):
     # usu_vigente: Indica si el usuario está activo (True) o inactivo (False)
     usu_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'usuario' # Nombre de la tabla en la base de datos
         verbose_name = 'Usuario'
@@ -30,6 +34,9 @@ class Perfil(models.Model):
     # pel_vigente: Indica si el perfil está activo (True) o inactivo (False)
     pel_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'perfil' # Nombre de la tabla en la base de datos
         verbose_name = 'Perfil'
@@ -52,6 +59,9 @@ class Aplicacion(models.Model):
     # apl_vigente: Indica si la aplicación está activa (True) o inactiva (False)
     apl_vigente = models.BooleanField()
 
+    # objects: Manager por defecto con filtros vigentes()/no_vigentes()
+    objects = VigenteManager()
+
     class Meta:
         db_table = 'aplicacion'
         verbose_name = 'Aplicación'